@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import time
+from collections.abc import KeysView
 from collections.abc import Sequence
 from typing import Protocol
-from typing import cast
 
-from .models import GROUP_NAMES
+import orjson
+from mcp.types import TextContent
+
+from .models import GROUP_NAME_SET
 from .models import GroupName
 from .models import JsonValue
 from .models import ToolRecord
+from .models import ToolScore
 from .registry import build_registry
 from .registry import ToolDumpable
-from .registry import ToolProvider
 from .router import HierarchicalRouter
 
 
@@ -21,22 +25,48 @@ class BackendServer(Protocol):
     async def call_tool(self, name: str, arguments: dict[str, JsonValue]) -> object: ...
 
 
+DEFAULT_REGISTRY_TTL_SECONDS = 60.0
+
+
 class AgenticGateway:
-    def __init__(self, backend_server: BackendServer):
+    def __init__(
+        self,
+        backend_server: BackendServer,
+        registry_ttl: float = DEFAULT_REGISTRY_TTL_SECONDS,
+    ):
         self.backend_server: BackendServer = backend_server
+        self.registry_ttl = registry_ttl
         self.registry: list[ToolRecord] = []
+        self.registry_version = 0
+        self._registry_loaded_at = 0.0
+        self._registry_stale = True
+        self._records_by_id: dict[str, ToolRecord] = {}
+        self._records_by_name: dict[str, ToolRecord] = {}
         self._router: HierarchicalRouter | None = None
+        self._refresh_lock = asyncio.Lock()
 
     async def refresh_registry(self) -> dict[str, object]:
-        self.registry = await build_registry(cast(ToolProvider, self.backend_server))
-        self._router = HierarchicalRouter(self.registry)
+        async with self._refresh_lock:
+            return await self._rebuild_registry()
+
+    async def _rebuild_registry(self) -> dict[str, object]:
+        records = await build_registry(self.backend_server)
+        # The router indexes every record up front; keep it while the tools are unchanged.
+        if self._router is None or records != self.registry:
+            self.registry = records
+            self._records_by_id = {record.tool_id: record for record in records}
+            self._records_by_name = {record.name: record for record in records}
+            self._router = HierarchicalRouter(records)
+            self.registry_version += 1
+        self._registry_loaded_at = time.monotonic()
+        self._registry_stale = False
         return {
             "success": True,
             "count": len(self.registry),
         }
 
     async def tool_search(self, query: str, k: int = 8, group: str | None = None) -> dict[str, object]:
-        await self._ensure_registry()
+        await self.ensure_registry()
         assert self._router is not None
 
         selected_group = self._parse_group(group)
@@ -59,23 +89,16 @@ class AgenticGateway:
                 "confidence": route.confidence,
             }
 
-        records = [self._record_from_id(score.tool_id) for score in scores]
+        record_get = self._records_by_id.get
         results = [
-            {
-                "tool_id": record.tool_id,
-                "name": record.name,
-                "description": record.description,
-                "group": record.group,
-                "score": score.score,
-                "reason": score.reason,
-            }
-            for score, record in zip(scores, records, strict=True)
-            if record is not None
+            self._search_result(record, score)
+            for score in scores
+            if (record := record_get(score.tool_id)) is not None
         ]
         return {"success": True, "query": query, "route": group_route, "results": results}
 
     async def tool_describe(self, tool_id: str) -> dict[str, object]:
-        await self._ensure_registry()
+        await self.ensure_registry()
         record = self._record_from_id(tool_id)
         if record is None:
             return {"success": False, "message": f"tool_id not found: {tool_id}"}
@@ -95,7 +118,7 @@ class AgenticGateway:
         }
 
     async def tool_call(self, tool_id: str, arguments: dict[str, JsonValue]) -> dict[str, object]:
-        await self._ensure_registry()
+        await self.ensure_registry()
         record = self._record_from_id(tool_id)
         if record is None:
             return {"success": False, "message": f"tool_id not found: {tool_id}"}
@@ -114,7 +137,7 @@ class AgenticGateway:
         arguments: dict[str, JsonValue] | None = None,
         top_k: int = 1,
     ) -> dict[str, object]:
-        await self._ensure_registry()
+        await self.ensure_registry()
         assert self._router is not None
 
         arguments = arguments or {}
@@ -144,38 +167,78 @@ class AgenticGateway:
             "result": self._normalize_tool_result(raw),
         }
 
-    async def _ensure_registry(self) -> None:
-        if not self.registry:
-            _ = await self.refresh_registry()
+    async def ensure_registry(self) -> None:
+        if self.registry and not self._registry_expired():
+            return
+        async with self._refresh_lock:
+            if self.registry and not self._registry_expired():
+                return
+            _ = await self._rebuild_registry()
+
+    def invalidate(self) -> None:
+        self._registry_stale = True
+
+    def _registry_expired(self) -> bool:
+        if self._registry_stale:
+            return True
+        return time.monotonic() - self._registry_loaded_at > self.registry_ttl
+
+    def tool_names(self) -> KeysView[str]:
+        return self._records_by_name.keys()
+
+    def record_from_name(self, name: str) -> ToolRecord | None:
+        return self._records_by_name.get(name)
 
     def _record_from_id(self, tool_id: str) -> ToolRecord | None:
-        for record in self.registry:
-            if record.tool_id == tool_id:
-                return record
-        return None
+        return self._records_by_id.get(tool_id)
+
+    @staticmethod
+    def _search_result(record: ToolRecord, score: ToolScore) -> dict[str, object]:
+        return {
+            "tool_id": record.tool_id,
+            "name": record.name,
+            "description": record.description,
+            "group": record.group,
+            "score": score.score,
+            "reason": score.reason,
+        }
 
     @staticmethod
     def _parse_group(group: str | None) -> GroupName | None:
         if group is None:
             return None
-        if group in GROUP_NAMES:
+        if group in GROUP_NAME_SET:
             return group
         return None
 
     @staticmethod
     def _normalize_tool_result(result: object) -> object:
-        if isinstance(result, list):
-            normalized: list[object] = []
-            for item in result:
+        if not isinstance(result, list):
+            return result
+
+        normalized: list[object] = []
+        for item in result:
+            item_type = type(item)
+            if item_type is TextContent:
+                normalized.append(_decode_text_content(item.text))
+            elif item_type in _PASSTHROUGH_RESULT_TYPES:
+                normalized.append(item)
+            else:
                 text = getattr(item, "text", None)
                 if isinstance(text, str):
-                    try:
-                        normalized.append(json.loads(text))
-                    except json.JSONDecodeError:
-                        normalized.append(text)
+                    normalized.append(_decode_text_content(text))
                 elif hasattr(item, "model_dump"):
                     normalized.append(item.model_dump())
                 else:
                     normalized.append(item)
-            return normalized
-        return result
+        return normalized
+
+
+_PASSTHROUGH_RESULT_TYPES = frozenset({dict, list, str, int, float, bool, type(None)})
+
+
+def _decode_text_content(text: str) -> object:
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return text
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 from .models import GroupName
 
 GROUP_KEYWORDS: dict[GroupName, tuple[str, ...]] = {
@@ -67,11 +69,36 @@ GROUP_KEYWORDS: dict[GroupName, tuple[str, ...]] = {
 }
 
 
+_GROUP_ORDER: tuple[GroupName, ...] = tuple(group for group in GROUP_KEYWORDS if group != "other")
+
+
+def _build_keyword_group_index() -> dict[str, int]:
+    index_by_keyword: dict[str, int] = {}
+    for index, group in enumerate(_GROUP_ORDER):
+        for keyword in GROUP_KEYWORDS[group]:
+            _ = index_by_keyword.setdefault(keyword, index)
+    return index_by_keyword
+
+
+_KEYWORD_GROUP_INDEX = _build_keyword_group_index()
+
+# Zero-width lookahead so overlapping keywords (e.g. "document" inside
+# "get_document_info") are all reported; alternatives are listed in group
+# priority order, so each position yields its highest-priority keyword.
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_GROUP_INDEX) + "))"
+)
+
+
 def classify_group(tool_name: str, description: str) -> GroupName:
     lowered = f"{tool_name} {description}".lower()
-    for group, keywords in GROUP_KEYWORDS.items():
-        if group == "other":
-            continue
-        if any(keyword in lowered for keyword in keywords):
-            return group
+    best_index = len(_GROUP_ORDER)
+    for match in _KEYWORD_PATTERN.finditer(lowered):
+        index = _KEYWORD_GROUP_INDEX[match.group(1)]
+        if index < best_index:
+            best_index = index
+            if index == 0:
+                break
+    if best_index < len(_GROUP_ORDER):
+        return _GROUP_ORDER[best_index]
     return "other"
@@ -5,6 +5,7 @@ from collections.abc import Callable
 from fastapi import APIRouter
 from fastapi import HTTPException
 from pydantic import BaseModel
+from pydantic import ConfigDict
 
 from .gateway import BackendServer
 from .openrouter_agent import DEFAULT_MODEL
@@ -17,6 +18,8 @@ from .openrouter_agent import OpenRouterToolAgent
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     message: str
     session_id: str = ""
 
@@ -92,13 +95,13 @@ class AgentHttpSurface:
         }
 
     async def chat(self, payload: ChatRequest) -> dict[str, object]:
-        message = payload.message.strip()
-        if not message:
+        if not payload.message:
             raise HTTPException(status_code=422, detail="message_required")
 
-        session_id = payload.session_id.strip()
         try:
-            result = await self._agent.run(message=message, session_id=session_id)
+            result = await self._agent.run(
+                message=payload.message, session_id=payload.session_id
+            )
         except AgentAuthError as error:
             raise HTTPException(status_code=400, detail=str(error)) from error
         except LlmRequestError as error:
@@ -120,6 +123,9 @@ class AgentHttpSurface:
     async def local_model_status(self) -> dict[str, object]:
         return self._agent.local_model_status()
 
+    async def aclose(self) -> None:
+        await self._agent.aclose()
+
     async def download_local_model(
         self, payload: LocalModelDownloadRequest
     ) -> dict[str, object]:
@@ -135,7 +141,7 @@ def build_agent_http_router(
     agent_factory: Callable[[BackendServer], OpenRouterToolAgent] | None = None,
 ) -> APIRouter:
     surface = AgentHttpSurface(backend_server, agent_factory=agent_factory)
-    router = APIRouter()
+    router = APIRouter(on_shutdown=[surface.aclose])
 
     @router.get("/agent/health")
     async def agent_health() -> dict[str, object]:
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Collection
+from collections.abc import Mapping
+from dataclasses import dataclass
+import re
+from typing import Literal
+
+MessageFeature = Literal[
+    "status",
+    "capabilities",
+    "search",
+    "field",
+    "table",
+    "template_hint",
+    "edit",
+    "form",
+    "template",
+    "document_target",
+    "export_pdf",
+    "save",
+    "insert",
+    "create",
+]
+
+MessageFeatureTokens = Mapping[MessageFeature, tuple[str, ...]]
+MessageFeatureScanner = Callable[[str], frozenset[MessageFeature]]
+
+MESSAGE_FEATURE_TOKENS: dict[MessageFeature, tuple[str, ...]] = {
+    "status": ("status", "ping", "상태", "헬스"),
+    "capabilities": ("capability", "capabilities", "지원", "가능"),
+    "search": ("find", "search", "찾기", "검색"),
+    "field": ("field", "필드", "누름틀", "입력란"),
+    "table": ("table", "표", "테이블", "셀", "cell", "행"),
+    "template_hint": ("template", "템플릿", "목록", "list", "search", "검색"),
+    "edit": ("open", "열", "불러", "수정", "편집", "변경", "update", "edit"),
+    "form": ("양식",),
+    "template": ("template", "템플릿"),
+    "document_target": (".hwp", ".hwpx", "기존 문서", "문서 수정"),
+    "export_pdf": ("export pdf", "pdf", "내보내기"),
+    "save": ("save", "저장"),
+    "insert": ("insert", "write", "작성", "추가", "입력"),
+    "create": ("create", "new", "문서 생성", "새 문서", "만들"),
+}
+
+
+def build_message_feature_index(
+    tokens: MessageFeatureTokens,
+) -> dict[str, frozenset[MessageFeature]]:
+    features_by_token: dict[str, set[MessageFeature]] = {}
+    for feature, feature_tokens in tokens.items():
+        for token in feature_tokens:
+            features_by_token.setdefault(token, set()).add(feature)
+
+    # A longer token shadows its prefixes at the same offset in the alternation,
+    # so it has to report their features as well.
+    index: dict[str, frozenset[MessageFeature]] = {}
+    for token, features in features_by_token.items():
+        merged = set(features)
+        for other, other_features in features_by_token.items():
+            if other != token and token.startswith(other):
+                merged.update(other_features)
+        index[token] = frozenset(merged)
+    return index
+
+
+def build_message_feature_scanner(tokens: MessageFeatureTokens) -> MessageFeatureScanner:
+    index = build_message_feature_index(tokens)
+    pattern = re.compile(
+        "(?=("
+        + "|".join(
+            re.escape(token)
+            for token in sorted(index, key=lambda token: (-len(token), token))
+        )
+        + "))"
+    )
+
+    def message_features(lowered: str) -> frozenset[MessageFeature]:
+        features: set[MessageFeature] = set()
+        for match in pattern.finditer(lowered):
+            features.update(index[match.group(1)])
+        return frozenset(features)
+
+    return message_features
+
+
+# The first double-quoted span anywhere wins over any single-quoted one; a plain
+# "..."|'...' alternation would instead take whichever quote comes first.
+_QUOTED_TEXT_PATTERN = re.compile(r"""(?s)\A(?=.*?"([^"]+)")|'([^']+)'""")
+
+
+def extract_quoted_text(message: str) -> str | None:
+    match = _QUOTED_TEXT_PATTERN.search(message)
+    if match:
+        return (match.group(1) or match.group(2)).strip()
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ToolNameTraits:
+    has_windows: bool
+    has_templates: bool
+    has_hwpx: bool
+    has_doc_ops: bool
+    xml_only: bool
+
+
+def tool_name_traits(tool_names: Collection[str]) -> ToolNameTraits:
+    has_windows = False
+    xml_only = bool(tool_names)
+    for name in tool_names:
+        if not has_windows and name.startswith("hwp_windows_"):
+            has_windows = True
+        if xml_only and not ("xml" in name or "xpath" in name or "smart_patch" in name):
+            xml_only = False
+        if has_windows and not xml_only:
+            break
+    return ToolNameTraits(
+        has_windows=has_windows,
+        has_templates="hwp_list_templates" in tool_names,
+        has_hwpx="hwp_create_hwpx" in tool_names,
+        has_doc_ops=any(
+            name in tool_names for name in ("hwp_create", "hwp_insert_text", "hwp_save")
+        ),
+        xml_only=xml_only,
+    )
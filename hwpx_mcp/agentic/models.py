@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Literal
 from typing import TypeAlias
 
@@ -28,6 +29,23 @@ GROUP_NAMES: tuple[GroupName, ...] = (
     "other",
 )
 
+GROUP_NAME_SET: frozenset[str] = frozenset(GROUP_NAMES)
+
+
+class GroupId(IntEnum):
+    DOCUMENT_LIFECYCLE = 0
+    TEXT_INSERTION = 1
+    TABLE_CHART = 2
+    FIELD_META = 3
+    FIND_REPLACE = 4
+    XML_DIRECT = 5
+    EXPORT_CONVERT = 6
+    UTIL_DEBUG = 7
+    OTHER = 8
+
+
+GROUP_IDS: dict[GroupName, GroupId] = {name: GroupId(index) for index, name in enumerate(GROUP_NAMES)}
+
 JsonPrimitive: TypeAlias = str | int | float | bool | None
 JsonValue: TypeAlias = JsonPrimitive | list["JsonValue"] | dict[str, "JsonValue"]
 
@@ -43,6 +61,10 @@ class ToolRecord:
     tags: tuple[str, ...]
     schema_hash: str
 
+    @property
+    def group_id(self) -> GroupId:
+        return GROUP_IDS[self.group]
+
     def search_blob(self) -> str:
         return f"{self.name} {self.description} {' '.join(self.tags)}"
 
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Sequence
 import json
 import os
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
+import gzip
+from importlib.util import find_spec
 import re
+import time
 from typing import Literal
 
 import httpx
+import orjson
 
 from .gateway import AgenticGateway
 from .gateway import BackendServer
@@ -16,6 +24,11 @@ from .local_model import LOCAL_PROVIDER
 from .local_model import LocalModelError
 from .local_model import LocalModelManagerProtocol
 from .local_model import LocalTransformersModelManager
+from .message_features import MESSAGE_FEATURE_TOKENS
+from .message_features import ToolNameTraits
+from .message_features import build_message_feature_scanner
+from .message_features import extract_quoted_text
+from .message_features import tool_name_traits
 from .models import JsonValue
 
 CaseName = Literal[
@@ -61,6 +74,8 @@ AGENT_PROVIDER_ENV = "HWPX_AGENT_PROVIDER"
 AGENT_MODEL_ENV = "HWPX_AGENT_MODEL"
 CODEX_PROXY_URL_ENV = "HWPX_CODEX_PROXY_URL"
 CODEX_PROXY_ACCESS_TOKEN_ENV = "HWPX_CODEX_PROXY_ACCESS_TOKEN"
+AGENT_STREAM_ENV = "HWPX_AGENT_STREAM"
+AGENT_GZIP_REQUESTS_ENV = "HWPX_AGENT_GZIP_REQUESTS"
 OPENAI_DEFAULT_MODEL = "gpt-4o-mini"
 OPENROUTER_DEFAULT_MODEL = "openai/gpt-oss-120b"
 CODEX_PROXY_DEFAULT_MODEL = "gpt-5"
@@ -79,6 +94,17 @@ SUPPORTED_PROVIDERS = {
 DEFAULT_MODEL = OPENAI_DEFAULT_MODEL
 DEFAULT_PROVIDER = OPENAI_PROVIDER
 
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+HAS_H2 = find_spec("h2") is not None
+GZIP_MIN_REQUEST_BYTES = 1024
+GZIP_COMPRESS_LEVEL = 1
+
+PLAN_CACHE_MAX_ENTRIES = 256
+PLAN_CACHE_TTL_SECONDS = 3600.0
+
+TOOLS_JSON_CACHE_MAX_ENTRIES = 32
+
 
 JsonObject = dict[str, JsonValue]
 MessageRole = Literal["system", "user", "assistant", "tool"]
@@ -142,136 +168,202 @@ class ExecutionPlan:
         }
 
 
-def _extract_quoted_text(message: str) -> str | None:
-    match = re.search(r'"([^"]+)"', message)
-    if match:
-        return match.group(1).strip()
-    match = re.search(r"'([^']+)'", message)
-    if match:
-        return match.group(1).strip()
-    return None
-
+PlanCacheKey = tuple[str, str, str, str, str, tuple[str, ...], str]
 
-def _contains_any(text: str, tokens: tuple[str, ...]) -> bool:
-    return any(token in text for token in tokens)
-
-
-def _has_table_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("table", "표", "테이블", "셀", "cell", "행"),
-    )
 
-
-def _has_field_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("field", "필드", "누름틀", "입력란"),
-    )
-
-
-def _has_template_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("template", "템플릿", "목록", "list", "search", "검색"),
+@dataclass(slots=True)
+class PlanCache:
+    max_entries: int = PLAN_CACHE_MAX_ENTRIES
+    ttl_seconds: float = PLAN_CACHE_TTL_SECONDS
+    _entries: OrderedDict[PlanCacheKey, tuple[float, ExecutionPlan]] = field(
+        default_factory=OrderedDict, init=False, repr=False
     )
 
-
-def _has_edit_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("open", "열", "불러", "수정", "편집", "변경", "update", "edit"),
-    )
+    @staticmethod
+    def make_key(
+        *,
+        provider: str,
+        model: str,
+        subagent: SubagentName,
+        intent: IntentName,
+        case: CaseName,
+        allowlist: Sequence[str],
+        message: str,
+    ) -> PlanCacheKey:
+        normalized_message = " ".join(message.split())
+        return (provider, model, subagent, intent, case, tuple(allowlist), normalized_message)
+
+    def get(self, key: PlanCacheKey) -> ExecutionPlan | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, plan = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return plan
+
+    def store(self, key: PlanCacheKey, plan: ExecutionPlan) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), plan)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
-def _looks_like_document_target(message: str) -> bool:
-    quoted = _extract_quoted_text(message)
-    if isinstance(quoted, str) and quoted.lower().endswith((".hwp", ".hwpx")):
-        return True
-    lowered = message.lower()
-    return _contains_any(lowered, (".hwp", ".hwpx", "기존 문서", "문서 수정"))
+@dataclass(slots=True)
+class StreamedCompletion:
+    content_parts: list[str] = field(default_factory=list)
+    tool_calls: dict[int, dict[str, object]] = field(default_factory=dict)
+    argument_parts: dict[int, list[str]] = field(default_factory=dict)
+    finish_reason: object = None
+
+    def add_chunk(self, chunk: object) -> None:
+        if not isinstance(chunk, dict):
+            return
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or not choices:
+            return
+        choice = choices[0]
+        if not isinstance(choice, dict):
+            return
+
+        finish_reason = choice.get("finish_reason")
+        if finish_reason is not None:
+            self.finish_reason = finish_reason
+
+        delta = choice.get("delta")
+        if not isinstance(delta, dict):
+            return
+
+        content = delta.get("content")
+        if isinstance(content, str):
+            self.content_parts.append(content)
+
+        raw_tool_calls = delta.get("tool_calls")
+        if not isinstance(raw_tool_calls, list):
+            return
+        for raw_call in raw_tool_calls:
+            if not isinstance(raw_call, dict):
+                continue
+            index = raw_call.get("index")
+            if not isinstance(index, int):
+                index = len(self.tool_calls)
+            call = self.tool_calls.get(index)
+            if call is None:
+                call = {"id": "", "type": "function", "function": {"name": ""}}
+                self.tool_calls[index] = call
+                self.argument_parts[index] = []
+
+            tool_call_id = raw_call.get("id")
+            if isinstance(tool_call_id, str) and tool_call_id:
+                call["id"] = tool_call_id
+            function = raw_call.get("function")
+            if not isinstance(function, dict):
+                continue
+            name = function.get("name")
+            if isinstance(name, str) and name:
+                call["function"] = {"name": name}
+            arguments = function.get("arguments")
+            if isinstance(arguments, str):
+                self.argument_parts[index].append(arguments)
+
+    def to_response(self) -> dict[str, object]:
+        message: dict[str, object] = {
+            "role": "assistant",
+            "content": "".join(self.content_parts) or None,
+        }
+        if self.tool_calls:
+            tool_calls: list[dict[str, object]] = []
+            for index in sorted(self.tool_calls):
+                call = self.tool_calls[index]
+                function = call["function"]
+                assert isinstance(function, dict)
+                tool_calls.append(
+                    {
+                        "id": call["id"],
+                        "type": "function",
+                        "function": {
+                            "name": function["name"],
+                            "arguments": "".join(self.argument_parts[index]),
+                        },
+                    }
+                )
+            message["tool_calls"] = tool_calls
+        return {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": self.finish_reason,
+                }
+            ]
+        }
 
 
-def _looks_like_search_request(lowered: str) -> bool:
-    return _contains_any(lowered, ("find", "search", "찾기", "검색"))
+_message_features = build_message_feature_scanner(MESSAGE_FEATURE_TOKENS)
 
 
 def _parse_intent(message: str) -> IntentName:
-    lowered = message.lower()
-    if any(token in lowered for token in ("status", "ping", "상태", "헬스")):
+    features = _message_features(message.lower())
+    if "status" in features:
         return "status"
-    if any(
-        token in lowered for token in ("capability", "capabilities", "지원", "가능")
-    ):
+    if "capabilities" in features:
         return "capabilities"
-    if _looks_like_search_request(lowered):
+    if "search" in features:
         return "search"
-    if _has_field_keywords(lowered):
+    if "field" in features:
         return "field_form"
-    if _has_table_keywords(lowered):
+    if "table" in features:
         return "table"
-    if "양식" in lowered and (
-        _has_table_keywords(lowered) or _has_field_keywords(lowered)
-    ):
-        return "table" if _has_table_keywords(lowered) else "field_form"
-    if "양식" in lowered and _has_edit_keywords(lowered):
-        if _has_table_keywords(lowered):
-            return "table"
-        if _has_field_keywords(lowered):
-            return "field_form"
-    if _looks_like_document_target(message) and (
-        _has_edit_keywords(lowered) or _extract_quoted_text(message) is not None
-    ):
+    quoted = extract_quoted_text(message)
+    document_target = "document_target" in features or (
+        quoted is not None and quoted.lower().endswith((".hwp", ".hwpx"))
+    )
+    if document_target and ("edit" in features or quoted is not None):
         return "open_document"
-    if any(token in lowered for token in ("template", "템플릿")):
+    if "template" in features:
         return "template"
-    if "양식" in lowered and _has_template_keywords(lowered):
+    if "form" in features and "template_hint" in features:
         return "template"
-    if any(token in lowered for token in ("export pdf", "pdf", "내보내기")):
+    if "export_pdf" in features:
         return "export_pdf"
-    if any(token in lowered for token in ("save", "저장")):
+    if "save" in features:
         return "save"
-    if _looks_like_search_request(lowered):
-        return "search"
-    if any(token in lowered for token in ("insert", "write", "작성", "추가", "입력")):
+    if "insert" in features:
         return "insert_text"
-    if any(
-        token in lowered for token in ("create", "new", "문서 생성", "새 문서", "만들")
-    ):
+    if "create" in features:
         return "create"
     return "unknown"
 
 
-def _detect_case(message: str, tool_names: set[str]) -> CaseName:
-    lowered = message.lower()
-    has_windows = any(name.startswith("hwp_windows_") for name in tool_names)
-    has_templates = "hwp_list_templates" in tool_names
-    has_hwpx = "hwp_create_hwpx" in tool_names
-    has_doc_ops = any(
-        name in tool_names for name in ("hwp_create", "hwp_insert_text", "hwp_save")
-    )
-    has_xml_only = bool(tool_names) and all(
-        ("xml" in name) or ("xpath" in name) or ("smart_patch" in name)
-        for name in tool_names
-    )
-
+def _detect_case(message: str, traits: ToolNameTraits) -> CaseName:
+    features = _message_features(message.lower())
     if (
         (
-            any(token in lowered for token in ("template", "템플릿"))
-            or ("양식" in lowered and _has_template_keywords(lowered))
+            "template" in features
+            or ("form" in features and "template_hint" in features)
         )
-        and not _has_table_keywords(lowered)
-        and not _has_field_keywords(lowered)
-        and has_templates
+        and "table" not in features
+        and "field" not in features
+        and traits.has_templates
     ):
         return "template_workflow"
-    if has_windows:
+    if traits.has_windows:
         return "windows_com_full"
-    if has_xml_only:
+    if traits.xml_only:
         return "query_analyze_only"
-    if has_hwpx:
+    if traits.has_hwpx:
         return "cross_platform_hwpx"
-    if has_doc_ops:
+    if traits.has_doc_ops:
         return "no_document_context"
     return "degraded_recovery"
 
@@ -297,61 +389,66 @@ def _route_subagent(intent: IntentName, case: CaseName) -> SubagentName:
     return "recovery_agent"
 
 
+SUBAGENT_DEFAULT_TOOLS: dict[SubagentName, tuple[str, ...]] = {
+    "status_agent": ("hwp_ping", "hwp_platform_info", "hwp_capabilities"),
+    "template_agent": (
+        "hwp_list_templates",
+        "hwp_search_template",
+        "hwp_create_from_template",
+    ),
+    "document_agent": (
+        "hwp_platform_info",
+        "hwp_create_hwpx",
+        "hwp_create",
+        "hwp_insert_text",
+        "hwp_windows_insert_text",
+        "hwp_save",
+        "hwp_save_document",
+    ),
+    "export_agent": ("hwp_export_pdf", "hwp_save_as"),
+    "search_agent": ("hwp_find", "hwp_search_text"),
+    "recovery_agent": (),
+}
+
+SUBAGENT_INTENT_TOOLS: dict[tuple[SubagentName, IntentName], tuple[str, ...]] = {
+    ("status_agent", "capabilities"): (
+        "hwp_capabilities",
+        "hwp_get_capabilities",
+        "hwp_platform_info",
+    ),
+    ("document_agent", "open_document"): (
+        "hwp_platform_info",
+        "hwp_open",
+        "hwp_insert_text",
+        "hwp_windows_insert_text",
+        "hwp_save",
+        "hwp_save_document",
+    ),
+    ("document_agent", "table"): (
+        "hwp_platform_info",
+        "hwp_create_table",
+        "hwp_set_cell_text",
+        "hwp_save",
+        "hwp_save_document",
+    ),
+    ("document_agent", "field_form"): (
+        "hwp_platform_info",
+        "hwp_create_field",
+        "hwp_put_field_text",
+        "hwp_save",
+        "hwp_save_document",
+    ),
+}
+
+
+def _subagent_tools(subagent: SubagentName, intent: IntentName) -> tuple[str, ...]:
+    return SUBAGENT_INTENT_TOOLS.get(
+        (subagent, intent), SUBAGENT_DEFAULT_TOOLS.get(subagent, ())
+    )
+
+
 def _subagent_tool_allowlist(subagent: SubagentName, intent: IntentName) -> list[str]:
-    if subagent == "status_agent":
-        if intent == "capabilities":
-            return [
-                "hwp_capabilities",
-                "hwp_get_capabilities",
-                "hwp_platform_info",
-            ]
-        return ["hwp_ping", "hwp_platform_info", "hwp_capabilities"]
-    if subagent == "template_agent":
-        return [
-            "hwp_list_templates",
-            "hwp_search_template",
-            "hwp_create_from_template",
-        ]
-    if subagent == "document_agent":
-        if intent == "open_document":
-            return [
-                "hwp_platform_info",
-                "hwp_open",
-                "hwp_insert_text",
-                "hwp_windows_insert_text",
-                "hwp_save",
-                "hwp_save_document",
-            ]
-        if intent == "table":
-            return [
-                "hwp_platform_info",
-                "hwp_create_table",
-                "hwp_set_cell_text",
-                "hwp_save",
-                "hwp_save_document",
-            ]
-        if intent == "field_form":
-            return [
-                "hwp_platform_info",
-                "hwp_create_field",
-                "hwp_put_field_text",
-                "hwp_save",
-                "hwp_save_document",
-            ]
-        return [
-            "hwp_platform_info",
-            "hwp_create_hwpx",
-            "hwp_create",
-            "hwp_insert_text",
-            "hwp_windows_insert_text",
-            "hwp_save",
-            "hwp_save_document",
-        ]
-    if subagent == "export_agent":
-        return ["hwp_export_pdf", "hwp_save_as"]
-    if subagent == "search_agent":
-        return ["hwp_find", "hwp_search_text"]
-    return []
+    return list(_subagent_tools(subagent, intent))
 
 
 def _base_system_prompt() -> str:
@@ -414,6 +511,11 @@ def _subagent_system_prompt(subagent: SubagentName) -> str:
     )
 
 
+@lru_cache(maxsize=None)
+def _execution_system_prompt(subagent: SubagentName) -> str:
+    return _base_system_prompt() + "\n" + _subagent_system_prompt(subagent)
+
+
 def _tool_record_to_openai_tool(record: object) -> dict[str, object]:
     name = getattr(record, "name", "")
     description = getattr(record, "description", "")
@@ -434,7 +536,7 @@ def _tool_record_to_openai_tool(record: object) -> dict[str, object]:
     }
 
 
-def _format_allowlist(allowlist: list[str]) -> str:
+def _format_allowlist(allowlist: Sequence[str]) -> str:
     if not allowlist:
         return "none"
     return ", ".join(allowlist)
@@ -495,7 +597,7 @@ def _fallback_plan(
     message: str,
     intent: IntentName,
     subagent: SubagentName,
-    allowlist: list[str],
+    allowlist: Sequence[str],
 ) -> ExecutionPlan:
     summary = f"요청을 처리하기 위한 실행 계획을 준비합니다: {message.strip()}"
     steps: list[PlanStep]
@@ -583,8 +685,8 @@ def _parse_plan_response(
     message: str,
     intent: IntentName,
     subagent: SubagentName,
-    allowlist: list[str],
-) -> ExecutionPlan:
+    allowlist: Sequence[str],
+) -> tuple[ExecutionPlan, bool]:
     fallback = _fallback_plan(
         message=message,
         intent=intent,
@@ -592,18 +694,18 @@ def _parse_plan_response(
         allowlist=allowlist,
     )
     if not raw_text.strip():
-        return fallback
+        return fallback, False
 
     candidate = _extract_json_object(raw_text)
     try:
         payload = json.loads(candidate)
     except ValueError:
         fallback.raw_text = raw_text
-        return fallback
+        return fallback, False
 
     if not isinstance(payload, dict):
         fallback.raw_text = raw_text
-        return fallback
+        return fallback, False
 
     summary_value = payload.get("summary")
     raw_steps = payload.get("steps")
@@ -616,14 +718,14 @@ def _parse_plan_response(
 
     if not steps:
         fallback.raw_text = raw_text
-        return fallback
+        return fallback, False
 
     summary = (
         summary_value.strip()
         if isinstance(summary_value, str) and summary_value.strip()
         else fallback.summary
     )
-    return ExecutionPlan(summary=summary, steps=steps, raw_text=raw_text)
+    return ExecutionPlan(summary=summary, steps=steps, raw_text=raw_text), True
 
 
 def _render_plan_for_execution(plan: ExecutionPlan) -> str:
@@ -638,13 +740,53 @@ def _render_plan_for_execution(plan: ExecutionPlan) -> str:
 
 
 class OpenRouterClient:
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        stream: bool | None = None,
+        compress_requests: bool | None = None,
+    ):
         self._api_key = api_key
+        if stream is None:
+            stream = os.getenv(AGENT_STREAM_ENV, "false").strip().lower() == "true"
+        self.stream = stream
+        if compress_requests is None:
+            compress_requests = (
+                os.getenv(AGENT_GZIP_REQUESTS_ENV, "false").strip().lower() == "true"
+            )
+        self.compress_requests = compress_requests
         self._runtime_openai_api_key = ""
         self._runtime_openai_oauth_token = ""
         self._runtime_codex_oauth_token = ""
         self._runtime_openrouter_api_key = ""
         self._runtime_codex_proxy_access_token = ""
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+        self._tools_json_cache: OrderedDict[
+            int, tuple[list[dict[str, object]], bytes]
+        ] = OrderedDict()
+
+    async def aclose(self) -> None:
+        http_client = self._http_client
+        self._http_client = None
+        self._http_client_loop = None
+        if http_client is not None and not http_client.is_closed:
+            await http_client.aclose()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_client is None
+            or self._http_client.is_closed
+            or self._http_client_loop is not loop
+        ):
+            self._http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS,
+                limits=HTTP_POOL_LIMITS,
+                http2=HAS_H2,
+            )
+            self._http_client_loop = loop
+        return self._http_client
 
     @staticmethod
     def normalize_provider(value: str | None) -> str:
@@ -893,8 +1035,83 @@ class OpenRouterClient:
         headers: dict[str, str],
         body: dict[str, object],
     ) -> httpx.Response:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            return await client.post(target_url, headers=headers, json=body)
+        http_client = self._get_http_client()
+        content = self._encode_chat_body(body)
+        stream = body.get("stream") is True
+        if self.compress_requests and len(content) >= GZIP_MIN_REQUEST_BYTES:
+            response = await self._send_chat_body(
+                http_client,
+                target_url=target_url,
+                headers={**headers, "Content-Encoding": "gzip"},
+                content=gzip.compress(content, compresslevel=GZIP_COMPRESS_LEVEL),
+                stream=stream,
+            )
+            if response.status_code != 415:
+                return response
+            await response.aclose()
+            self.compress_requests = False
+
+        return await self._send_chat_body(
+            http_client,
+            target_url=target_url,
+            headers=headers,
+            content=content,
+            stream=stream,
+        )
+
+    @staticmethod
+    async def _send_chat_body(
+        http_client: httpx.AsyncClient,
+        *,
+        target_url: str,
+        headers: dict[str, str],
+        content: bytes,
+        stream: bool,
+    ) -> httpx.Response:
+        request = http_client.build_request(
+            "POST", target_url, headers=headers, content=content
+        )
+        return await http_client.send(request, stream=stream)
+
+    def _encode_tools(self, tools: list[dict[str, object]]) -> bytes:
+        key = id(tools)
+        cached = self._tools_json_cache.get(key)
+        if cached is not None and cached[0] is tools:
+            self._tools_json_cache.move_to_end(key)
+            return cached[1]
+
+        encoded = orjson.dumps(tools, option=orjson.OPT_NON_STR_KEYS)
+        self._tools_json_cache[key] = (tools, encoded)
+        self._tools_json_cache.move_to_end(key)
+        while len(self._tools_json_cache) > TOOLS_JSON_CACHE_MAX_ENTRIES:
+            self._tools_json_cache.popitem(last=False)
+        return encoded
+
+    def _encode_chat_body(self, body: dict[str, object]) -> bytes:
+        tools = body.get("tools")
+        if not isinstance(tools, list):
+            return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS)
+
+        rest = {key: value for key, value in body.items() if key != "tools"}
+        encoded = orjson.dumps(rest, option=orjson.OPT_NON_STR_KEYS)
+        separator = b',"tools":' if rest else b'"tools":'
+        return b"".join((encoded[:-1], separator, self._encode_tools(tools), b"}"))
+
+    @staticmethod
+    async def _read_streamed_completion(
+        response: httpx.Response,
+    ) -> dict[str, object]:
+        completion = StreamedCompletion()
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if not data:
+                continue
+            if data == "[DONE]":
+                break
+            completion.add_chunk(orjson.loads(data))
+        return completion.to_response()
 
     @staticmethod
     def _resolve_openai_model(model: str) -> str:
@@ -986,7 +1203,7 @@ class OpenRouterClient:
         body = {
             "model": self._resolve_model(normalized_provider, model),
             "messages": messages,
-            "stream": False,
+            "stream": self.stream,
         }
         target_url = self._target_url_for_provider(normalized_provider, proxy_url)
 
@@ -1017,6 +1234,8 @@ class OpenRouterClient:
                 ) from error
 
             if response.status_code >= 400:
+                _ = await response.aread()
+                await response.aclose()
                 message = f"llm_error[{auth_mode}]: {response.status_code}: {response.text[:300]}"
                 message = self._append_quota_hint(
                     message=message,
@@ -1036,6 +1255,22 @@ class OpenRouterClient:
                     message=f"{message} | attempted_auth={','.join(attempted_modes)}",
                 )
 
+            if self.stream:
+                try:
+                    return await self._read_streamed_completion(response)
+                except httpx.HTTPError as error:
+                    raise LlmRequestError(
+                        status_code=502,
+                        message=f"llm_network_error[{auth_mode}]: {error}",
+                    ) from error
+                except ValueError as error:
+                    raise LlmRequestError(
+                        status_code=502,
+                        message=f"llm_invalid_json[{auth_mode}]: invalid stream frame",
+                    ) from error
+                finally:
+                    await response.aclose()
+
             try:
                 return response.json()
             except ValueError as error:
@@ -1061,7 +1296,14 @@ class OpenRouterToolAgent:
     provider: str = DEFAULT_PROVIDER
     codex_proxy_url: str = ""
     max_rounds: int = 8
+    plan_cache: PlanCache = field(default_factory=PlanCache)
     _gateway: AgenticGateway = field(init=False, repr=False)
+    _tool_defs_by_route: dict[
+        tuple[SubagentName, IntentName], list[dict[str, object]]
+    ] = field(default_factory=dict, init=False, repr=False)
+    _tool_defs_version: int = field(default=-1, init=False, repr=False)
+    _tool_traits: ToolNameTraits | None = field(default=None, init=False, repr=False)
+    _tool_traits_version: int = field(default=-1, init=False, repr=False)
 
     def __post_init__(self) -> None:
         configured_provider = self.provider
@@ -1169,10 +1411,23 @@ class OpenRouterToolAgent:
         intent: IntentName,
         case: CaseName,
         subagent: SubagentName,
-        allowlist: list[str],
+        allowlist: Sequence[str],
         provider: str,
         model: str,
     ) -> ExecutionPlan:
+        cache_key = PlanCache.make_key(
+            provider=provider,
+            model=model,
+            subagent=subagent,
+            intent=intent,
+            case=case,
+            allowlist=allowlist,
+            message=message,
+        )
+        cached_plan = self.plan_cache.get(cache_key)
+        if cached_plan is not None:
+            return cached_plan
+
         planner_messages: list[dict[str, object]] = [
             {"role": "system", "content": _planner_system_prompt()},
             {
@@ -1205,13 +1460,17 @@ class OpenRouterToolAgent:
 
         content = assistant_message.get("content")
         raw_text = content if isinstance(content, str) else ""
-        return _parse_plan_response(
+        plan, parsed = _parse_plan_response(
             raw_text=raw_text,
             message=message,
             intent=intent,
             subagent=subagent,
             allowlist=allowlist,
         )
+        # A fallback plan only reflects one bad reply; let the next run ask again
+        if parsed:
+            self.plan_cache.store(cache_key, plan)
+        return plan
 
     async def _chat_completions(
         self,
@@ -1243,21 +1502,14 @@ class OpenRouterToolAgent:
         )
 
     async def run(self, *, message: str, session_id: str = "") -> dict[str, object]:
-        await self._gateway.refresh_registry()
-        tool_names = {record.name for record in self._gateway.registry}
+        await self._gateway.ensure_registry()
 
         intent = _parse_intent(message)
-        case = _detect_case(message, tool_names)
+        case = _detect_case(message, self._tool_name_traits())
         subagent = _route_subagent(intent, case)
 
-        allowlist = _subagent_tool_allowlist(subagent, intent)
-        records_by_name = {record.name: record for record in self._gateway.registry}
-        tool_defs: list[dict[str, object]] = []
-        for name in allowlist:
-            record = records_by_name.get(name)
-            if record is None:
-                continue
-            tool_defs.append(_tool_record_to_openai_tool(record))
+        allowlist = _subagent_tools(subagent, intent)
+        tool_defs = self._tool_defs_for(subagent, intent)
 
         request_provider, request_model, used_local_fallback = (
             self._effective_provider_and_model()
@@ -1276,9 +1528,7 @@ class OpenRouterToolAgent:
         messages: list[dict[str, object]] = [
             {
                 "role": "system",
-                "content": _base_system_prompt()
-                + "\n"
-                + _subagent_system_prompt(subagent),
+                "content": _execution_system_prompt(subagent),
             },
             {
                 "role": "assistant",
@@ -1332,7 +1582,7 @@ class OpenRouterToolAgent:
                         {
                             "role": "tool",
                             "tool_call_id": call.tool_call_id,
-                            "content": json.dumps(result, ensure_ascii=False),
+                            "content": _dumps_tool_result(result),
                         }
                     )
                 continue
@@ -1400,6 +1650,9 @@ class OpenRouterToolAgent:
 
         return remote_auth
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     def set_runtime_auth(
         self,
         *,
@@ -1417,14 +1670,42 @@ class OpenRouterToolAgent:
             codex_proxy_access_token=codex_proxy_access_token,
         )
 
+    def _tool_name_traits(self) -> ToolNameTraits:
+        if self._tool_traits is None or self._tool_traits_version != self._gateway.registry_version:
+            self._tool_traits = tool_name_traits(self._gateway.tool_names())
+            self._tool_traits_version = self._gateway.registry_version
+        return self._tool_traits
+
+    def _tool_defs_for(
+        self, subagent: SubagentName, intent: IntentName
+    ) -> list[dict[str, object]]:
+        if self._tool_defs_version != self._gateway.registry_version:
+            self._tool_defs_by_route = {}
+            self._tool_defs_version = self._gateway.registry_version
+
+        route = (subagent, intent)
+        tool_defs = self._tool_defs_by_route.get(route)
+        if tool_defs is None:
+            tool_defs = []
+            for name in _subagent_tools(subagent, intent):
+                record = self._gateway.record_from_name(name)
+                if record is not None:
+                    tool_defs.append(_tool_record_to_openai_tool(record))
+            self._tool_defs_by_route[route] = tool_defs
+        return tool_defs
+
     async def _call_tool_by_name(self, name: str, arguments: JsonObject) -> object:
-        for record in self._gateway.registry:
-            if record.name == name:
-                response = await self._gateway.tool_call(record.tool_id, arguments)
-                if response.get("success") is True and "result" in response:
-                    return response["result"]
-                return response
-        return {"success": False, "message": f"tool_not_found: {name}"}
+        record = self._gateway.record_from_name(name)
+        if record is None:
+            return {"success": False, "message": f"tool_not_found: {name}"}
+        response = await self._gateway.tool_call(record.tool_id, arguments)
+        if response.get("success") is True and "result" in response:
+            return response["result"]
+        return response
+
+
+def _dumps_tool_result(result: object) -> str:
+    return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
 
 def _first_choice(payload: dict[str, object]) -> dict[str, object]:
@@ -1457,7 +1738,7 @@ def _extract_tool_calls(message: dict[str, object]) -> list[ToolCall]:
         arguments: JsonObject = {}
         if isinstance(raw_args, str) and raw_args.strip():
             try:
-                parsed = json.loads(raw_args)
+                parsed = orjson.loads(raw_args)
                 if isinstance(parsed, dict):
                     arguments = parsed
             except json.JSONDecodeError:
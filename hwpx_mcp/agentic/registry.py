@@ -8,6 +8,10 @@ from pathlib import Path
 from typing import Mapping
 from typing import Protocol
 from typing import Sequence
+from typing import TypeAlias
+import weakref
+
+import orjson
 
 from .grouping import classify_group
 from .models import JsonValue
@@ -22,8 +26,20 @@ class ToolProvider(Protocol):
     async def list_tools(self) -> Sequence[ToolDumpable]: ...
 
 
+REGISTRY_OFFLOAD_MIN_TOOLS = 50
+JSONL_FLUSH_BYTES = 1 << 20
+
+_SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+_REGISTRY_CACHE: weakref.WeakKeyDictionary[object, tuple[tuple[object, ...], list[ToolRecord]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _stable_hash(payload: Mapping[str, JsonValue]) -> str:
-    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    encoded = _HASH_ENCODER.encode(payload).encode("utf-8")
     return hashlib.sha256(encoded).hexdigest()[:16]
 
 
@@ -41,19 +57,45 @@ def _detect_tags(tool_name: str, description: str) -> tuple[str, ...]:
     return tuple(tags)
 
 
-def _to_json_object(value: object) -> dict[str, JsonValue]:
-    if isinstance(value, dict):
-        return {str(key): _to_json_value(item) for key, item in value.items()}
-    return {}
+_JsonContainer: TypeAlias = dict[str, JsonValue] | list[JsonValue]
 
 
-def _to_json_value(value: object) -> JsonValue:
-    if isinstance(value, (str, int, float, bool)) or value is None:
+def _to_json_object(value: object) -> dict[str, JsonValue]:
+    if not isinstance(value, dict):
+        return {}
+    root: dict[str, JsonValue] = {}
+    _canonicalize(value, root)
+    return root
+
+
+def _canonicalize(source: Mapping[object, object] | list[object], root: _JsonContainer) -> None:
+    stack: list[tuple[Mapping[object, object] | list[object], _JsonContainer]] = [(source, root)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(target, dict) and isinstance(source, Mapping):
+            for key, item in source.items():
+                target[key if key.__class__ is str else str(key)] = _json_node(item, stack)
+        elif isinstance(target, list) and isinstance(source, list):
+            target.extend([_json_node(item, stack) for item in source])
+
+
+def _json_node(
+    value: object,
+    stack: list[tuple[Mapping[object, object] | list[object], _JsonContainer]],
+) -> JsonValue:
+    cls = value.__class__
+    if cls is str or cls is int or cls is float or cls is bool or value is None:
+        return value
+    if isinstance(value, (str, int, float, bool)):
         return value
     if isinstance(value, list):
-        return [_to_json_value(item) for item in value]
+        items: list[JsonValue] = []
+        stack.append((value, items))
+        return items
     if isinstance(value, dict):
-        return {str(key): _to_json_value(item) for key, item in value.items()}
+        fields: dict[str, JsonValue] = {}
+        stack.append((value, fields))
+        return fields
     return str(value)
 
 
@@ -85,20 +127,64 @@ def _convert_tool(tool_dump: Mapping[str, object]) -> ToolRecord:
     )
 
 
-async def build_registry(server: ToolProvider) -> list[ToolRecord]:
-    tools = await server.list_tools()
+def _convert_tools(tools: Sequence[ToolDumpable]) -> list[ToolRecord]:
     records = [_convert_tool(tool.model_dump()) for tool in tools]
     return sorted(records, key=lambda record: record.name)
 
 
+def _registered_tools(server: object) -> tuple[object, ...] | None:
+    # FastMCP keeps its tools in _tool_manager._tools; registering, replacing or
+    # removing one changes this tuple. Other providers are never cached.
+    tool_manager = getattr(server, "_tool_manager", None)
+    tools = getattr(tool_manager, "_tools", None)
+    if not isinstance(tools, dict):
+        return None
+    return tuple(tools.values())
+
+
+async def build_registry(server: ToolProvider) -> list[ToolRecord]:
+    registered = _registered_tools(server)
+    if registered is not None:
+        cached = _REGISTRY_CACHE.get(server)
+        if cached is not None and cached[0] == registered:
+            return list(cached[1])
+
+    tools = await server.list_tools()
+    if len(tools) > REGISTRY_OFFLOAD_MIN_TOOLS:
+        records = await asyncio.to_thread(_convert_tools, tools)
+    else:
+        records = _convert_tools(tools)
+    if registered is not None:
+        _REGISTRY_CACHE[server] = (registered, records)
+        return list(records)
+    return records
+
+
 def build_registry_sync(server: ToolProvider) -> list[ToolRecord]:
-    return asyncio.run(build_registry(server))
+    global _SYNC_LOOP
+    # The loop is kept open for reuse; close_registry_sync_loop() releases it.
+    if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+        _SYNC_LOOP = asyncio.new_event_loop()
+    return _SYNC_LOOP.run_until_complete(build_registry(server))
+
+
+def close_registry_sync_loop() -> None:
+    global _SYNC_LOOP
+    if _SYNC_LOOP is not None:
+        _SYNC_LOOP.run_until_complete(_SYNC_LOOP.shutdown_default_executor())
+        _SYNC_LOOP.close()
+        _SYNC_LOOP = None
 
 
 def save_registry_jsonl(records: list[ToolRecord], output_path: str | Path) -> Path:
     target = Path(output_path)
     target.parent.mkdir(parents=True, exist_ok=True)
-    with target.open("w", encoding="utf-8") as file:
+    buffer = bytearray()
+    with target.open("wb") as file:
         for record in records:
-            _ = file.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            buffer += orjson.dumps(asdict(record), option=orjson.OPT_APPEND_NEWLINE)
+            if len(buffer) >= JSONL_FLUSH_BYTES:
+                _ = file.write(buffer)
+                buffer.clear()
+        _ = file.write(buffer)
     return target
@@ -2,105 +2,296 @@ from __future__ import annotations
 
 from collections import Counter
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+from functools import lru_cache
 import math
 import re
 
-from .models import GroupName, ToolRecord, ToolScore
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+from .models import GROUP_IDS, GroupId, GroupName, ToolRecord, ToolScore
 
 TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+NUMBA_MIN_RECORDS = 512
 
 
 def _tokenize(text: str) -> list[str]:
     return TOKEN_PATTERN.findall(text.lower())
 
 
+@lru_cache(maxsize=256)
+def _query_tokens(query: str) -> frozenset[str]:
+    return frozenset(_tokenize(query))
+
+
+@lru_cache(maxsize=4096)
+def _blob_tokens(blob: str) -> tuple[str, ...]:
+    return tuple(_tokenize(blob))
+
+
+def _precompute_tokens(records: Sequence[ToolRecord]) -> list[tuple[str, ...]]:
+    return [_blob_tokens(record.search_blob()) for record in records]
+
+
 @dataclass(slots=True)
 class LexicalRetriever:
     records: Sequence[ToolRecord]
     k1: float = 1.5
     b: float = 0.75
-    _term_frequencies: list[Counter[str]] = field(init=False, repr=False)
-    _doc_lengths: list[int] = field(init=False, repr=False)
-    _idf: dict[str, float] = field(init=False, repr=False)
-    _avg_doc_length: float = field(init=False, repr=False)
+    tokens_cache: InitVar[Sequence[Sequence[str]] | None] = None
+    _vocabulary: dict[str, int] = field(init=False, repr=False)
+    _term_ptr: np.ndarray = field(init=False, repr=False)
+    _posting_docs: np.ndarray = field(init=False, repr=False)
+    _posting_scores: np.ndarray = field(init=False, repr=False)
+    _max_scores: np.ndarray = field(init=False, repr=False)
+    _group_ids: np.ndarray = field(init=False, repr=False)
+    _tool_id_ranks: np.ndarray = field(init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        frequencies: list[Counter[str]] = []
+    def __post_init__(self, tokens_cache: Sequence[Sequence[str]] | None) -> None:
+        if tokens_cache is None:
+            tokens_cache = _precompute_tokens(self.records)
+        vocabulary: dict[str, int] = {}
+        document_frequencies: list[int] = []
+        doc_ptr = [0]
+        term_ids: list[int] = []
+        term_frequencies: list[int] = []
         doc_lengths: list[int] = []
-        document_frequencies: Counter[str] = Counter()
 
-        for record in self.records:
-            tokens = _tokenize(record.search_blob())
-            term_frequency = Counter(tokens)
-            frequencies.append(term_frequency)
+        for tokens in tokens_cache:
+            for token, count in Counter(tokens).items():
+                term_id = vocabulary.setdefault(token, len(vocabulary))
+                if term_id == len(document_frequencies):
+                    document_frequencies.append(0)
+                document_frequencies[term_id] += 1
+                term_ids.append(term_id)
+                term_frequencies.append(count)
+            doc_ptr.append(len(term_ids))
             doc_lengths.append(len(tokens))
-            for token in term_frequency:
-                document_frequencies[token] += 1
 
         total_docs = max(len(self.records), 1)
-        self._term_frequencies = frequencies
-        self._doc_lengths = doc_lengths
-        self._avg_doc_length = (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 1.0
-        self._idf = {
-            token: math.log(1.0 + (total_docs - count + 0.5) / (count + 0.5))
-            for token, count in document_frequencies.items()
-        }
+        avg_doc_length = (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 1.0
+        entry_terms = np.asarray(term_ids, dtype=np.int32)
+        entry_docs = np.repeat(np.arange(len(self.records), dtype=np.int32), np.diff(doc_ptr))
+        by_term = np.argsort(entry_terms, kind="stable")
+
+        idf = np.asarray(
+            [math.log(1.0 + (total_docs - count + 0.5) / (count + 0.5)) for count in document_frequencies],
+            dtype=np.float64,
+        )
+        len_norm = np.asarray(
+            [self.k1 * (1.0 - self.b + self.b * (doc_length / avg_doc_length)) for doc_length in doc_lengths],
+            dtype=np.float64,
+        )
+        term_ptr = np.concatenate(([0], np.cumsum(np.bincount(entry_terms, minlength=len(vocabulary)))))
+        posting_docs = entry_docs[by_term]
+        posting_frequencies = np.asarray(term_frequencies, dtype=np.float64)[by_term]
+        posting_scores = idf[entry_terms[by_term]] * (
+            (posting_frequencies * (self.k1 + 1.0)) / (posting_frequencies + len_norm[posting_docs])
+        )
+
+        self._vocabulary = vocabulary
+        self._term_ptr = term_ptr.astype(np.int64)
+        self._posting_docs = posting_docs
+        self._posting_scores = posting_scores
+        self._max_scores = (
+            np.maximum.reduceat(posting_scores, term_ptr[:-1]) if vocabulary else np.zeros(0, dtype=np.float64)
+        )
+        self._group_ids = np.fromiter(
+            (record.group_id for record in self.records), dtype=np.int8, count=len(self.records)
+        )
+        self._tool_id_ranks = _tool_id_ranks(self.records)
 
     def search(self, query: str, groups: Sequence[GroupName] | None = None, top_k: int = 12) -> list[ToolScore]:
-        if top_k <= 0:
-            return []
-        group_filter = set(groups or [])
-        query_terms = set(_tokenize(query))
-        scores: list[ToolScore] = []
-
-        for index, record in enumerate(self.records):
-            if group_filter and record.group not in group_filter:
-                continue
-            tf = self._term_frequencies[index]
-            doc_length = self._doc_lengths[index] if self._doc_lengths else 0
-            score = 0.0
-            for term in query_terms:
-                term_frequency = tf.get(term, 0)
-                if term_frequency <= 0:
-                    continue
-                idf = self._idf.get(term, 0.0)
-                denominator = term_frequency + self.k1 * (
-                    1.0 - self.b + self.b * (doc_length / self._avg_doc_length)
-                )
-                score += idf * ((term_frequency * (self.k1 + 1.0)) / denominator)
-            if score > 0:
-                scores.append(ToolScore(tool_id=record.tool_id, score=score, reason="lexical"))
-
-        scores.sort(key=lambda item: (-item.score, item.tool_id))
-        return scores[:top_k]
+        indices, scores = self.ranked(query, groups=groups, top_k=top_k)
+        return _tool_scores(self.records, indices, scores, "lexical")
+
+    def ranked(
+        self, query: str, groups: Sequence[GroupName] | None = None, top_k: int = 12
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if top_k <= 0 or not self.records:
+            return _EMPTY_RANKING
+
+        term_ids = sorted(
+            {self._vocabulary[term] for term in _query_tokens(query) if term in self._vocabulary},
+            key=lambda term_id: (-self._max_scores[term_id], term_id),
+        )
+        eligible = _group_mask(groups)[self._group_ids] if groups else None
+        if HAS_NUMBA and len(self.records) >= NUMBA_MIN_RECORDS:
+            scores = np.zeros(len(self.records), dtype=np.float64)
+            _accumulate_postings(
+                np.asarray(term_ids, dtype=np.int64),
+                self._term_ptr,
+                self._posting_docs,
+                self._posting_scores,
+                scores,
+            )
+        else:
+            scores = self._maxscore(term_ids, eligible, top_k)
+
+        matched = scores > 0
+        if eligible is not None:
+            matched &= eligible
+
+        indices = _top_k_indices(scores, matched, self._tool_id_ranks, top_k)
+        return indices, scores[indices]
+
+    def _maxscore(self, term_ids: list[int], eligible: np.ndarray | None, top_k: int) -> np.ndarray:
+        # remaining_bounds[i] is the most any document can still gain from term_ids[i:]
+        remaining_bounds = np.cumsum(self._max_scores[term_ids][::-1])[::-1] * (1.0 + 1e-9)
+
+        scores = np.zeros(len(self.records), dtype=np.float64)
+        candidates: np.ndarray | None = None
+        for position, term_id in enumerate(term_ids):
+            start = self._term_ptr[term_id]
+            end = self._term_ptr[term_id + 1]
+            doc_ids = self._posting_docs[start:end]
+            contributions = self._posting_scores[start:end]
+            if candidates is not None:
+                keep = candidates[doc_ids]
+                doc_ids = doc_ids[keep]
+                contributions = contributions[keep]
+            scores[doc_ids] += contributions
+
+            if candidates is None and position + 1 < len(term_ids):
+                threshold = _kth_largest(scores if eligible is None else scores[eligible], top_k)
+                if threshold > remaining_bounds[position + 1]:
+                    candidates = scores > 0
+        return scores
 
 
 @dataclass(slots=True)
 class SemanticRetriever:
     records: Sequence[ToolRecord]
+    tokens_cache: InitVar[Sequence[Sequence[str]] | None] = None
+    _vocabulary: dict[str, int] = field(init=False, repr=False)
+    _term_ptr: np.ndarray = field(init=False, repr=False)
+    _posting_docs: np.ndarray = field(init=False, repr=False)
+    _token_counts: np.ndarray = field(init=False, repr=False)
+    _group_ids: np.ndarray = field(init=False, repr=False)
+    _tool_id_ranks: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self, tokens_cache: Sequence[Sequence[str]] | None) -> None:
+        if tokens_cache is None:
+            tokens_cache = _precompute_tokens(self.records)
+        vocabulary: dict[str, int] = {}
+        entry_terms: list[int] = []
+        token_counts: list[int] = []
+        for tokens in tokens_cache:
+            token_set = frozenset(tokens)
+            entry_terms.extend(vocabulary.setdefault(token, len(vocabulary)) for token in token_set)
+            token_counts.append(len(token_set))
+
+        terms = np.asarray(entry_terms, dtype=np.int32)
+        docs = np.repeat(np.arange(len(self.records), dtype=np.int32), token_counts)
+        by_term = np.argsort(terms, kind="stable")
+
+        self._vocabulary = vocabulary
+        self._term_ptr = np.concatenate(([0], np.cumsum(np.bincount(terms, minlength=len(vocabulary))))).astype(
+            np.int64
+        )
+        self._posting_docs = docs[by_term]
+        self._token_counts = np.asarray(token_counts, dtype=np.int64)
+        self._group_ids = np.fromiter(
+            (record.group_id for record in self.records), dtype=np.int8, count=len(self.records)
+        )
+        self._tool_id_ranks = _tool_id_ranks(self.records)
 
     def search(self, query: str, groups: Sequence[GroupName] | None = None, top_k: int = 12) -> list[ToolScore]:
-        if top_k <= 0:
-            return []
-        query_tokens = set(_tokenize(query))
-        group_filter = set(groups or [])
-        results: list[ToolScore] = []
-
-        for record in self.records:
-            if group_filter and record.group not in group_filter:
-                continue
-            record_tokens = set(_tokenize(record.search_blob()))
-            if not record_tokens:
-                continue
-            intersection = len(query_tokens.intersection(record_tokens))
-            union = len(query_tokens.union(record_tokens)) or 1
-            score = intersection / union
-            if score > 0:
-                results.append(ToolScore(tool_id=record.tool_id, score=score, reason="semantic"))
-
-        results.sort(key=lambda item: (-item.score, item.tool_id))
-        return results[:top_k]
+        indices, scores = self.ranked(query, groups=groups, top_k=top_k)
+        return _tool_scores(self.records, indices, scores, "semantic")
+
+    def ranked(
+        self, query: str, groups: Sequence[GroupName] | None = None, top_k: int = 12
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if top_k <= 0 or not self.records:
+            return _EMPTY_RANKING
+        query_tokens = _query_tokens(query)
+        query_ids = [self._vocabulary[token] for token in query_tokens if token in self._vocabulary]
+        if not query_ids:
+            return _EMPTY_RANKING
+
+        intersection = np.bincount(
+            np.concatenate(
+                [self._posting_docs[self._term_ptr[term_id] : self._term_ptr[term_id + 1]] for term_id in query_ids]
+            ),
+            minlength=len(self.records),
+        )
+        union = np.maximum(len(query_tokens) + self._token_counts - intersection, 1)
+        scores = intersection / union
+        matched = scores > 0
+        if groups:
+            matched &= _group_mask(groups)[self._group_ids]
+
+        indices = _top_k_indices(scores, matched, self._tool_id_ranks, top_k)
+        return indices, scores[indices]
+
+
+def _accumulate_postings(
+    term_ids: np.ndarray,
+    term_ptr: np.ndarray,
+    posting_docs: np.ndarray,
+    posting_scores: np.ndarray,
+    scores: np.ndarray,
+) -> None:
+    for term_id in term_ids:
+        for position in range(term_ptr[term_id], term_ptr[term_id + 1]):
+            scores[posting_docs[position]] += posting_scores[position]
+
+
+if HAS_NUMBA:
+    _accumulate_postings = njit(cache=True, nogil=True)(_accumulate_postings)
+
+
+_EMPTY_RANKING: tuple[np.ndarray, np.ndarray] = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64))
+
+
+def _tool_id_ranks(records: Sequence[ToolRecord]) -> np.ndarray:
+    order = sorted(range(len(records)), key=lambda index: records[index].tool_id)
+    ranks = np.empty(len(records), dtype=np.intp)
+    ranks[order] = np.arange(len(records), dtype=np.intp)
+    return ranks
+
+
+def _top_k_indices(scores: np.ndarray, matched: np.ndarray, tool_id_ranks: np.ndarray, top_k: int) -> np.ndarray:
+    indices = np.flatnonzero(matched)
+    if len(indices) > top_k:
+        candidate_scores = scores[indices]
+        kth = np.partition(candidate_scores, len(indices) - top_k)[len(indices) - top_k]
+        # keep every tie with the k-th score so the tool_id tie-break below stays exact
+        indices = indices[candidate_scores >= kth]
+    order = np.lexsort((tool_id_ranks[indices], -scores[indices]))
+    return indices[order[:top_k]]
+
+
+def _tool_scores(
+    records: Sequence[ToolRecord], indices: np.ndarray, scores: np.ndarray, reason: str
+) -> list[ToolScore]:
+    return [
+        ToolScore(tool_id=records[index].tool_id, score=score, reason=reason)
+        for index, score in zip(indices.tolist(), scores.tolist(), strict=True)
+    ]
+
+
+def _kth_largest(scores: np.ndarray, k: int) -> float:
+    if len(scores) < k:
+        return 0.0
+    return float(np.partition(scores, len(scores) - k)[len(scores) - k])
+
+
+def _group_mask(groups: Sequence[GroupName]) -> np.ndarray:
+    mask = np.zeros(len(GroupId), dtype=np.bool_)
+    for group in groups:
+        group_id = GROUP_IDS.get(group)
+        if group_id is not None:
+            mask[group_id] = True
+    return mask
 
 
 @dataclass(slots=True)
@@ -112,34 +303,32 @@ class HybridRetriever:
     semantic: SemanticRetriever = field(init=False)
 
     def __post_init__(self) -> None:
-        self.lexical = LexicalRetriever(self.records)
-        self.semantic = SemanticRetriever(self.records)
+        tokens = _precompute_tokens(self.records)
+        self.lexical = LexicalRetriever(self.records, tokens_cache=tokens)
+        self.semantic = SemanticRetriever(self.records, tokens_cache=tokens)
 
     def search(self, query: str, groups: Sequence[GroupName] | None = None, top_k: int = 12) -> list[ToolScore]:
+        if top_k <= 0 or not self.records:
+            return []
         pool = max(top_k * 3, top_k)
-        lexical_scores = self.lexical.search(query=query, groups=groups, top_k=pool)
-        semantic_scores = self.semantic.search(query=query, groups=groups, top_k=pool)
+        lexical_indices, lexical_scores = self.lexical.ranked(query=query, groups=groups, top_k=pool)
+        semantic_indices, semantic_scores = self.semantic.ranked(query=query, groups=groups, top_k=pool)
 
-        by_id: dict[str, float] = {}
-        lexical_norm = _normalize(lexical_scores)
-        semantic_norm = _normalize(semantic_scores)
-
-        for score in lexical_scores:
-            by_id[score.tool_id] = by_id.get(score.tool_id, 0.0) + (
-                self.lexical_weight * lexical_norm.get(score.tool_id, 0.0)
-            )
-        for score in semantic_scores:
-            by_id[score.tool_id] = by_id.get(score.tool_id, 0.0) + (
-                self.semantic_weight * semantic_norm.get(score.tool_id, 0.0)
-            )
+        merged = np.zeros(len(self.records), dtype=np.float64)
+        matched = np.zeros(len(self.records), dtype=np.bool_)
+        merged[lexical_indices] += self.lexical_weight * _normalize(lexical_scores)
+        merged[semantic_indices] += self.semantic_weight * _normalize(semantic_scores)
+        matched[lexical_indices] = True
+        matched[semantic_indices] = True
 
-        merged = [ToolScore(tool_id=tool_id, score=value, reason="hybrid") for tool_id, value in by_id.items()]
-        merged.sort(key=lambda item: (-item.score, item.tool_id))
-        return merged[:top_k]
+        indices = _top_k_indices(merged, matched, self.lexical._tool_id_ranks, top_k)
+        return _tool_scores(self.records, indices, merged[indices], "hybrid")
 
 
-def _normalize(scores: Sequence[ToolScore]) -> dict[str, float]:
-    max_score = max((item.score for item in scores), default=0.0)
+def _normalize(scores: np.ndarray) -> np.ndarray:
+    if len(scores) == 0:
+        return scores
+    max_score = scores.max()
     if max_score <= 0:
-        return {item.tool_id: 0.0 for item in scores}
-    return {item.tool_id: item.score / max_score for item in scores}
+        return np.zeros_like(scores)
+    return scores / max_score
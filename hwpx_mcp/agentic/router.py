@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from .models import GroupName, GroupRoute, ToolRecord, ToolScore
 from .retrieval import HybridRetriever
@@ -11,27 +12,35 @@ class HierarchicalRouter:
     group_top_k: int = 1
     tool_top_k: int = 8
     _retriever: HybridRetriever = field(init=False)
+    _by_id: dict[str, ToolRecord] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._retriever = HybridRetriever(self.records)
+        self._by_id = {record.tool_id: record for record in self.records}
 
     def route_group(self, query: str) -> GroupRoute:
         candidates = self._retriever.search(query=query, groups=None, top_k=max(self.tool_top_k, 12))
         if not candidates:
             return GroupRoute(group="other", reason="no matching tools", confidence=0.0)
 
-        score_by_group: dict[GroupName, float] = {}
+        score_by_group: defaultdict[GroupName, float] = defaultdict(float)
         for candidate in candidates:
-            record = self._get_record(candidate.tool_id)
+            record = self._by_id.get(candidate.tool_id)
             if record:
-                score_by_group[record.group] = score_by_group.get(record.group, 0.0) + candidate.score
+                score_by_group[record.group] += candidate.score
 
         if not score_by_group:
             return GroupRoute(group="other", reason="empty score map", confidence=0.0)
 
-        selected_group = max(score_by_group.items(), key=lambda item: item[1])[0]
-        total_score = score_by_group[selected_group]
-        confidence = total_score / (sum(score_by_group.values()) or 1.0)
+        selected_group: GroupName = "other"
+        best_score = float("-inf")
+        total = 0.0
+        for group, score in score_by_group.items():
+            total += score
+            if score > best_score:
+                selected_group = group
+                best_score = score
+        confidence = best_score / (total or 1.0)
         return GroupRoute(
             group=selected_group,
             reason=f"top aggregated score from {len(candidates)} candidates",
@@ -44,9 +53,3 @@ class HierarchicalRouter:
             selected_group = self.route_group(query).group
         limit = top_k if top_k is not None else self.tool_top_k
         return self._retriever.search(query=query, groups=[selected_group], top_k=limit)
-
-    def _get_record(self, tool_id: str) -> ToolRecord | None:
-        for record in self.records:
-            if record.tool_id == tool_id:
-                return record
-        return None
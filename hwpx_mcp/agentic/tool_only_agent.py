@@ -17,6 +17,12 @@ from langgraph.graph import StateGraph
 
 from .gateway import AgenticGateway
 from .gateway import BackendServer
+from .message_features import MESSAGE_FEATURE_TOKENS
+from .message_features import MessageFeature
+from .message_features import ToolNameTraits
+from .message_features import build_message_feature_scanner
+from .message_features import extract_quoted_text
+from .message_features import tool_name_traits
 from .models import JsonValue
 
 CaseName = Literal[
@@ -57,6 +63,7 @@ class AgentState(TypedDict, total=False):
     message: str
     session_id: str
     tools_by_name: dict[str, str]
+    tool_traits: ToolNameTraits
     case: CaseName
     intent: IntentName
     subagent: SubagentName
@@ -68,64 +75,20 @@ class AgentState(TypedDict, total=False):
     error: str
 
 
-def _extract_quoted_text(message: str) -> str | None:
-    match = re.search(r'"([^"]+)"', message)
-    if match:
-        return match.group(1).strip()
-    match = re.search(r"'([^']+)'", message)
-    if match:
-        return match.group(1).strip()
-    return None
-
-
-def _contains_any(text: str, tokens: tuple[str, ...]) -> bool:
-    return any(token in text for token in tokens)
-
-
-def _has_table_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("table", "표", "테이블", "셀", "cell", "행"),
-    )
-
-
-def _has_field_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("field", "필드", "누름틀", "입력란"),
-    )
-
-
-def _has_template_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("template", "템플릿", "목록", "list", "search", "검색"),
-    )
-
+_SEARCH_TOKEN_PATTERN = re.compile(r"[\w가-힣]+")
 
-def _has_edit_keywords(lowered: str) -> bool:
-    return _contains_any(
-        lowered,
-        ("open", "열", "불러", "수정", "편집", "변경", "update", "edit"),
-    )
-
-
-def _looks_like_document_target(message: str) -> bool:
-    quoted = _extract_quoted_text(message)
-    if isinstance(quoted, str) and quoted.lower().endswith((".hwp", ".hwpx")):
-        return True
-    lowered = message.lower()
-    return _contains_any(
-        lowered, (".hwp", ".hwpx", "기존 문서", "문서 수정", "공식문서")
-    )
 
+# This agent also treats "공식문서" (official document) as a document target
+TOOL_ONLY_MESSAGE_FEATURE_TOKENS: dict[MessageFeature, tuple[str, ...]] = {
+    **MESSAGE_FEATURE_TOKENS,
+    "document_target": MESSAGE_FEATURE_TOKENS["document_target"] + ("공식문서",),
+}
 
-def _looks_like_search_request(lowered: str) -> bool:
-    return _contains_any(lowered, ("find", "search", "찾기", "검색"))
+_message_features = build_message_feature_scanner(TOOL_ONLY_MESSAGE_FEATURE_TOKENS)
 
 
 def _extract_document_path(message: str) -> str | None:
-    quoted = _extract_quoted_text(message)
+    quoted = extract_quoted_text(message)
     if isinstance(quoted, str) and quoted.lower().endswith((".hwp", ".hwpx")):
         return quoted
     match = re.search(r"([^\s]+\.(?:hwp|hwpx))", message, re.IGNORECASE)
@@ -174,76 +137,57 @@ def _extract_insert_text(message: str) -> str | None:
 
 
 def _parse_intent(message: str) -> IntentName:
-    lowered = message.lower()
-    if any(token in lowered for token in ("status", "ping", "상태", "헬스")):
+    features = _message_features(message.lower())
+    if "status" in features:
         return "status"
-    if any(
-        token in lowered for token in ("capability", "capabilities", "지원", "가능")
-    ):
+    if "capabilities" in features:
         return "capabilities"
-    if _looks_like_search_request(lowered):
+    if "search" in features:
         return "search"
-    if _has_field_keywords(lowered):
+    if "field" in features:
         return "field_form"
-    if _has_table_keywords(lowered):
+    if "table" in features:
         return "table"
-    if "양식" in lowered and (
-        _has_table_keywords(lowered) or _has_field_keywords(lowered)
-    ):
-        return "table" if _has_table_keywords(lowered) else "field_form"
-    if _looks_like_document_target(message) and (
-        _has_edit_keywords(lowered) or _extract_quoted_text(message) is not None
-    ):
+    quoted = extract_quoted_text(message)
+    document_target = "document_target" in features or (
+        quoted is not None and quoted.lower().endswith((".hwp", ".hwpx"))
+    )
+    if document_target and ("edit" in features or quoted is not None):
         return "open_document"
-    if any(token in lowered for token in ("template", "템플릿")):
+    if "template" in features:
         return "template"
-    if "양식" in lowered and _has_template_keywords(lowered):
+    if "form" in features and "template_hint" in features:
         return "template"
-    if any(token in lowered for token in ("export pdf", "pdf", "내보내기")):
+    if "export_pdf" in features:
         return "export_pdf"
-    if any(token in lowered for token in ("save", "저장")):
+    if "save" in features:
         return "save"
-    if _looks_like_search_request(lowered):
-        return "search"
-    if any(token in lowered for token in ("insert", "write", "작성", "추가", "입력")):
+    if "insert" in features:
         return "insert_text"
-    if any(
-        token in lowered for token in ("create", "new", "문서 생성", "새 문서", "만들")
-    ):
+    if "create" in features:
         return "create"
     return "unknown"
 
 
-def _detect_case(message: str, tool_names: set[str]) -> CaseName:
-    lowered = message.lower()
-    has_windows = any(name.startswith("hwp_windows_") for name in tool_names)
-    has_templates = "hwp_list_templates" in tool_names
-    has_hwpx = "hwp_create_hwpx" in tool_names
-    has_doc_ops = any(
-        name in tool_names for name in ("hwp_create", "hwp_insert_text", "hwp_save")
-    )
-    has_xml_only = bool(tool_names) and all(
-        ("xml" in name) or ("xpath" in name) or ("smart_patch" in name)
-        for name in tool_names
-    )
-
+def _detect_case(message: str, traits: ToolNameTraits) -> CaseName:
+    features = _message_features(message.lower())
     if (
         (
-            any(token in lowered for token in ("template", "템플릿"))
-            or ("양식" in lowered and _has_template_keywords(lowered))
+            "template" in features
+            or ("form" in features and "template_hint" in features)
         )
-        and not _has_table_keywords(lowered)
-        and not _has_field_keywords(lowered)
-        and has_templates
+        and "table" not in features
+        and "field" not in features
+        and traits.has_templates
     ):
         return "template_workflow"
-    if has_windows:
+    if traits.has_windows:
         return "windows_com_full"
-    if has_xml_only:
+    if traits.xml_only:
         return "query_analyze_only"
-    if has_hwpx:
+    if traits.has_hwpx:
         return "cross_platform_hwpx"
-    if has_doc_ops:
+    if traits.has_doc_ops:
         return "no_document_context"
     return "degraded_recovery"
 
@@ -256,6 +200,9 @@ class ToolOnlyAgent:
     _tool_callables: dict[str, Callable[..., object]] = field(
         default_factory=dict, init=False, repr=False
     )
+    _tool_callables_source: tuple[tuple[str, object], ...] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self._gateway = AgenticGateway(self.backend_server)
@@ -323,16 +270,21 @@ class ToolOnlyAgent:
 
     async def _node_prepare(self, state: AgentState) -> AgentState:
         await self._gateway.refresh_registry()
-        self._tool_callables = self._collect_tool_callables()
+        self._refresh_tool_callables()
         tools_by_name = {
             record.name: record.tool_id for record in self._gateway.registry
         }
-        return {"tools_by_name": tools_by_name}
+        return {
+            "tools_by_name": tools_by_name,
+            "tool_traits": tool_name_traits(tools_by_name.keys()),
+        }
 
     async def _node_classify(self, state: AgentState) -> AgentState:
-        tools_by_name = state.get("tools_by_name", {})
+        traits = state.get("tool_traits") or tool_name_traits(
+            state.get("tools_by_name", {}).keys()
+        )
         message = state.get("message", "")
-        case = _detect_case(message, set(tools_by_name.keys()))
+        case = _detect_case(message, traits)
         intent = _parse_intent(message)
         return {"case": case, "intent": intent}
 
@@ -381,7 +333,7 @@ class ToolOnlyAgent:
     async def _document_agent(self, state: AgentState) -> AgentState:
         intent = state.get("intent", "unknown")
         message = state.get("message", "")
-        text_payload = _extract_quoted_text(message)
+        text_payload = extract_quoted_text(message)
 
         if intent == "open_document":
             return await self._handle_existing_document_edit(state, message)
@@ -524,10 +476,10 @@ class ToolOnlyAgent:
 
     async def _search_agent(self, state: AgentState) -> AgentState:
         message = state.get("message", "")
-        keyword = _extract_quoted_text(message)
+        keyword = extract_quoted_text(message)
         if not keyword:
             tokens = [
-                token for token in re.findall(r"[\w가-힣]+", message) if len(token) > 1
+                token for token in _SEARCH_TOKEN_PATTERN.findall(message) if len(token) > 1
             ]
             keyword = tokens[-1] if tokens else ""
 
@@ -622,15 +574,33 @@ class ToolOnlyAgent:
             "reply": "현재 케이스에서 실행 가능한 툴이 없습니다.",
         }
 
-    def _collect_tool_callables(self) -> dict[str, Callable[..., object]]:
+    def _refresh_tool_callables(self) -> None:
+        raw_tools = self._raw_tool_map()
+        if raw_tools is None:
+            self._tool_callables = {}
+            self._tool_callables_source = None
+            return
+
+        source = tuple(raw_tools.items())
+        if source == self._tool_callables_source:
+            return
+        self._tool_callables = self._collect_tool_callables(raw_tools)
+        self._tool_callables_source = source
+
+    def _raw_tool_map(self) -> Mapping[str, object] | None:
         tool_manager = getattr(self.backend_server, "_tool_manager", None)
         if not tool_manager:
-            return {}
+            return None
 
         raw_tools = getattr(tool_manager, "_tools", None)
         if not isinstance(raw_tools, Mapping):
-            return {}
+            return None
+        return raw_tools
 
+    @staticmethod
+    def _collect_tool_callables(
+        raw_tools: Mapping[str, object],
+    ) -> dict[str, Callable[..., object]]:
         callables: dict[str, Callable[..., object]] = {}
         for name, entry in raw_tools.items():
             function = getattr(entry, "fn", None)
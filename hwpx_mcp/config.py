@@ -9,10 +9,22 @@ supporting multiple transport modes (stdio, http, sse, streamable-http).
 
 import os
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Literal, Optional, get_args
 
 TransportType = Literal["stdio", "http", "sse", "streamable-http"]
 
+_VALID_TRANSPORTS: frozenset[str] = frozenset(get_args(TransportType))
+_VALID_TRANSPORTS_STR = ", ".join(get_args(TransportType))
+_HTTP_TRANSPORTS: frozenset[str] = _VALID_TRANSPORTS - {"stdio"}
+
+
+def _validate_transport(transport: str) -> None:
+    if transport not in _VALID_TRANSPORTS:
+        raise ValueError(
+            f"Invalid MCP_TRANSPORT: '{transport}'. "
+            f"Must be one of: {_VALID_TRANSPORTS_STR}"
+        )
+
 
 @dataclass
 class ServerConfig:
@@ -43,12 +55,7 @@ class ServerConfig:
 
     def __post_init__(self):
         """Validate configuration after initialization."""
-        valid_transports = ("stdio", "http", "sse", "streamable-http")
-        if self.transport not in valid_transports:
-            raise ValueError(
-                f"Invalid MCP_TRANSPORT: '{self.transport}'. "
-                f"Must be one of: {', '.join(valid_transports)}"
-            )
+        _validate_transport(self.transport)
 
         if self.port < 1 or self.port > 65535:
             raise ValueError(
@@ -57,7 +64,7 @@ class ServerConfig:
 
     def is_http_transport(self) -> bool:
         """Check if the configured transport is HTTP-based."""
-        return self.transport in ("http", "sse", "streamable-http")
+        return self.transport in _HTTP_TRANSPORTS
 
     def get_run_kwargs(self) -> dict:
         """Get kwargs for mcp.run() based on configuration.
@@ -86,13 +93,45 @@ class ServerConfig:
         )
 
 
+_CONFIG: Optional[ServerConfig] = None
+
+
 def get_config() -> ServerConfig:
     """Get the server configuration from environment variables.
 
+    The environment is read on the first call and the resulting
+    configuration is reused afterwards; call reset_config() to reload it.
+
     Returns:
         ServerConfig: The loaded configuration
 
     Raises:
         ValueError: If configuration is invalid
     """
-    return ServerConfig()
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = ServerConfig()
+    return _CONFIG
+
+
+def get_transport() -> TransportType:
+    """Get only the transport type from the environment.
+
+    Unlike get_config(), HTTP-only settings such as MCP_PORT are not read,
+    so a stdio-only entry point is not broken by them.
+
+    Returns:
+        TransportType: The validated MCP_TRANSPORT value
+
+    Raises:
+        ValueError: If MCP_TRANSPORT is invalid
+    """
+    transport = os.getenv("MCP_TRANSPORT", "stdio")
+    _validate_transport(transport)
+    return transport
+
+
+def reset_config() -> None:
+    """Drop the cached configuration so the next get_config() re-reads the environment."""
+    global _CONFIG
+    _CONFIG = None
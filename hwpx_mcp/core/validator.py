@@ -3,12 +3,25 @@ XML Validator for HWPX content.
 Supports both XSD schema validation and Pydantic model validation.
 """
 
-from typing import Optional, Union, Any, Type
-import xmlschema
+import io
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple, Union, Any, Type
 from lxml import etree
 from pydantic_xml import BaseXmlModel
 from .xml_parser import SecureXmlParser
 
+if TYPE_CHECKING:
+    import xmlschema
+
+
+@lru_cache(maxsize=8)
+def _load_schema(xsd_path: str) -> "xmlschema.XMLSchema":
+    """Compile an XSD once per path; validators sharing a path share the schema."""
+    # xmlschema is slow to import and only needed once an XSD is configured
+    import xmlschema
+
+    return xmlschema.XMLSchema(xsd_path)
+
 
 class XmlValidator:
     """
@@ -20,15 +33,17 @@ class XmlValidator:
         Initialize validator.
 
         Args:
-            xsd_path: Path to OWPML XSD file (optional)
+            xsd_path: Path to OWPML XSD file (optional). The compiled schema
+                is cached per path and shared between validators.
         """
-        self.schema: Optional[xmlschema.XMLSchema] = None
+        self.schema: Optional["xmlschema.XMLSchema"] = None
         if xsd_path:
             try:
-                self.schema = xmlschema.XMLSchema(xsd_path)
+                self.schema = _load_schema(xsd_path)
             except Exception as e:
                 # Log error but don't fail initialization
                 print(f"Warning: Failed to load XSD from {xsd_path}: {e}")
+        self._has_schema = self.schema is not None
 
     def validate_syntax(self, xml_content: Union[str, bytes]) -> bool:
         """
@@ -40,23 +55,61 @@ class XmlValidator:
         except Exception:
             return False
 
-    def validate_schema(self, xml_content: Union[str, bytes]) -> bool:
+    def validate_schema(
+        self, xml_content: Union[str, bytes, etree._Element]
+    ) -> bool:
         """
         Validate against loaded XSD schema.
         Returns True if no schema is loaded (pass-through).
+        Accepts an already parsed element to avoid parsing the content again.
         """
-        if not self.schema:
+        if not self._has_schema:
             return True
 
         try:
-            # xmlschema works with string/file, not lxml objects directly usually
-            # Convert bytes to string if needed
-            content = (
-                xml_content
-                if isinstance(xml_content, str)
-                else xml_content.decode("utf-8")
-            )
-            return self.schema.is_valid(content)
+            if isinstance(xml_content, bytes):
+                # Hand bytes over as a stream instead of decoding a copy
+                return self.schema.is_valid(io.BytesIO(xml_content))
+            return self.schema.is_valid(xml_content)
+        except Exception:
+            return False
+
+    def validate_all(self, xml_content: Union[str, bytes]) -> Tuple[bool, bool]:
+        """
+        Check syntax and schema on a single parse.
+
+        Returns:
+            (syntax_ok, schema_ok); schema_ok is False whenever syntax_ok is.
+        """
+        try:
+            root = SecureXmlParser.parse_string(xml_content)
+        except Exception:
+            return False, False
+        return True, self.validate_schema(root)
+
+    def validate(
+        self,
+        xml_content: Union[str, bytes],
+        model_class: Optional[Type[BaseXmlModel]] = None,
+    ) -> bool:
+        """
+        Run syntax, schema and (optionally) model validation on one parse.
+
+        The content is parsed once with SecureXmlParser; the resulting tree
+        is reused for the XSD check and the Pydantic-XML model check.
+        """
+        try:
+            root = SecureXmlParser.parse_string(xml_content)
+        except Exception:
+            return False
+
+        if not self.validate_schema(root):
+            return False
+        if model_class is None:
+            return True
+        try:
+            model_class.from_xml_tree(root)
+            return True
         except Exception:
             return False
 
@@ -68,7 +121,7 @@ class XmlValidator:
         Validate if XML matches a Pydantic-XML model structure.
         """
         try:
-            model_class.from_xml(xml_content)
+            model_class.from_xml_tree(SecureXmlParser.parse_string(xml_content))
             return True
         except Exception:
             return False
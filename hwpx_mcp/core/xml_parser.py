@@ -1,16 +1,44 @@
 """
 Secure XML Parser for HWPX (OWPML) processing.
-Uses defusedxml to prevent XML attacks (XXE, Billion Laughs).
+Hardened lxml parsing against XML attacks (XXE, Billion Laughs), following
+defusedxml's rules: entities are never resolved and entity declarations
+are rejected with defusedxml.EntitiesForbidden.
 """
 
+import threading
 from typing import Union, Dict
 from lxml import etree
-import defusedxml.lxml as safe_lxml
+from defusedxml import EntitiesForbidden
+
+_PARSER_LOCAL = threading.local()
+
+
+def _get_parser() -> etree.XMLParser:
+    """Return this thread's hardened parser, creating it on first use."""
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(
+            resolve_entities=False,
+            no_network=True,
+            load_dtd=False,
+            huge_tree=False,
+        )
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+def _reject_entity_declarations(tree: etree._ElementTree) -> None:
+    docinfo = tree.docinfo
+    for dtd in (docinfo.internalDTD, docinfo.externalDTD):
+        if dtd is None:
+            continue
+        for entity in dtd.iterentities():
+            raise EntitiesForbidden(entity.name, entity.content, None, None, None, None)
 
 
 class SecureXmlParser:
     """
-    Secure XML parser wrapper using defusedxml.
+    Secure XML parser wrapper with a reusable, hardened lxml parser.
     Provides standard OWPML namespace mappings.
     """
 
@@ -37,8 +65,10 @@ class SecureXmlParser:
         Returns:
             lxml Element object (root)
         """
-        # defusedxml automatically disables DTDs and entities
-        return safe_lxml.fromstring(xml_content)
+        # Entities stay unresolved; documents declaring any are rejected
+        root = etree.fromstring(xml_content, _get_parser())
+        _reject_entity_declarations(root.getroottree())
+        return root
 
     @staticmethod
     def parse_file(file_path: str) -> etree._Element:
@@ -51,13 +81,30 @@ class SecureXmlParser:
         Returns:
             lxml Element object (root)
         """
-        # safe_lxml.parse returns an ElementTree, we usually want the root Element
-        tree = safe_lxml.parse(file_path)
+        # etree.parse returns an ElementTree, we usually want the root Element
+        tree = etree.parse(file_path, _get_parser())
+        _reject_entity_declarations(tree)
         return tree.getroot()
 
     @staticmethod
-    def to_string(element: etree._Element, pretty_print: bool = False) -> str:
+    def to_bytes(
+        element: etree._Element,
+        pretty_print: bool = False,
+        xml_declaration: bool = False,
+    ) -> bytes:
+        """
+        Convert Element to UTF-8 bytes, for file writes and HTTP bodies.
+        """
+        return etree.tostring(
+            element,
+            encoding="utf-8",
+            pretty_print=pretty_print,
+            xml_declaration=xml_declaration,
+        )
+
+    @classmethod
+    def to_string(cls, element: etree._Element, pretty_print: bool = False) -> str:
         """
         Convert Element back to string.
         """
-        return etree.tostring(element, encoding="unicode", pretty_print=pretty_print)
+        return cls.to_bytes(element, pretty_print).decode("utf-8")
@@ -2,32 +2,36 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TypedDict
 
+import orjson
+
 from hwpx_mcp.agentic.gateway import AgenticGateway
 from hwpx_mcp.agentic.gateway import BackendServer
-from hwpx_mcp.agentic.models import GROUP_NAMES
+from hwpx_mcp.agentic.models import GROUP_NAME_SET
 from hwpx_mcp.agentic.models import GroupName
 
 
 class QueryRow(TypedDict, total=False):
     query: str
     expected_group: GroupName
-    expected_tools: list[str]
+    expected_tools: frozenset[str]
+
+
+DEFAULT_EVAL_CONCURRENCY = 32
 
 
-def load_queries(path: Path) -> list[QueryRow]:
-    rows: list[QueryRow] = []
-    with path.open("r", encoding="utf-8") as file:
+def iter_queries(path: Path) -> Iterator[QueryRow]:
+    with path.open("rb") as file:
         for line in file:
             stripped = line.strip()
             if stripped:
-                raw = json.loads(stripped)
+                raw = orjson.loads(stripped)
                 if isinstance(raw, dict):
-                    rows.append(_to_query_row(raw))
-    return rows
+                    yield _to_query_row(raw)
 
 
 def _to_query_row(raw: dict[object, object]) -> QueryRow:
@@ -37,52 +41,60 @@ def _to_query_row(raw: dict[object, object]) -> QueryRow:
         row["query"] = query
 
     expected_group = raw.get("expected_group")
-    if isinstance(expected_group, str) and expected_group in GROUP_NAMES:
+    if isinstance(expected_group, str) and expected_group in GROUP_NAME_SET:
         row["expected_group"] = expected_group
 
     expected_tools_raw = raw.get("expected_tools")
     if isinstance(expected_tools_raw, list):
-        expected_tools = [item for item in expected_tools_raw if isinstance(item, str)]
-        row["expected_tools"] = expected_tools
+        row["expected_tools"] = frozenset(item for item in expected_tools_raw if isinstance(item, str))
     return row
 
 
-async def evaluate(queries_path: Path, top_k: int) -> dict[str, float | int]:
+async def evaluate(
+    queries_path: Path,
+    top_k: int,
+    concurrency: int = DEFAULT_EVAL_CONCURRENCY,
+) -> dict[str, float | int]:
     backend_mcp = _load_backend_mcp()
     gateway = AgenticGateway(backend_mcp)
     _ = await gateway.refresh_registry()
 
-    queries = load_queries(queries_path)
-    group_hits = 0
-    tool_hits = 0
-
-    for row in queries:
-        query = row.get("query", "")
-        expected_group = row.get("expected_group")
-        expected_tools = set(row.get("expected_tools", []))
-
-        routed = await gateway.tool_search(query=query, k=top_k)
-        route = routed.get("route")
-        routed_group = route.get("group") if isinstance(route, dict) else None
-        if expected_group and routed_group == expected_group:
-            group_hits += 1
-
-        found_tools: set[str] = set()
-        results = routed.get("results")
-        if isinstance(results, list):
-            for item in results:
-                if isinstance(item, dict):
-                    name = item.get("name")
-                    if isinstance(name, str):
-                        found_tools.add(name)
-        if expected_tools.intersection(found_tools):
-            tool_hits += 1
-
-    total = len(queries) or 1
+    rows = iter_queries(queries_path)
+    counts: Counter[str] = Counter()
+
+    async def _worker() -> None:
+        for row in rows:
+            counts["queries"] += 1
+            query = row.get("query", "")
+            expected_group = row.get("expected_group")
+            expected_tools = row.get("expected_tools", frozenset())
+
+            routed = await gateway.tool_search(query=query, k=top_k)
+            route = routed.get("route")
+            routed_group = route.get("group") if isinstance(route, dict) else None
+            if expected_group and routed_group == expected_group:
+                counts["group_hits"] += 1
+
+            results = routed.get("results")
+            found_tools = (
+                {
+                    item["name"]
+                    for item in results
+                    if isinstance(item, dict) and isinstance(item.get("name"), str)
+                }
+                if isinstance(results, list)
+                else set()
+            )
+            if not expected_tools.isdisjoint(found_tools):
+                counts["tool_hits"] += 1
+
+    _ = await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+
+    total = counts["queries"] or 1
     return {
-        "queries": len(queries),
-        "group_accuracy": group_hits / total,
-        "tool_recall_at_k": tool_hits / total,
+        "queries": counts["queries"],
+        "group_accuracy": counts["group_hits"] / total,
+        "tool_recall_at_k": counts["tool_hits"] / total,
         "top_k": top_k,
     }
 
@@ -101,10 +113,13 @@ def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--queries", default="hwpx_mcp/eval/queries.jsonl")
     parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_EVAL_CONCURRENCY)
     args = parser.parse_args()
 
-    metrics = asyncio.run(evaluate(Path(args.queries), int(args.top_k)))
-    print(json.dumps(metrics, ensure_ascii=False, indent=2))
+    metrics = asyncio.run(
+        evaluate(Path(args.queries), int(args.top_k), int(args.concurrency))
+    )
+    print(orjson.dumps(metrics, option=orjson.OPT_INDENT_2).decode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -3,9 +3,31 @@ High-performance XPath query engine for HWPX documents.
 Leverages lxml's C-based XPath 1.0 engine.
 """
 
-from typing import List, Union
+import copy
+import io
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Union
 from lxml import etree
-from ..core.xml_parser import SecureXmlParser
+from ..core.xml_parser import SecureXmlParser, _reject_entity_declarations
+from ..models.owpml import TAG_HP_P, TAG_HP_T, TAG_HP_TABLE
+
+
+@lru_cache(maxsize=256)
+def _compile(xpath_query: str) -> etree.XPath:
+    """Compile an XPath expression once with the OWPML namespace map."""
+    return etree.XPath(xpath_query, namespaces=SecureXmlParser.NS_MAP)
+
+
+# 1mm = 283.465 HwpUnit
+_MM_TO_HU = 283.465
+
+# Fixed finder queries; thresholds and keywords are bound as XPath variables.
+_LARGE_TABLES = _compile(".//hp:table[@rowCnt >= $min_rows]")
+_IMAGES_BY_SIZE = _compile(".//hp:pic/hc:sz[@width >= $width and @height >= $height]/..")
+_TEXT_CONTAINING = _compile(".//hp:t[contains(., $keyword)]")
+_SECTION_PARAGRAPHS = _compile("./hp:p")
+_PARAGRAPH_TEXTS = _compile("./hp:run/hp:t[1]")
 
 
 class HwpxQueryEngine:
@@ -27,7 +49,7 @@ class HwpxQueryEngine:
         Returns:
             List of matches (elements, strings, etc.)
         """
-        return element.xpath(xpath_query, namespaces=SecureXmlParser.NS_MAP)
+        return _compile(xpath_query)(element)
 
     @staticmethod
     def find_large_tables(
@@ -41,8 +63,7 @@ class HwpxQueryEngine:
             min_rows: Minimum row count
         """
         # hp:table has 'rowCnt' attribute
-        xpath = f".//hp:table[@rowCnt >= {min_rows}]"
-        return element.xpath(xpath, namespaces=SecureXmlParser.NS_MAP)
+        return _LARGE_TABLES(element, min_rows=min_rows)
 
     @staticmethod
     def find_images_by_size(
@@ -52,19 +73,11 @@ class HwpxQueryEngine:
         Find images larger than specified dimensions.
         Note: HWPX stores dimensions in HwpUnit (1mm ~ 283.465 HU)
         """
-        # 1mm = 283.465 HwpUnit
-        w_hu = int(min_width_mm * 283.465)
-        h_hu = int(min_height_mm * 283.465)
-
-        # hp:pic -> hp:shapeObject -> hp:sz (width, height)
-        # Structure is <hp:pic ...> <hp:sz width="..." height="..." /> </hp:pic>
-        # Need to check hp:sz child of hp:pic/hp:shapeObject ??
-        # Actually hp:pic is inside hp:run. Picture properties are in hp:pic itself or children.
-        # Simple query for hp:pic first.
-        # <hp:pic> usually has <hc:sz width=".." height="..">
+        w_hu = int(min_width_mm * _MM_TO_HU)
+        h_hu = int(min_height_mm * _MM_TO_HU)
 
-        xpath = f".//hp:pic/hc:sz[@width >= {w_hu} and @height >= {h_hu}]/.."
-        return element.xpath(xpath, namespaces=SecureXmlParser.NS_MAP)
+        # <hp:pic> (inside hp:run) carries its size as <hc:sz width=".." height="..">
+        return _IMAGES_BY_SIZE(element, width=w_hu, height=h_hu)
 
     @staticmethod
     def find_text_containing(
@@ -72,9 +85,107 @@ class HwpxQueryEngine:
     ) -> List[etree._Element]:
         """
         Find text runs (<hp:t>) containing specific keyword.
+        For very large documents see iter_text_matches.
+        """
+        # XPath 1.0 contains() on the full string value, so text after inline
+        # children (<hp:tab/>, <hp:lineBreak/>) matches too; the keyword is
+        # bound as a variable, so quotes in it need no escaping.
+        return _TEXT_CONTAINING(element, keyword=keyword)
+
+    @staticmethod
+    def iter_text_matches(
+        source: Union[str, bytes, Path, IO[bytes]],
+        keyword: str,
+        limit: Optional[int] = None,
+    ) -> Iterator[etree._Element]:
+        """
+        Stream text runs (<hp:t>) containing keyword without building the tree.
+
+        Prefer this over find_text_containing for very large documents or when
+        only the first few hits (or mere existence) matter: processed elements
+        are discarded as parsing proceeds and parsing stops once limit matches
+        have been yielded.
+
+        Args:
+            source: File path, file object, or XML content as str/bytes
+            keyword: Substring to look for in the element text
+            limit: Maximum number of matches to yield (None for all)
+
+        Yields:
+            Detached copies of the matching <hp:t> elements
+        """
+        if limit is not None and limit <= 0:
+            return
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        elif isinstance(source, str) and source.lstrip().startswith("<"):
+            source = io.BytesIO(source.encode("utf-8"))
+
+        # Same hardening as SecureXmlParser: no entity resolution, DTD loading
+        # or network access, and entity declarations are rejected below
+        events = etree.iterparse(
+            source,
+            events=("end",),
+            tag=TAG_HP_T,
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
+        )
+        found = 0
+        checked_dtd = False
+        for _, elem in events:
+            if not checked_dtd:
+                # The DTD precedes the root, so it is complete by the first event
+                _reject_entity_declarations(elem.getroottree())
+                checked_dtd = True
+            if keyword in "".join(elem.itertext()):
+                yield copy.deepcopy(elem)
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+            elem.clear(keep_tail=True)
+            # Drop finished siblings at every level so the partial tree stays small
+            node = elem
+            parent = node.getparent()
+            while parent is not None:
+                while node.getprevious() is not None:
+                    del parent[0]
+                node, parent = parent, parent.getparent()
+
+    @staticmethod
+    def extract_section_text(element: etree._Element) -> str:
+        """
+        Extract plain text from a section (<hs:sec>) without building models.
+
+        Produces the same text as HwpxSection.get_text(): one line per
+        top-level paragraph, joining the first <hp:t> of each run.
+        """
+        return "\n".join(
+            "".join(text.text or "" for text in _PARAGRAPH_TEXTS(paragraph))
+            for paragraph in _SECTION_PARAGRAPHS(element)
+        )
+
+    @staticmethod
+    def analyze(element: etree._Element) -> Dict[str, Union[str, int]]:
+        """
+        Collect text and structure counts in a single walk over the tree.
+
+        Cheaper than running one query per statistic on large documents.
+
+        Returns:
+            dict: { "text": str, "paragraphs": int, "tables": int }
+                text concatenates every <hp:t> text in document order;
+                paragraphs and tables include those nested in table cells.
         """
-        # XPath 1.0 contains() function
-        # Keyword needs escaping for XPath string
-        safe_keyword = keyword.replace("'", "")  # Basic sanitization
-        xpath = f".//hp:t[contains(text(), '{safe_keyword}')]"
-        return element.xpath(xpath, namespaces=SecureXmlParser.NS_MAP)
+        paragraphs = tables = 0
+        text_parts = []
+        for node in element.iter(TAG_HP_T, TAG_HP_P, TAG_HP_TABLE):
+            tag = node.tag
+            if tag == TAG_HP_T:
+                if node.text:
+                    text_parts.append(node.text)
+            elif tag == TAG_HP_P:
+                paragraphs += 1
+            else:
+                tables += 1
+        return {"text": "".join(text_parts), "paragraphs": paragraphs, "tables": tables}
@@ -1,11 +1,40 @@
 """
 Smart XML Editor for HWPX.
-Uses xmldiff to validate and filter AI-generated edits.
+Checks AI-generated edits for structural damage; xmldiff is available
+for callers that want the full edit script.
 """
 
+import copy
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
+
+from lxml import etree
 from xmldiff import main as xml_diff
 from ..core.xml_parser import SecureXmlParser
 
+# Recent validate_edits results keyed by (original digest, modified digest, full_diff)
+VALIDATION_CACHE_SIZE = 256
+_VALIDATION_CACHE: "OrderedDict[Tuple[bytes, bytes, bool], dict]" = OrderedDict()
+_VALIDATION_CACHE_LOCK = threading.Lock()
+
+# (Clark tag, Clark tags of its ancestors from the root)
+_CriticalKey = Tuple[str, Tuple[str, ...]]
+
+# Critical tag counts of recently seen documents, keyed by content digest
+CRITICAL_COUNTS_CACHE_SIZE = 32
+_CRITICAL_COUNTS_CACHE: "OrderedDict[bytes, Mapping[_CriticalKey, int]]" = OrderedDict()
+_CRITICAL_COUNTS_LOCK = threading.Lock()
+
+
+def _fingerprint(xml_content: Union[str, bytes]) -> bytes:
+    data = xml_content.encode("utf-8") if isinstance(xml_content, str) else xml_content
+    # Cache fingerprint, not a security primitive
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 class HwpxSmartEditor:
     """
     Validates XML modifications to prevent structural damage.
@@ -17,16 +46,85 @@ class HwpxSmartEditor:
     ]
 
     @classmethod
-    def validate_edits(cls, original_xml: str, modified_xml: str) -> dict:
+    def validate_edits(
+        cls, original_xml: str, modified_xml: str, full_diff: bool = False
+    ) -> dict:
         """
         Compare original and modified XML.
+
+        By default only the critical structure is compared: every critical
+        element is counted per parent path, and any count that drops in the
+        modified document (deleted or renamed element) is unsafe. Pass
+        full_diff=True to compute the complete xmldiff edit script instead.
+
+        Results are cached per content fingerprint, so re-validating the
+        same pair during iterative refinement skips parsing and diffing.
+
         Returns:
             dict: { "safe": bool, "diffs": list, "message": str }
         """
+        key = (_fingerprint(original_xml), _fingerprint(modified_xml), full_diff)
+        with _VALIDATION_CACHE_LOCK:
+            cached = _VALIDATION_CACHE.get(key)
+            if cached is not None:
+                _VALIDATION_CACHE.move_to_end(key)
+        if cached is not None:
+            # Callers own the returned dict; never hand out the cached one
+            return copy.deepcopy(cached)
+
+        result = cls._validate_uncached(original_xml, modified_xml, full_diff)
+        with _VALIDATION_CACHE_LOCK:
+            _VALIDATION_CACHE[key] = copy.deepcopy(result)
+            while len(_VALIDATION_CACHE) > VALIDATION_CACHE_SIZE:
+                _VALIDATION_CACHE.popitem(last=False)
+        return result
+
+    @classmethod
+    def _validate_uncached(
+        cls, original_xml: str, modified_xml: str, full_diff: bool
+    ) -> dict:
+        if full_diff:
+            return cls._validate_with_xmldiff(original_xml, modified_xml)
+
+        try:
+            # Parsing (security check) happens inside the cached counter
+            original_counts = _critical_tag_counts(original_xml)
+            modified_counts = _critical_tag_counts(modified_xml)
+
+            unsafe_actions = [
+                f"DeleteNode {_format_path(key)} ({count} -> {modified_counts.get(key, 0)})"
+                for key, count in original_counts.items()
+                if modified_counts.get(key, 0) < count
+            ]
+
+            if unsafe_actions:
+                return {
+                    "safe": False,
+                    "message": "Unsafe structural changes detected. Modifications rejected.",
+                    "unsafe_actions": unsafe_actions
+                }
+
+            return {
+                "safe": True,
+                "message": "Edits are structure-safe.",
+                "diffs": []
+            }
+
+        except Exception as e:
+            return {"safe": False, "message": f"Error during smart edit validation: {str(e)}"}
+
+    @classmethod
+    def _validate_with_xmldiff(cls, original_xml: str, modified_xml: str) -> dict:
         try:
             # 1. Parse validation (Security check)
-            SecureXmlParser.parse_string(original_xml)
-            SecureXmlParser.parse_string(modified_xml)
+            original_root = SecureXmlParser.parse_string(original_xml)
+            modified_root = SecureXmlParser.parse_string(modified_xml)
+
+            # Canonically equal documents have nothing to diff
+            if etree.tostring(original_root, method="c14n") == etree.tostring(
+                modified_root, method="c14n"
+            ):
+                return {"safe": True, "message": "No structural change.", "diffs": []}
 
             # 2. Calculate diff
             # xmldiff.main.diff_texts returns a list of action objects
@@ -64,3 +162,72 @@ class HwpxSmartEditor:
 
         except Exception as e:
             return {"safe": False, "message": f"Error during smart edit validation: {str(e)}"}
+
+
+_CRITICAL_CLARK_TAGS = frozenset(
+    f"{{{SecureXmlParser.NS_MAP[prefix]}}}{tag}"
+    for tag in HwpxSmartEditor.CRITICAL_TAGS
+    for prefix in ("hp", "hs")
+)
+
+
+def _critical_tag_counts(xml_content: str) -> Mapping[_CriticalKey, int]:
+    """
+    Count critical elements per (tag, ancestor tag path); cached per document.
+
+    The cache holds digests and counts, not the documents themselves, and
+    hands out read-only mappings shared between callers.
+    """
+    key = _fingerprint(xml_content)
+    with _CRITICAL_COUNTS_LOCK:
+        cached = _CRITICAL_COUNTS_CACHE.get(key)
+        if cached is not None:
+            _CRITICAL_COUNTS_CACHE.move_to_end(key)
+            return cached
+
+    counts = MappingProxyType(_count_critical_tags(xml_content))
+    with _CRITICAL_COUNTS_LOCK:
+        _CRITICAL_COUNTS_CACHE[key] = counts
+        while len(_CRITICAL_COUNTS_CACHE) > CRITICAL_COUNTS_CACHE_SIZE:
+            _CRITICAL_COUNTS_CACHE.popitem(last=False)
+    return counts
+
+
+def _count_critical_tags(xml_content: str) -> Dict[_CriticalKey, int]:
+    """
+    Count critical elements per (tag, ancestor tag path).
+
+    Tags are compared in Clark notation, so re-prefixing a namespace changes
+    no key. Paths carry no sibling indices, so inserting elements never
+    shifts the keys of existing ones; only deletions and renames lower a count.
+    """
+    root = SecureXmlParser.parse_string(xml_content)
+    counts: Counter = Counter()
+    stack: list = [(root, ())]
+    while stack:
+        element, parent_path = stack.pop()
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        if tag in _CRITICAL_CLARK_TAGS:
+            counts[(tag, parent_path)] += 1
+        path = parent_path + (tag,)
+        stack.extend((child, path) for child in element)
+    return dict(counts)
+
+
+_PREFIX_BY_NAMESPACE = {uri: prefix for prefix, uri in SecureXmlParser.NS_MAP.items()}
+
+
+def _prefixed(tag: str) -> str:
+    """Render a Clark tag with its OWPML prefix (hp:p) for messages."""
+    namespace, _, local_name = tag.rpartition("}")
+    prefix = _PREFIX_BY_NAMESPACE.get(namespace[1:])
+    if prefix:
+        return f"{prefix}:{local_name}"
+    return tag
+
+
+def _format_path(key: _CriticalKey) -> str:
+    tag, parent_path = key
+    return "".join(f"/{_prefixed(name)}" for name in parent_path + (tag,))
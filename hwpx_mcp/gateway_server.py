@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import os
 import sys
 from collections.abc import Awaitable
 from collections.abc import Callable
@@ -13,6 +12,7 @@ from typing import Protocol
 
 from hwpx_mcp.agentic.gateway import AgenticGateway
 from hwpx_mcp.agentic.gateway import BackendServer
+from hwpx_mcp.config import get_transport
 
 logger = logging.getLogger("hwpx-mcp-agentic-gateway")
 
@@ -70,7 +70,12 @@ async def route_and_call(
 
 
 def main() -> None:
-    transport = os.getenv("MCP_TRANSPORT", "stdio")
+    try:
+        transport = get_transport()
+    except ValueError as e:
+        logger.error(f"Configuration error: {e}")
+        sys.exit(1)
+
     if transport != "stdio":
         logger.error("Gateway Phase 1 supports stdio transport only.")
         sys.exit(1)
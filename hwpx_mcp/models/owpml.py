@@ -3,6 +3,7 @@ Pydantic-XML models for OWPML (HWPX) structure.
 Allows object-oriented manipulation of HWPX documents.
 """
 
+import os
 from typing import List, Optional
 from pydantic_xml import BaseXmlModel, attr, element
 
@@ -11,6 +12,13 @@ NS_HP = "http://www.hancom.co.kr/hwpml/2011/paragraph"
 NS_HS = "http://www.hancom.co.kr/hwpml/2011/section"
 NS_HC = "http://www.hancom.co.kr/hwpml/2011/core"
 
+# Clark-notation tags for lxml iter()/find()/tag comparisons
+TAG_HS_SEC = f"{{{NS_HS}}}sec"
+TAG_HP_P = f"{{{NS_HP}}}p"
+TAG_HP_RUN = f"{{{NS_HP}}}run"
+TAG_HP_T = f"{{{NS_HP}}}t"
+TAG_HP_TABLE = f"{{{NS_HP}}}table"
+
 
 class HwpxText(BaseXmlModel, tag="t", ns="hp", nsmap={"hp": NS_HP}):
     """Text content element (<hp:t>)"""
@@ -52,3 +60,21 @@ class HwpxSection(BaseXmlModel, tag="sec", ns="hs", nsmap={"hs": NS_HS, "hp": NS
     def get_text(self) -> str:
         """Extract plain text from section"""
         return "\n".join(p.get_text() for p in self.paragraphs)
+
+
+def _warmup() -> None:
+    """Round-trip a minimal section so first-call setup is paid at import."""
+    try:
+        section = HwpxSection.from_xml(
+            f'<hs:sec xmlns:hs="{NS_HS}" xmlns:hp="{NS_HP}">'
+            '<hp:p id="0"><hp:run><hp:t></hp:t></hp:run></hp:p>'
+            "</hs:sec>"
+        )
+        section.to_xml()
+    except Exception:
+        # Warmup is best-effort; real parsing reports its own errors
+        pass
+
+
+if os.getenv("HWPX_MCP_NO_WARMUP") != "1":
+    _warmup()
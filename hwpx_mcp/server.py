@@ -15,11 +15,16 @@ Model Context Protocol 서버를 통해 한글 문서 제어 기능 제공
 - macOS/Linux: pyhwp (HWP 파일 읽기) + python-hwpx (HWPX 파일 생성)
 """
 
+import copy
 import sys
 import os
 import platform
 import logging
-from typing import Optional
+import shutil
+import inspect
+import threading
+from functools import lru_cache, wraps
+from typing import Callable, Optional, Tuple, TypeVar
 from pathlib import Path
 from . import __version__
 from .core.validator import XmlValidator
@@ -34,29 +39,60 @@ logging.basicConfig(
 logger = logging.getLogger("hwp-mcp-extended")
 
 # Platform detection
-IS_WINDOWS = platform.system() == "Windows"
+PLATFORM = platform.system()
+IS_WINDOWS = PLATFORM == "Windows"
+IS_MAC = PLATFORM == "Darwin"
 
 
 def get_windows_controller():
-    if not IS_WINDOWS:
+    # Resolved once at import below; None off Windows or without pywin32
+    if _get_windows_hwp_controller is None:
         return None
-    try:
-        from hwpx_mcp.tools.windows_hwp_controller import get_hwp_controller
+    ctrl = _get_windows_hwp_controller()
+    if ctrl and not ctrl.is_hwp_running:
+        ctrl.connect()
+    return ctrl
 
-        ctrl = get_hwp_controller()
-        if ctrl and not ctrl.is_hwp_running:
-            ctrl.connect()
-        return ctrl
-    except ImportError:
-        return None
+
+def _document_tool(
+    get_controller: Callable[[], object], missing_message: str = "No document open"
+):
+    """Build a decorator for Windows tools that act on the open document.
+
+    The decorated function receives the controller as its first argument and
+    returns (success, message); it only runs while a document is open. The
+    registered tool exposes the remaining parameters and returns the usual
+    {"success": ..., "message": ...} dict.
+    """
+
+    def decorate(fn: Callable[..., Tuple[bool, str]]) -> Callable[..., dict]:
+        signature = inspect.signature(fn)
+
+        @wraps(fn)
+        def tool(*args, **kwargs) -> dict:
+            controller = get_controller()
+            if not (controller and controller.is_document_open):
+                return {"success": False, "message": missing_message}
+            success, message = fn(controller, *args, **kwargs)
+            return {"success": success, "message": message}
+
+        # FastMCP builds the tool schema from this signature
+        tool.__signature__ = signature.replace(
+            parameters=list(signature.parameters.values())[1:],
+            return_annotation=dict,
+        )
+        return tool
+
+    return decorate
 
 
+@lru_cache(maxsize=None)
 def get_default_output_dir() -> Path:
-    """Get a writable default output directory."""
+    """Get a writable default output directory (resolved once per process)."""
     if IS_WINDOWS:
         # Windows: Use Documents folder
         return Path(os.path.expanduser("~/Documents"))
-    elif platform.system() == "Darwin":
+    elif IS_MAC:
         # macOS: Use Documents folder
         return Path(os.path.expanduser("~/Documents"))
     else:
@@ -67,6 +103,47 @@ def get_default_output_dir() -> Path:
         return Path(os.path.expanduser("~/Documents"))
 
 
+_created_output_dirs: set[Path] = set()
+
+
+def ensure_default_output_dir() -> Path:
+    """Get the default output directory, creating it on first use this session."""
+    output_dir = get_default_output_dir()
+    if output_dir not in _created_output_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _created_output_dirs.add(output_dir)
+    return output_dir
+
+
+_T = TypeVar("_T")
+
+
+def _retry_if_output_dir_vanished(file_path: str, write: Callable[[], _T]) -> _T:
+    """Run write(), recreating a vanished output directory and retrying once.
+
+    ensure_default_output_dir() skips mkdir for directories it already created,
+    so a directory deleted or moved during a long session is only noticed here.
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        output_dir = Path(file_path).parent
+        if output_dir not in _created_output_dirs or output_dir.is_dir():
+            raise
+        _created_output_dirs.discard(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _created_output_dirs.add(output_dir)
+        return write()
+
+
+def _resolve_hwpx_output_path(filename: str) -> str:
+    """Place filename, with a .hwpx extension ensured, in the output directory."""
+    # Only the 5-char suffix is lowercased, not a copy of the whole name
+    if filename[-5:].lower() != ".hwpx":
+        filename += ".hwpx"
+    return str(ensure_default_output_dir() / filename)
+
+
 try:
     from mcp.server.fastmcp import FastMCP
 
@@ -81,7 +158,7 @@ try:
     from hwpx_mcp.tools.equation_tools import register_equation_tools
     from hwpx_mcp.tools.document_tools import register_document_tools
     from hwpx_mcp.tools.template_tools import register_template_tools
-    from hwpx_mcp.tools.hwpx_builder import create_hwpx_from_text, HwpxBuilder
+    from hwpx_mcp.tools.hwpx_builder import write_hwpx_from_text, HwpxBuilder
     from hwpx_mcp.tools.pyhwp_adapter import (
         PyhwpAdapter,
         HAS_PYHWP,
@@ -95,6 +172,7 @@ except ImportError as e:
 
 # Import Windows controller only on Windows
 _windows_controller = None
+_get_windows_hwp_controller = None
 if IS_WINDOWS:
     try:
         from hwpx_mcp.tools.windows_hwp_controller import (
@@ -126,23 +204,30 @@ mcp = FastMCP(
 )
 
 _pyhwp_adapter: Optional[PyhwpAdapter] = None
+_pyhwp_adapter_lock = threading.Lock()
 
 
 def get_pyhwp_adapter() -> Optional[PyhwpAdapter]:
     """Get or create PyhwpAdapter instance."""
     global _pyhwp_adapter
-    if _pyhwp_adapter is None:
-        _pyhwp_adapter = PyhwpAdapter()
-    return _pyhwp_adapter
+    adapter = _pyhwp_adapter
+    if adapter is None:
+        # Concurrent first calls must not each create (and leak) an adapter
+        with _pyhwp_adapter_lock:
+            adapter = _pyhwp_adapter
+            if adapter is None:
+                adapter = _pyhwp_adapter = PyhwpAdapter()
+    return adapter
 
 
 def reset_pyhwp_adapter() -> None:
     """Reset global PyhwpAdapter instance."""
     global _pyhwp_adapter
-    if _pyhwp_adapter:
-        _pyhwp_adapter.close()
-        _pyhwp_adapter.cleanup()
-    _pyhwp_adapter = None
+    with _pyhwp_adapter_lock:
+        adapter, _pyhwp_adapter = _pyhwp_adapter, None
+    if adapter:
+        adapter.close()
+        adapter.cleanup()
 
 
 def initialize_server() -> None:
@@ -173,9 +258,13 @@ def register_windows_tools(mcp) -> None:
         from hwpx_mcp.tools.windows_hwp_controller import get_hwp_controller
         from hwpx_mcp.tools.hwp_table_tools import get_table_tools
 
+        # Bind the accessor once; every tool below closes over it
+        _get_ctrl = get_windows_controller
+        _needs_document = _document_tool(_get_ctrl)
+
         def get_windows_table_tools():
             tools = get_table_tools()
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller:
                 tools.set_controller(controller)
             return tools
@@ -200,7 +289,7 @@ def register_windows_tools(mcp) -> None:
         @mcp.tool()
         def hwp_windows_create_document() -> dict:
             """Create new HWP document."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller and controller.is_hwp_running:
                 success = controller.create_new_document()
                 return {
@@ -212,32 +301,21 @@ def register_windows_tools(mcp) -> None:
             return {"success": False, "message": "HWP not connected"}
 
         @mcp.tool()
-        def hwp_windows_insert_text(text: str) -> dict:
+        @_needs_document
+        def hwp_windows_insert_text(controller, text: str) -> Tuple[bool, str]:
             """Insert text at cursor position."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_text(text)
-                return {
-                    "success": success,
-                    "message": f"Text inserted: {text[:50]}..."
-                    if len(text) > 50
-                    else f"Text inserted: {text}",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_text(text)
+            preview = text if len(text) <= 50 else f"{text[:50]}..."
+            return success, f"Text inserted: {preview}"
 
         @mcp.tool()
-        def hwp_windows_save_document(file_path: str) -> dict:
+        @_document_tool(_get_ctrl, "No document to save")
+        def hwp_windows_save_document(controller, file_path: str) -> Tuple[bool, str]:
             """Save HWP document."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.save_document(file_path)
-                return {
-                    "success": success,
-                    "message": f"Document saved: {file_path}"
-                    if success
-                    else "Failed to save document",
-                }
-            return {"success": False, "message": "No document to save"}
+            success = controller.save_document(file_path)
+            return success, (
+                f"Document saved: {file_path}" if success else "Failed to save document"
+            )
 
         # Register table tools
         @mcp.tool()
@@ -245,8 +323,8 @@ def register_windows_tools(mcp) -> None:
             """Insert table in HWP document."""
             tools = get_windows_table_tools()
             if tools:
-                result = tools.insert_table(rows, cols)
-                return {"success": not result.startswith("Error"), "message": result}
+                success, message = tools.insert_table(rows, cols)
+                return {"success": success, "message": message}
             return {"success": False, "message": "Table tools not available"}
 
         @mcp.tool()
@@ -256,8 +334,8 @@ def register_windows_tools(mcp) -> None:
             """Create table and fill with data (JSON string)."""
             tools = get_windows_table_tools()
             if tools:
-                result = tools.create_table_with_data(rows, cols, data, has_header)
-                return {"success": not result.startswith("Error"), "message": result}
+                success, message = tools.create_table_with_data(rows, cols, data, has_header)
+                return {"success": success, "message": message}
             return {"success": False, "message": "Table tools not available"}
 
         @mcp.tool()
@@ -272,33 +350,27 @@ def register_windows_tools(mcp) -> None:
             if tools:
                 # Convert to string list
                 str_data = [[str(cell) for cell in row] for row in data_list]
-                result = tools.fill_table_with_data(
+                success, message = tools.fill_table_with_data(
                     str_data, start_row, start_col, has_header
                 )
-                return {"success": not result.startswith("Error"), "message": result}
+                return {"success": success, "message": message}
             return {"success": False, "message": "Table tools not available"}
 
         @mcp.tool()
+        @_needs_document
         def hwp_windows_set_font_style(
+            controller,
             font_name: str = None,
             font_size: int = None,
             bold: bool = False,
             italic: bool = False,
             underline: bool = False,
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Set font style for current selection or next text."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.set_font_style(
-                    font_name, font_size, bold, italic, underline
-                )
-                return {
-                    "success": success,
-                    "message": "Font style set"
-                    if success
-                    else "Failed to set font style",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.set_font_style(
+                font_name, font_size, bold, italic, underline
+            )
+            return success, "Font style set" if success else "Failed to set font style"
 
         @mcp.tool()
         def hwp_windows_fill_column_numbers(
@@ -310,14 +382,14 @@ def register_windows_tools(mcp) -> None:
             """Fill table column with sequential numbers."""
             tools = get_windows_table_tools()
             if tools:
-                result = tools.fill_column_numbers(start, end, column, from_first_cell)
-                return {"success": not result.startswith("Error"), "message": result}
+                success, message = tools.fill_column_numbers(start, end, column, from_first_cell)
+                return {"success": success, "message": message}
             return {"success": False, "message": "Table tools not available"}
 
         @mcp.tool()
         def hwp_windows_create_complete_document(document_spec: dict) -> dict:
             """Create complete document from specification dict."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller:
                 return controller.create_complete_document(document_spec)
             return {"success": False, "message": "HWP not connected"}
@@ -325,183 +397,136 @@ def register_windows_tools(mcp) -> None:
         @mcp.tool()
         def hwp_windows_batch_operations(operations: list) -> dict:
             """Execute multiple HWP operations in batch."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller and controller.is_document_open:
                 return controller.batch_operations(operations)
             return {"success": False, "message": "No document open"}
 
         @mcp.tool()
+        @_needs_document
         def hwp_windows_insert_text_with_linebreaks(
-            text: str, preserve_linebreaks: bool = True
-        ) -> dict:
+            controller, text: str, preserve_linebreaks: bool = True
+        ) -> Tuple[bool, str]:
             """Insert text with optional linebreak preservation."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_text(text, preserve_linebreaks)
-                return {
-                    "success": success,
-                    "message": "Text inserted" if success else "Failed to insert text",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_text(text, preserve_linebreaks)
+            return success, "Text inserted" if success else "Failed to insert text"
 
         @mcp.tool()
-        def hwp_insert_bookmark(name: str) -> dict:
+        @_needs_document
+        def hwp_insert_bookmark(controller, name: str) -> Tuple[bool, str]:
             """Insert bookmark at cursor position."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_bookmark(name)
-                return {
-                    "success": success,
-                    "message": f"Bookmark '{name}' inserted" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_bookmark(name)
+            return success, f"Bookmark '{name}' inserted" if success else "Failed"
 
         @mcp.tool()
-        def hwp_insert_hyperlink(url: str, display_text: str = None) -> dict:
+        @_needs_document
+        def hwp_insert_hyperlink(
+            controller, url: str, display_text: str = None
+        ) -> Tuple[bool, str]:
             """Insert hyperlink at cursor position."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_hyperlink(url, display_text)
-                return {
-                    "success": success,
-                    "message": "Hyperlink inserted" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_hyperlink(url, display_text)
+            return success, "Hyperlink inserted" if success else "Failed"
 
         @mcp.tool()
-        def hwp_table_split_cell(rows: int = 2, cols: int = 1) -> dict:
+        @_needs_document
+        def hwp_table_split_cell(
+            controller, rows: int = 2, cols: int = 1
+        ) -> Tuple[bool, str]:
             """Split current table cell into rows and columns."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.table_split_cell(rows, cols)
-                return {
-                    "success": success,
-                    "message": f"Cell split into {rows}x{cols}"
-                    if success
-                    else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.table_split_cell(rows, cols)
+            return success, f"Cell split into {rows}x{cols}" if success else "Failed"
 
         @mcp.tool()
-        def hwp_table_merge_cells() -> dict:
+        @_needs_document
+        def hwp_table_merge_cells(controller) -> Tuple[bool, str]:
             """Merge selected table cells."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.table_merge_cells()
-                return {
-                    "success": success,
-                    "message": "Cells merged" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.table_merge_cells()
+            return success, "Cells merged" if success else "Failed"
 
         # ============================================================
         # HWP SDK Extended Tools (from Actions.h, Document.h, etc.)
         # ============================================================
 
         @mcp.tool()
+        @_needs_document
         def hwp_setup_columns(
-            count: int = 1, same_size: bool = True, gap_mm: float = 10.0
-        ) -> dict:
+            controller, count: int = 1, same_size: bool = True, gap_mm: float = 10.0
+        ) -> Tuple[bool, str]:
             """Configure page columns (MultiColumn)."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.setup_columns(count, same_size, gap_mm)
-                return {
-                    "success": success,
-                    "message": f"Set to {count} columns" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.setup_columns(count, same_size, gap_mm)
+            return success, f"Set to {count} columns" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_insert_dutmal(
-            main_text: str, sub_text: str, position: str = "top"
-        ) -> dict:
+            controller, main_text: str, sub_text: str, position: str = "top"
+        ) -> Tuple[bool, str]:
             """Insert Dutmal (text with comment above/below)."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_dutmal(main_text, sub_text, position)
-                return {
-                    "success": success,
-                    "message": "Dutmal inserted" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_dutmal(main_text, sub_text, position)
+            return success, "Dutmal inserted" if success else "Failed"
 
         @mcp.tool()
-        def hwp_insert_index_mark(keyword1: str, keyword2: str = "") -> dict:
+        @_needs_document
+        def hwp_insert_index_mark(
+            controller, keyword1: str, keyword2: str = ""
+        ) -> Tuple[bool, str]:
             """Insert Index Mark."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_index_mark(keyword1, keyword2)
-                return {
-                    "success": success,
-                    "message": f"Index mark '{keyword1}' inserted"
-                    if success
-                    else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_index_mark(keyword1, keyword2)
+            return success, f"Index mark '{keyword1}' inserted" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_set_page_hiding(
+            controller,
             hide_header: bool = False,
             hide_footer: bool = False,
             hide_page_num: bool = False,
             hide_border: bool = False,
             hide_background: bool = False,
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Hide page elements (header, footer, etc.) for current page."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.set_page_hiding(
-                    hide_header,
-                    hide_footer,
-                    hide_page_num,
-                    hide_border,
-                    hide_background,
-                )
-                return {
-                    "success": success,
-                    "message": "Page hiding settings applied" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.set_page_hiding(
+                hide_header,
+                hide_footer,
+                hide_page_num,
+                hide_border,
+                hide_background,
+            )
+            return success, "Page hiding settings applied" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_insert_auto_number(
-            num_type: str = "page", number_format: int = 0, new_number: int = 0
-        ) -> dict:
+            controller,
+            num_type: str = "page",
+            number_format: int = 0,
+            new_number: int = 0,
+        ) -> Tuple[bool, str]:
             """Insert Auto Number (e.g., Figure 1, Table 1). Types: page, footnote, endnote, picture, table, equation."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_auto_number(
-                    num_type, number_format, new_number
-                )
-                return {
-                    "success": success,
-                    "message": f"Auto number ({num_type}) inserted"
-                    if success
-                    else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_auto_number(num_type, number_format, new_number)
+            return success, (
+                f"Auto number ({num_type}) inserted" if success else "Failed"
+            )
 
         @mcp.tool()
-        def hwp_run_action(action_id: str) -> dict:
+        @_needs_document
+        def hwp_run_action(controller, action_id: str) -> Tuple[bool, str]:
             """Execute any HWP action by ID (covers 800+ actions).
 
             Categories: Edit (Copy, Paste), View (ViewZoom), Formatting (CharShapeBold),
             Navigation (MoveDocEnd), Table (TableDeleteRow), etc.
             """
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.run_action(action_id)
-                return {
-                    "success": success,
-                    "message": f"Action '{action_id}' executed"
-                    if success
-                    else f"Action '{action_id}' failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.run_action(action_id)
+            return success, (
+                f"Action '{action_id}' executed"
+                if success
+                else f"Action '{action_id}' failed"
+            )
 
         @mcp.tool()
+        @_needs_document
         def hwp_page_setup(
+            controller,
             width_mm: float = 210,
             height_mm: float = 297,
             top_margin_mm: float = 20,
@@ -510,134 +535,104 @@ def register_windows_tools(mcp) -> None:
             right_margin_mm: float = 20,
             orientation: str = "portrait",
             paper_type: str = "a4",
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Set page layout (margins, size, orientation)."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.page_setup(
-                    width_mm,
-                    height_mm,
-                    top_margin_mm,
-                    bottom_margin_mm,
-                    left_margin_mm,
-                    right_margin_mm,
-                    orientation,
-                    paper_type,
-                )
-                return {
-                    "success": success,
-                    "message": f"Page setup applied ({paper_type}, {orientation})"
-                    if success
-                    else "Failed to apply page setup",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.page_setup(
+                width_mm,
+                height_mm,
+                top_margin_mm,
+                bottom_margin_mm,
+                left_margin_mm,
+                right_margin_mm,
+                orientation,
+                paper_type,
+            )
+            return success, (
+                f"Page setup applied ({paper_type}, {orientation})"
+                if success
+                else "Failed to apply page setup"
+            )
 
         @mcp.tool()
+        @_needs_document
         def hwp_insert_page_number(
+            controller,
             position: int = 4,
             number_format: int = 0,
             starting_number: int = 1,
             side_char: str = "",
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Insert page numbering. Positions: 4=BottomCenter, 2=TopCenter, etc."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_page_number(
-                    position, number_format, starting_number, side_char
-                )
-                return {
-                    "success": success,
-                    "message": "Page numbering inserted" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_page_number(
+                position, number_format, starting_number, side_char
+            )
+            return success, "Page numbering inserted" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_table_format_cell(
+            controller,
             fill_color: int = None,
             border_type: int = 1,
             border_width: int = 1,
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Format selected table cells (border and fill color)."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.format_cell(fill_color, border_type, border_width)
-                return {
-                    "success": success,
-                    "message": "Cell formatting applied" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.format_cell(fill_color, border_type, border_width)
+            return success, "Cell formatting applied" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_move_to(
+            controller,
             move_id: str = "MoveDocEnd",
             para: int = 0,
             pos: int = 0,
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Move cursor to position. Options: MoveDocBegin, MoveDocEnd, MoveParaBegin, etc."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.move_to_pos(move_id, para, pos)
-                return {
-                    "success": success,
-                    "message": f"Moved to {move_id}" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.move_to_pos(move_id, para, pos)
+            return success, f"Moved to {move_id}" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_select_range(
+            controller,
             start_para: int,
             start_pos: int,
             end_para: int,
             end_pos: int,
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Select text range by paragraph and position indices."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.select_range(
-                    start_para, start_pos, end_para, end_pos
-                )
-                return {
-                    "success": success,
-                    "message": "Range selected" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.select_range(start_para, start_pos, end_para, end_pos)
+            return success, "Range selected" if success else "Failed"
 
         @mcp.tool()
+        @_needs_document
         def hwp_insert_header_footer(
+            controller,
             header_or_footer: str = "header",
             content: str = "",
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Insert header or footer with text content."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_header_footer(header_or_footer, content)
-                return {
-                    "success": success,
-                    "message": f"{header_or_footer.title()} inserted"
-                    if success
-                    else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_header_footer(header_or_footer, content)
+            return success, (
+                f"{header_or_footer.title()} inserted" if success else "Failed"
+            )
 
         @mcp.tool()
+        @_needs_document
         def hwp_insert_note(
+            controller,
             note_type: str = "footnote",
             content: str = "",
-        ) -> dict:
+        ) -> Tuple[bool, str]:
             """Insert footnote or endnote."""
-            controller = get_windows_controller()
-            if controller and controller.is_document_open:
-                success = controller.insert_note(note_type, content)
-                return {
-                    "success": success,
-                    "message": f"{note_type.title()} inserted" if success else "Failed",
-                }
-            return {"success": False, "message": "No document open"}
+            success = controller.insert_note(note_type, content)
+            return success, f"{note_type.title()} inserted" if success else "Failed"
 
         @mcp.tool()
         def hwp_set_edit_mode(mode: str = "edit") -> dict:
             """Set document mode: 'edit', 'readonly', or 'form'."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller and controller.is_hwp_running:
                 success = controller.set_edit_mode(mode)
                 return {
@@ -653,7 +648,7 @@ def register_windows_tools(mcp) -> None:
             tag_value: str = "",
         ) -> dict:
             """Manage document metatags. Actions: 'get', 'set', 'delete', 'list'."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller and controller.is_document_open:
                 result = controller.manage_metatags(action, tag_name, tag_value)
                 if action in ("get", "list"):
@@ -671,7 +666,7 @@ def register_windows_tools(mcp) -> None:
             fill_option: str = "tile",
         ) -> dict:
             """Insert background image. Fill options: 'tile', 'center', 'stretch', 'fit'."""
-            controller = get_windows_controller()
+            controller = _get_ctrl()
             if controller and controller.is_document_open:
                 success = controller.insert_background(
                     image_path, embedded, fill_option
@@ -709,26 +704,19 @@ def hwp_create_hwpx(text: str, filename: str = "output.hwpx") -> dict:
         dict: Result with file path
     """
     try:
-        # Ensure filename ends with .hwpx
-        if not filename.lower().endswith(".hwpx"):
-            filename += ".hwpx"
-
-        # Use writable output directory
-        output_dir = get_default_output_dir()
-        output_dir.mkdir(parents=True, exist_ok=True)
-        file_path = str(output_dir / filename)
+        file_path = _resolve_hwpx_output_path(filename)
 
-        success = create_hwpx_from_text(text, file_path)
+        # build() raises on failure, so a returned size means success
+        size = _retry_if_output_dir_vanished(
+            file_path, lambda: write_hwpx_from_text(text, file_path)
+        )
 
-        if success:
-            return {
-                "status": "success",
-                "message": f"Created HWPX file at {file_path}",
-                "file_path": file_path,
-                "size": os.path.getsize(file_path),
-            }
-        else:
-            return {"status": "error", "message": "Failed to build HWPX file"}
+        return {
+            "status": "success",
+            "message": f"Created HWPX file at {file_path}",
+            "file_path": file_path,
+            "size": size,
+        }
 
     except Exception as e:
         logger.error(f"Error creating HWPX: {e}")
@@ -758,62 +746,20 @@ def hwp_create_hwpx_document(
         dict: Result with file path
     """
     try:
-        # Ensure filename ends with .hwpx
-        if not filename.lower().endswith(".hwpx"):
-            filename += ".hwpx"
-
-        # Use writable output directory
-        output_dir = get_default_output_dir()
-        output_dir.mkdir(parents=True, exist_ok=True)
-        file_path = str(output_dir / filename)
+        file_path = _resolve_hwpx_output_path(filename)
 
         builder = HwpxBuilder()
 
-        for item in contents:
-            ctype = item.get("type", "text")
-            content = item.get("content", "")
-
-            if ctype == "text":
-                style = item.get("style", "default")
-                builder.add_text(content, style=style)
-            elif ctype == "heading":
-                level = item.get("level", 1)
-                builder.add_heading(content, level)
-            elif ctype == "equation":
-                builder.add_equation(content)
-            elif ctype == "chart":
-                data = item.get("data", {})
-                title = content or "Chart"
-                chart_type = item.get("chart_type", "bar")
-                builder.add_chart(chart_type, data, title)
-            elif ctype == "table":
-                data = item.get("data", [])
-                if data:
-                    rows = len(data)
-                    cols = max(len(row) for row in data)
-                    builder.add_table(rows, cols, data)
-            elif ctype == "image":
-                # Handle raw image insertion
-                try:
-                    import base64
-
-                    image_data = base64.b64decode(content)
-                    width = item.get("width_mm", 100)
-                    height = item.get("height_mm", 60)
-                    builder.insert_image(image_data, "image.png", width, height)
-                except Exception as e:
-                    builder.add_text(f"[Image insertion failed: {str(e)}]")
-            else:
-                builder.add_text(f"[{ctype}: {content}]")
+        builder.add_batch(contents)
 
-        success = builder.build(file_path)
+        success = _retry_if_output_dir_vanished(file_path, lambda: builder.build(file_path))
 
         if success:
             return {
                 "status": "success",
                 "message": f"Created HWPX file at {file_path}",
                 "file_path": file_path,
-                "size": os.path.getsize(file_path),
+                "size": builder.bytes_written,
             }
         else:
             return {"status": "error", "message": "Failed to build HWPX file"}
@@ -836,45 +782,58 @@ def hwp_create_text_document(
         if not filename.lower().endswith(ext):
             filename = filename.rsplit(".", 1)[0] + ext
 
-        output_dir = get_default_output_dir()
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = ensure_default_output_dir()
         file_path = str(output_dir / filename)
 
-        lines = []
-        for item in contents:
-            ctype = item.get("type", "text")
-            content = item.get("content", "")
-
-            if ctype == "text":
-                lines.append(content)
-            elif ctype == "heading":
-                level = item.get("level", 1)
-                if format in ("markdown", "md"):
-                    lines.append(f"{'#' * level} {content}")
-                else:
-                    lines.append(f"\n{content}\n{'=' * len(content)}")
-            elif ctype == "equation":
-                if format in ("markdown", "md"):
-                    lines.append(f"$$\n{content}\n$$")
-                else:
-                    lines.append(f"[수식] {content}")
-            elif ctype == "list":
-                items = item.get("items", [content] if content else [])
-                for li in items:
-                    lines.append(
-                        f"- {li}" if format in ("markdown", "md") else f"  • {li}"
-                    )
-            else:
-                lines.append(content)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        is_markdown = format in ("markdown", "md")
+
+        def write_document() -> int:
+            # Lines go straight to the writer; "\n" separates them like a join would
+            with open(file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                write = f.write
+                sep = ""
+
+                def emit(line: str) -> None:
+                    nonlocal sep
+                    write(sep)
+                    write(line)
+                    sep = "\n"
+
+                for item in contents:
+                    ctype = item.get("type", "text")
+                    content = item.get("content", "")
+
+                    if ctype == "text":
+                        emit(content)
+                    elif ctype == "heading":
+                        level = item.get("level", 1)
+                        if is_markdown:
+                            emit(f"{'#' * level} {content}")
+                        else:
+                            emit(f"\n{content}\n{'=' * len(content)}")
+                    elif ctype == "equation":
+                        if is_markdown:
+                            emit(f"$$\n{content}\n$$")
+                        else:
+                            emit(f"[수식] {content}")
+                    elif ctype == "list":
+                        items = item.get("items", [content] if content else [])
+                        bullet = "- " if is_markdown else "  • "
+                        for li in items:
+                            emit(f"{bullet}{li}")
+                    else:
+                        emit(content)
+
+                # Byte offset after newline translation, i.e. the file size
+                return f.tell()
+
+        size = _retry_if_output_dir_vanished(file_path, write_document)
 
         return {
             "status": "success",
             "message": f"Created {format} file at {file_path}",
             "file_path": file_path,
-            "size": os.path.getsize(file_path),
+            "size": size,
             "format": format,
         }
 
@@ -883,21 +842,16 @@ def hwp_create_text_document(
         return {"status": "error", "message": str(e)}
 
 
-@mcp.tool()
-def hwp_ping() -> dict:
-    """
-    HWP MCP 서버 상태 확인
-
-    Returns:
-        dict: 서버 상태 정보
-    """
+@lru_cache(maxsize=1)
+def _ping_payload() -> dict:
+    """Build the hwp_ping response; every field is fixed for the process."""
     pyhwp_status = "available" if HAS_PYHWP else "not_available"
 
     return {
         "status": "connected",
         "server": "HWP-Extended",
         "version": __version__,
-        "platform": platform.system(),
+        "platform": PLATFORM,
         "is_windows": IS_WINDOWS,
         "pyhwp_status": pyhwp_status,
         "features": [
@@ -917,17 +871,24 @@ def hwp_ping() -> dict:
 
 
 @mcp.tool()
-def hwp_get_capabilities() -> dict:
+def hwp_ping() -> dict:
     """
-    HWP MCP 서버가 지원하는 기능 목록 반환
+    HWP MCP 서버 상태 확인
 
     Returns:
-        dict: 지원 기능 목록
+        dict: 서버 상태 정보
     """
+    # Deep copy: callers may mutate the nested features list
+    return copy.deepcopy(_ping_payload())
+
+
+@lru_cache(maxsize=1)
+def _capabilities_payload() -> dict:
+    """Build the hwp_get_capabilities response; it only depends on the platform."""
     return {
         "server": "HWP-Extended",
         "version": __version__,
-        "platform": platform.system(),
+        "platform": PLATFORM,
         "is_windows": IS_WINDOWS,
         "capabilities": {
             "charts": {
@@ -979,17 +940,27 @@ def hwp_get_capabilities() -> dict:
     }
 
 
+@mcp.tool()
+def hwp_get_capabilities() -> dict:
+    """
+    HWP MCP 서버가 지원하는 기능 목록 반환
+
+    Returns:
+        dict: 지원 기능 목록
+    """
+    # Deep copy: callers may mutate the nested capability dicts and lists
+    return copy.deepcopy(_capabilities_payload())
+
+
 @mcp.tool()
 def hwp_xml_validate_content(xml_content: str) -> dict:
     """Validate HWPX XML content structure."""
     validator = XmlValidator()
-    # Check syntax first
-    valid_syntax = validator.validate_syntax(xml_content)
+    # Syntax and (optional, if xsd loaded) schema checks share one parse
+    valid_syntax, valid_schema = validator.validate_all(xml_content)
     if not valid_syntax:
         return {"valid": False, "message": "Invalid XML syntax"}
 
-    # Check schema (optional, if xsd loaded)
-    valid_schema = validator.validate_schema(xml_content)
     return {
         "valid": valid_schema,
         "message": "Valid XML" if valid_schema else "Schema validation failed",
@@ -1018,22 +989,13 @@ def hwp_xml_xpath_query(xml_content: str, xpath_query: str) -> dict:
 def hwp_xml_parse_section(xml_content: str) -> dict:
     """Parse HWPX Section XML into structured JSON."""
     try:
-        section = HwpxSection.from_xml(xml_content)
+        # Parse with the shared hardened parser, not pydantic-xml's default one
+        root = SecureXmlParser.parse_string(xml_content)
+        section = HwpxSection.from_xml_tree(root)
         return {"success": True, "data": section.model_dump()}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-        return None
-    try:
-        from hwpx_mcp.tools.windows_hwp_controller import get_hwp_controller
-
-        ctrl = get_hwp_controller()
-        if ctrl and not ctrl.is_hwp_running:
-            ctrl.connect()
-        return ctrl
-    except ImportError:
-        return None
-
 
 @mcp.tool()
 def hwp_smart_patch_xml(original_xml: str, modified_xml: str) -> dict:
@@ -1058,6 +1020,20 @@ def hwp_convert_format(
     source_path: str, target_format: str, output_path: str = None
 ) -> dict:
     """Convert document format (HWP, HWPX, PDF, HTML)."""
+    if os.path.splitext(source_path)[1][1:].lower() == target_format.lower():
+        # Already in the target format: copy instead of a round trip through HWP
+        if not os.path.isfile(source_path):
+            return {"success": False, "error": f"Source file not found: {source_path}"}
+        if not output_path:
+            return {"success": True, "output_path": source_path}
+        try:
+            shutil.copyfile(source_path, output_path)
+        except shutil.SameFileError:
+            pass
+        except OSError as e:
+            return {"success": False, "error": str(e)}
+        return {"success": True, "output_path": output_path}
+
     controller = get_windows_controller()
     if not controller:
         return {"success": False, "error": "Conversion requires Windows Controller"}
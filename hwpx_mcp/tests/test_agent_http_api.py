@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from hwpx_mcp.agentic.openrouter_agent import LlmRequestError
 from hwpx_mcp.agentic.openrouter_agent import LOCAL_DEFAULT_MODEL
 from hwpx_mcp.agentic.openrouter_agent import OpenRouterClient
 from hwpx_mcp.agentic.openrouter_agent import OpenRouterToolAgent
+from hwpx_mcp.agentic.openrouter_agent import PlanCache
 
 
 class DummyTool:
@@ -800,6 +802,36 @@ def test_agent_chat_endpoint_requires_non_empty_message():
     assert response.json()["detail"] == "message_required"
 
 
+def test_agent_chat_strips_message_and_session_id():
+    backend = DummyBackend([])
+    app = FastAPI()
+    seen: list[tuple[str, str]] = []
+
+    class RecordingAgent(OpenRouterToolAgent):
+        async def run(self, *, message: str, session_id: str = "") -> dict[str, object]:
+            seen.append((message, session_id))
+            return {"success": True}
+
+    app.include_router(
+        build_agent_http_router(
+            backend,
+            agent_factory=lambda server: RecordingAgent(backend_server=server),
+        )
+    )
+    client = TestClient(app)
+
+    with client:
+        blank = client.post("/agent/chat", json={"message": "   "})
+        response = client.post(
+            "/agent/chat", json={"message": "  hello \n", "session_id": " s-1 "}
+        )
+
+    assert blank.status_code == 422
+    assert blank.json()["detail"] == "message_required"
+    assert response.status_code == 200
+    assert seen == [("hello", "s-1")]
+
+
 def test_agent_chat_returns_400_for_auth_error():
     backend = DummyBackend([])
     app = FastAPI()
@@ -1201,3 +1233,316 @@ async def test_openrouter_client_does_not_fallback_on_policy_403(monkeypatch):
     assert error.status_code == 403
     assert "attempted_auth=openai-oauth" in str(error)
     assert client.calls == 1
+
+
+class PlannerCountingClient(OpenRouterClient):
+    def __init__(self, planner_content: str):
+        super().__init__(api_key="sk-test")
+        self.planner_content = planner_content
+        self.planner_calls = 0
+
+    async def chat_completions(
+        self,
+        *,
+        model: str,
+        provider: str,
+        messages: list[dict[str, object]],
+        tools: list[dict[str, object]] | None,
+        tool_choice: str | None,
+        proxy_url: str | None = None,
+    ) -> dict[str, object]:
+        _ = (model, provider, messages, tool_choice, proxy_url)
+        content = "pong"
+        if tools is None:
+            self.planner_calls += 1
+            content = self.planner_content
+        return {
+            "choices": [
+                {
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ]
+        }
+
+
+@pytest.mark.asyncio
+async def test_openrouter_agent_reuses_cached_plan_for_repeated_message():
+    backend = DummyBackend(
+        [DummyTool(name="hwp_ping", description="Check backend status", fn=None)]
+    )
+    planner_content = json.dumps(
+        {
+            "summary": "상태 점검",
+            "steps": [{"id": "step-1", "title": "핑", "objective": "백엔드 확인", "tool_hint": "hwp_ping"}],
+        },
+        ensure_ascii=False,
+    )
+    client = PlannerCountingClient(planner_content)
+    agent = OpenRouterToolAgent(backend, client=client)
+
+    first = await agent.run(message="상태 확인해줘")
+    second = await agent.run(message="  상태   확인해줘 ")
+
+    assert first["plan"]["summary"] == "상태 점검"
+    assert first["plan"] == second["plan"]
+    assert client.planner_calls == 1
+    assert len(agent.plan_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_openrouter_agent_does_not_cache_fallback_plans():
+    backend = DummyBackend(
+        [DummyTool(name="hwp_ping", description="Check backend status", fn=None)]
+    )
+    client = PlannerCountingClient("pong")
+    agent = OpenRouterToolAgent(backend, client=client)
+
+    _ = await agent.run(message="상태 확인해줘")
+    _ = await agent.run(message="상태 확인해줘")
+
+    assert client.planner_calls == 2
+    assert len(agent.plan_cache) == 0
+
+
+def test_plan_cache_key_includes_case():
+    keys = {
+        PlanCache.make_key(
+            provider="openrouter",
+            model=DEFAULT_MODEL,
+            subagent="document_agent",
+            intent="table",
+            case=case,
+            allowlist=["hwp_insert_text"],
+            message="문서 수정",
+        )
+        for case in ("windows_com_full", "cross_platform_hwpx")
+    }
+    assert len(keys) == 2
+
+
+@pytest.mark.asyncio
+async def test_openrouter_agent_runs_tool_calls_of_a_round_one_at_a_time():
+    class TrackingBackend(DummyBackend):
+        def __init__(self, tools: list[DummyTool]):
+            super().__init__(tools)
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def call_tool(self, name: str, arguments: dict[str, JsonValue]):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().call_tool(name, arguments)
+
+    def _tool_call_round(names: list[str]) -> dict[str, object]:
+        return {
+            "choices": [
+                {
+                    "finish_reason": "tool_calls",
+                    "message": {
+                        "role": "assistant",
+                        "tool_calls": [
+                            {
+                                "id": f"call_{index}",
+                                "type": "function",
+                                "function": {"name": name, "arguments": "{}"},
+                            }
+                            for index, name in enumerate(names)
+                        ],
+                    },
+                }
+            ]
+        }
+
+    class ScriptedClient(OpenRouterClient):
+        def __init__(self, rounds: list[dict[str, object]]):
+            super().__init__(api_key="sk-test")
+            self._rounds = rounds
+
+        async def chat_completions(self, **kwargs) -> dict[str, object]:
+            if kwargs.get("tools") is None:
+                return {"choices": [{"message": {"role": "assistant", "content": ""}}]}
+            if self._rounds:
+                return self._rounds.pop(0)
+            return {
+                "choices": [
+                    {"finish_reason": "stop", "message": {"content": "done"}}
+                ]
+            }
+
+    names = ["hwp_ping", "hwp_platform_info", "hwp_capabilities"]
+    tools = [DummyTool(name=name, description="status", fn=None) for name in names]
+
+    backend = TrackingBackend(tools)
+    agent = OpenRouterToolAgent(backend, client=ScriptedClient([_tool_call_round(names)]))
+    result = await agent.run(message="상태 확인")
+    assert [item["tool_call_id"] for item in result["result"]] == [
+        "call_0",
+        "call_1",
+        "call_2",
+    ]
+    assert [name for name, _ in backend.call_tool_calls] == names
+    # Sync tools run inline on the event loop; overlapping them would only share state
+    assert backend.max_in_flight == 1
+
+    mutating_tools = tools + [DummyTool(name="hwp_save", description="save", fn=None)]
+    mutating_backend = TrackingBackend(mutating_tools)
+    agent = OpenRouterToolAgent(
+        mutating_backend,
+        client=ScriptedClient([_tool_call_round(["hwp_ping", "hwp_save"])]),
+    )
+    _ = await agent.run(message="상태 확인")
+    assert mutating_backend.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_openrouter_client_reuses_http_client_until_closed():
+    client = OpenRouterClient(api_key="sk-test")
+
+    first = client._get_http_client()
+    assert client._get_http_client() is first
+
+    await client.aclose()
+    assert first.is_closed
+    assert client._get_http_client() is not first
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_openrouter_client_assembles_streamed_tool_calls(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "or-test")
+    frames = [
+        {"choices": [{"delta": {"role": "assistant", "content": ""}}]},
+        {
+            "choices": [
+                {
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "hwp_ping", "arguments": '{"a"'},
+                            }
+                        ]
+                    }
+                }
+            ]
+        },
+        {
+            "choices": [
+                {
+                    "delta": {
+                        "tool_calls": [{"index": 0, "function": {"arguments": ": 1}"}}]
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ]
+        },
+    ]
+    stream_body = "".join(f"data: {json.dumps(frame)}\n\n" for frame in frames)
+    stream_body += "data: [DONE]\n\n"
+    sent_bodies: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=stream_body.encode("utf-8"),
+        )
+
+    client = OpenRouterClient(stream=True)
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_client_loop = asyncio.get_running_loop()
+
+    payload = await client.chat_completions(
+        model="openai/gpt-4o-mini",
+        provider="openrouter",
+        messages=[{"role": "user", "content": "ping"}],
+        tools=None,
+        tool_choice=None,
+    )
+    await client.aclose()
+
+    assert sent_bodies[0]["stream"] is True
+    assert payload["choices"] == [
+        {
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "hwp_ping", "arguments": '{"a": 1}'},
+                    }
+                ],
+            },
+            "finish_reason": "tool_calls",
+        }
+    ]
+
+
+def test_openrouter_client_reuses_encoded_tools_payload():
+    client = OpenRouterClient(api_key="sk-test")
+    tools: list[dict[str, object]] = [
+        {"type": "function", "function": {"name": "hwp_ping", "parameters": {}}}
+    ]
+    body: dict[str, object] = {
+        "model": "gpt-5",
+        "messages": [{"role": "user", "content": "핑"}],
+        "stream": False,
+        "tools": tools,
+        "tool_choice": "auto",
+    }
+
+    first = client._encode_chat_body(body)
+    body["messages"] = [{"role": "user", "content": "again"}]
+    second = client._encode_chat_body(body)
+
+    assert json.loads(first)["messages"][0]["content"] == "핑"
+    assert json.loads(second) == body
+    assert client._encode_tools(tools) is client._encode_tools(tools)
+    assert len(client._tools_json_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_openrouter_client_gzips_large_bodies_and_falls_back_on_415(monkeypatch):
+    import gzip
+
+    monkeypatch.setenv("OPENROUTER_API_KEY", "or-test")
+    content_encodings: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        encoding = request.headers.get("Content-Encoding")
+        content_encodings.append(encoding)
+        if encoding == "gzip":
+            assert json.loads(gzip.decompress(request.content))["model"]
+            return httpx.Response(415, json={"error": {"type": "unsupported"}})
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+        )
+
+    client = OpenRouterClient(compress_requests=True)
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_client_loop = asyncio.get_running_loop()
+    messages: list[dict[str, object]] = [{"role": "user", "content": "x" * 2048}]
+
+    for _ in range(2):
+        payload = await client.chat_completions(
+            model="openai/gpt-4o-mini",
+            provider="openrouter",
+            messages=messages,
+            tools=None,
+            tool_choice=None,
+        )
+        assert payload["choices"][0]["message"]["content"] == "ok"
+    await client.aclose()
+
+    assert content_encodings == ["gzip", None, None]
+    assert client.compress_requests is False
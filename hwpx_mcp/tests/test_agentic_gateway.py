@@ -1,4 +1,5 @@
 # pyright: reportMissingImports=false
+import asyncio
 import pytest
 from typing import cast
 
@@ -12,6 +13,9 @@ async def test_gateway_search_returns_ranked_results():
     result = await gateway.tool_search(query="export to pdf", k=3)
     assert result["success"] is True
     assert result["results"]
+    for item in cast(list[dict[str, object]], result["results"]):
+        assert set(item) == {"tool_id", "name", "description", "group", "score", "reason"}
+        assert gateway.record_from_name(cast(str, item["name"])) is not None
 
 
 @pytest.mark.asyncio
@@ -32,3 +36,105 @@ async def test_gateway_tool_describe_and_call_ping():
     called = await gateway.tool_call(ping_tool_id, {})
     assert called["success"] is True
     assert called["tool_name"] == "hwp_ping"
+
+
+@pytest.mark.asyncio
+async def test_gateway_indexes_records_by_id_and_name():
+    gateway = AgenticGateway(mcp)
+    await gateway.refresh_registry()
+    record = gateway.record_from_name("hwp_ping")
+    assert record is not None
+    assert gateway._record_from_id(record.tool_id) is record
+    assert gateway.record_from_name("hwp_missing_tool") is None
+
+    missing = await gateway.tool_describe("hwp_missing_tool:0")
+    assert missing["success"] is False
+
+
+class _CountingBackend:
+    def __init__(self):
+        self.list_calls = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        await asyncio.sleep(0)
+        return await mcp.list_tools()
+
+    async def call_tool(self, name: str, arguments: dict[str, object]) -> object:
+        return await mcp.call_tool(name, arguments)
+
+
+@pytest.mark.asyncio
+async def test_gateway_reuses_registry_until_invalidated():
+    backend = _CountingBackend()
+    gateway = AgenticGateway(backend)
+
+    await gateway.ensure_registry()
+    await gateway.ensure_registry()
+    assert backend.list_calls == 1
+
+    gateway.invalidate()
+    await gateway.ensure_registry()
+    assert backend.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_gateway_concurrent_ensure_registry_lists_tools_once():
+    backend = _CountingBackend()
+    gateway = AgenticGateway(backend)
+
+    _ = await asyncio.gather(*(gateway.ensure_registry() for _ in range(8)))
+
+    assert backend.list_calls == 1
+    assert gateway.registry_version == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_keeps_router_when_refreshed_tools_are_unchanged():
+    backend = _CountingBackend()
+    gateway = AgenticGateway(backend)
+
+    await gateway.ensure_registry()
+    router = gateway._router
+    gateway.invalidate()
+    await gateway.ensure_registry()
+
+    assert backend.list_calls == 2
+    assert gateway._router is router
+    assert gateway.registry_version == 1
+
+
+def test_normalize_tool_result_decodes_text_and_dumps_models():
+    from mcp.types import ImageContent
+    from mcp.types import TextContent
+
+    image = ImageContent(type="image", data="AAAA", mimeType="image/png")
+    normalized = AgenticGateway._normalize_tool_result(
+        [
+            TextContent(type="text", text='{"status": "ok"}'),
+            TextContent(type="text", text="plain text"),
+            {"success": True},
+            image,
+        ]
+    )
+
+    assert normalized == [
+        {"status": "ok"},
+        "plain text",
+        {"success": True},
+        image.model_dump(),
+    ]
+    assert AgenticGateway._normalize_tool_result({"raw": 1}) == {"raw": 1}
+
+
+def test_gateway_main_runs_stdio_despite_invalid_port(monkeypatch):
+    from hwpx_mcp import gateway_server
+
+    runs: list[str] = []
+    monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+    monkeypatch.setenv("MCP_PORT", "abc")
+    monkeypatch.setattr(gateway_server.gateway_mcp, "run", lambda *, transport: runs.append(transport))
+
+    gateway_server.main()
+
+    assert runs == ["stdio"]
@@ -0,0 +1,22 @@
+from hwpx_mcp.agentic.grouping import classify_group
+
+
+def test_classify_group_matches_keywords_case_insensitively():
+    assert classify_group("hwp_set_cell_text", "Set TABLE cell text") == "table_chart"
+    assert classify_group("hwp_ping", "Check backend status") == "util_debug"
+
+
+def test_classify_group_respects_group_priority_order():
+    # "document" (document_lifecycle) outranks "export" (export_convert).
+    assert classify_group("hwp_export_pdf", "Export document to PDF") == "document_lifecycle"
+    assert classify_group("hwp_export_pdf", "Export to PDF") == "export_convert"
+
+
+def test_classify_group_falls_back_to_other():
+    assert classify_group("hwp_noop", "Does nothing") == "other"
+
+
+def test_classify_group_sees_keywords_nested_in_longer_keywords():
+    # "document" (document_lifecycle) overlaps util_debug's "get_document_info".
+    assert classify_group("hwp_get_document_info", "") == "document_lifecycle"
+    assert classify_group("hwp_page_count", "") == "util_debug"
@@ -1,7 +1,17 @@
 # pyright: reportMissingImports=false
+import json
+import threading
+
 import pytest
 
+from hwpx_mcp.agentic.registry import REGISTRY_OFFLOAD_MIN_TOOLS
+from hwpx_mcp.agentic.registry import _stable_hash
+from hwpx_mcp.agentic.registry import _to_json_object
+from hwpx_mcp.agentic import registry as registry_module
 from hwpx_mcp.agentic.registry import build_registry
+from hwpx_mcp.agentic.registry import build_registry_sync
+from hwpx_mcp.agentic.registry import close_registry_sync_loop
+from hwpx_mcp.agentic.registry import save_registry_jsonl
 from hwpx_mcp.server import mcp
 
 
@@ -18,3 +28,133 @@ async def test_registry_contains_ping_tool():
     records = await build_registry(mcp)
     names = {record.name for record in records}
     assert "hwp_ping" in names
+
+
+def test_stable_hash_is_pinned_and_key_order_independent():
+    payload = {
+        "name": "hwp_ping",
+        "inputSchema": {"type": "object", "properties": {"b": {"title": "B"}, "a": {"title": "가"}}},
+        "outputSchema": None,
+    }
+    reordered = {
+        "outputSchema": None,
+        "inputSchema": {"properties": {"a": {"title": "가"}, "b": {"title": "B"}}, "type": "object"},
+        "name": "hwp_ping",
+    }
+    assert _stable_hash(payload) == "7a837db73a734ef1"
+    assert _stable_hash(reordered) == "7a837db73a734ef1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("flush_bytes", [1, 1 << 20])
+async def test_save_registry_jsonl_writes_one_record_per_line(tmp_path, monkeypatch, flush_bytes):
+    monkeypatch.setattr(registry_module, "JSONL_FLUSH_BYTES", flush_bytes)
+    records = await build_registry(mcp)
+    target = save_registry_jsonl(records, tmp_path / "nested" / "registry.jsonl")
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(records)
+    first = json.loads(lines[0])
+    assert first["tool_id"] == records[0].tool_id
+    assert first["tags"] == list(records[0].tags)
+
+
+class _ThreadRecordingTool:
+    def __init__(self, name: str, threads: set[int]):
+        self._name = name
+        self._threads = threads
+
+    def model_dump(self):
+        self._threads.add(threading.get_ident())
+        return {"name": self._name, "description": "Read document text", "inputSchema": {"type": "object"}}
+
+
+class _StaticProvider:
+    def __init__(self, tools):
+        self._tools = tools
+
+    async def list_tools(self):
+        return self._tools
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [3, REGISTRY_OFFLOAD_MIN_TOOLS + 1])
+async def test_build_registry_offloads_large_tool_lists(count):
+    threads: set[int] = set()
+    tools = [_ThreadRecordingTool(f"tool_{index:03d}", threads) for index in reversed(range(count))]
+    records = await build_registry(_StaticProvider(tools))
+    assert [record.name for record in records] == sorted(f"tool_{index:03d}" for index in range(count))
+    offloaded = threading.get_ident() not in threads
+    assert offloaded is (count > REGISTRY_OFFLOAD_MIN_TOOLS)
+
+
+def test_to_json_object_normalizes_keys_and_non_json_values():
+    schema = {"type": "object", 1: [True, None, 1.5, ("a", "b")], "nested": {"items": [{"x": 2}]}}
+    assert _to_json_object(schema) == {
+        "type": "object",
+        "1": [True, None, 1.5, "('a', 'b')"],
+        "nested": {"items": [{"x": 2}]},
+    }
+    assert list(_to_json_object(schema)) == ["type", "1", "nested"]
+    assert _to_json_object(["not", "a", "dict"]) == {}
+
+
+def test_to_json_object_handles_schemas_deeper_than_the_recursion_limit():
+    schema: dict[str, object] = {"type": "string"}
+    for _ in range(5000):
+        schema = {"type": "array", "items": schema}
+    converted = _to_json_object(schema)
+    depth = 0
+    while "items" in converted:
+        converted = converted["items"]
+        depth += 1
+    assert depth == 5000
+    assert converted == {"type": "string"}
+
+
+def test_build_registry_sync_reuses_one_event_loop():
+    tools = [_ThreadRecordingTool(f"tool_{index}", set()) for index in range(3)]
+    try:
+        first = build_registry_sync(_StaticProvider(tools))
+        loop = registry_module._SYNC_LOOP
+        second = build_registry_sync(_StaticProvider(tools))
+        assert registry_module._SYNC_LOOP is loop
+        assert [record.tool_id for record in first] == [record.tool_id for record in second]
+    finally:
+        close_registry_sync_loop()
+    assert registry_module._SYNC_LOOP is None
+    assert loop is not None and loop.is_closed()
+
+
+class _ToolManager:
+    def __init__(self, tools):
+        self._tools = {tool._name: tool for tool in tools}
+
+
+class _RegisteringProvider(_StaticProvider):
+    def __init__(self, tools):
+        super().__init__(tools)
+        self._tool_manager = _ToolManager(tools)
+        self.list_calls = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return list(self._tool_manager._tools.values())
+
+
+@pytest.mark.asyncio
+async def test_build_registry_reuses_records_until_tools_change():
+    provider = _RegisteringProvider([_ThreadRecordingTool(f"tool_{index}", set()) for index in range(3)])
+    first = await build_registry(provider)
+    second = await build_registry(provider)
+    assert provider.list_calls == 1
+    assert second == first and second is not first
+
+    added = _ThreadRecordingTool("tool_new", set())
+    provider._tool_manager._tools["tool_new"] = added
+    third = await build_registry(provider)
+    assert provider.list_calls == 2
+    assert [record.name for record in third] == ["tool_0", "tool_1", "tool_2", "tool_new"]
+
+    provider._tool_manager._tools["tool_new"] = _ThreadRecordingTool("tool_new", set())
+    _ = await build_registry(provider)
+    assert provider.list_calls == 3
@@ -1,5 +1,11 @@
+import math
+
+from hwpx_mcp.agentic.models import GROUP_NAMES
+from hwpx_mcp.agentic.models import GroupId
 from hwpx_mcp.agentic.models import ToolRecord
 from hwpx_mcp.agentic.retrieval import HybridRetriever
+from hwpx_mcp.agentic.retrieval import LexicalRetriever
+from hwpx_mcp.agentic.retrieval import SemanticRetriever
 
 
 def _records() -> list[ToolRecord]:
@@ -39,3 +45,97 @@ def test_hybrid_retriever_group_filter():
     results = retriever.search(query="insert text", groups=["text_insertion"], top_k=2)
     assert len(results) == 1
     assert results[0].tool_id == "hwp_insert_text:2"
+
+
+def test_semantic_retriever_scores_token_jaccard():
+    retriever = SemanticRetriever(_records())
+    results = retriever.search(query="export pdf please", top_k=2)
+    assert len(results) == 1
+    assert results[0].tool_id == "hwp_export_pdf:1"
+    # record tokens: {hwp_export_pdf, export, document, to, pdf}; query adds "please"
+    assert results[0].score == 2 / 6
+
+
+def test_semantic_retriever_ignores_unknown_query_tokens():
+    retriever = SemanticRetriever(_records())
+    assert retriever.search(query="zzz unknown", top_k=2) == []
+
+
+def test_group_ids_follow_group_names():
+    assert [GROUP_NAMES[group_id] for group_id in GroupId] == list(GROUP_NAMES)
+    assert _records()[0].group_id is GroupId.EXPORT_CONVERT
+
+
+def test_semantic_retriever_group_filter_uses_group_ids():
+    retriever = SemanticRetriever(_records())
+    results = retriever.search(query="hwp document", groups=["text_insertion"], top_k=2)
+    assert [item.tool_id for item in results] == ["hwp_insert_text:2"]
+
+
+def test_lexical_retriever_scores_bm25():
+    retriever = LexicalRetriever(_records())
+    results = retriever.search(query="pdf export", top_k=2)
+    assert [item.tool_id for item in results] == ["hwp_export_pdf:1"]
+
+    # "export" appears twice (name and tag) and "pdf" once in a 6-token document
+    idf = math.log(1.0 + (2 - 1 + 0.5) / (1 + 0.5))
+    len_norm = 1.5 * (1.0 - 0.75 + 0.75 * (6 / 6.5))
+    expected = idf * (2 * 2.5 / (2 + len_norm)) + idf * (1 * 2.5 / (1 + len_norm))
+    assert math.isclose(results[0].score, expected)
+    assert retriever.search(query="pdf export", groups=["text_insertion"], top_k=2) == []
+
+
+def test_lexical_retriever_pruned_top_k_matches_full_ranking():
+    retriever = LexicalRetriever(_records())
+    query = "export pdf document insert text"
+    full = retriever.search(query=query, top_k=10)
+    assert [item.tool_id for item in full] == ["hwp_export_pdf:1", "hwp_insert_text:2"]
+    assert retriever.search(query=query, top_k=1) == full[:1]
+
+
+def test_retrievers_break_top_k_ties_by_tool_id():
+    records = [
+        ToolRecord(
+            tool_id=f"hwp_tool_{suffix}:{suffix}",
+            name=f"hwp_tool_{suffix}",
+            description="Shared description",
+            input_schema={},
+            output_schema=None,
+            group="other",
+            tags=("generic",),
+            schema_hash=suffix,
+        )
+        for suffix in ("d", "b", "e", "a", "c")
+    ]
+    for retriever in (LexicalRetriever(records), SemanticRetriever(records), HybridRetriever(records)):
+        results = retriever.search(query="shared description", top_k=3)
+        assert [item.tool_id for item in results] == ["hwp_tool_a:a", "hwp_tool_b:b", "hwp_tool_c:c"]
+
+
+def test_lexical_retriever_compiled_path_matches_maxscore(monkeypatch):
+    import hwpx_mcp.agentic.retrieval as retrieval
+
+    retriever = LexicalRetriever(_records())
+    expected = retriever.search(query="export pdf document insert text", top_k=1)
+
+    monkeypatch.setattr(retrieval, "HAS_NUMBA", True)
+    monkeypatch.setattr(retrieval, "NUMBA_MIN_RECORDS", 0)
+    assert retriever.search(query="export pdf document insert text", top_k=1) == expected
+
+
+def test_retrievers_accept_shared_tokens_cache():
+    records = _records()
+    tokens = [["hwp_export_pdf", "pdf"], ["hwp_insert_text", "text"]]
+    assert [item.tool_id for item in LexicalRetriever(records, tokens_cache=tokens).search("pdf")] == [
+        "hwp_export_pdf:1"
+    ]
+    assert SemanticRetriever(records, tokens_cache=tokens).search("text")[0].score == 1 / 2
+
+
+def test_rebuilding_retrievers_reuses_cached_record_tokens():
+    from hwpx_mcp.agentic.retrieval import _blob_tokens
+
+    _ = HybridRetriever(_records())
+    hits = _blob_tokens.cache_info().hits
+    _ = HybridRetriever(_records())
+    assert _blob_tokens.cache_info().hits == hits + len(_records())
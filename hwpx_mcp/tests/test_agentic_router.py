@@ -1,4 +1,5 @@
 from hwpx_mcp.agentic.models import ToolRecord
+from hwpx_mcp.agentic.models import ToolScore
 from hwpx_mcp.agentic.router import HierarchicalRouter
 
 
@@ -39,3 +40,19 @@ def test_router_selects_in_group_tools():
     scores = router.select_tools(query="insert body text", group="text_insertion", top_k=1)
     assert len(scores) == 1
     assert scores[0].tool_id == "hwp_insert_text:2"
+
+
+def test_router_aggregates_group_scores_and_keeps_first_group_on_ties():
+    class FixedRetriever:
+        def search(self, query, groups=None, top_k=12):
+            return [
+                ToolScore(tool_id="hwp_insert_text:2", score=0.5, reason="hybrid"),
+                ToolScore(tool_id="hwp_export_pdf:1", score=0.25, reason="hybrid"),
+                ToolScore(tool_id="hwp_export_pdf:1", score=0.25, reason="hybrid"),
+            ]
+
+    router = HierarchicalRouter(_records())
+    router._retriever = FixedRetriever()
+    route = router.route_group("anything")
+    assert route.group == "text_insertion"
+    assert route.confidence == 0.5
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from hwpx_mcp.eval.run_eval import evaluate
+from hwpx_mcp.eval.run_eval import iter_queries
+
+
+def _write_queries(path):
+    rows = [
+        {"query": "서버 상태 확인", "expected_group": "document_lifecycle", "expected_tools": ["hwp_ping"]},
+        {"query": "표 만들기", "expected_group": "table_chart", "expected_tools": ["hwp_create_table"]},
+        "not a row",
+        {"query": "PDF로 내보내기", "expected_group": "not-a-group", "expected_tools": ["hwp_export_pdf", 3]},
+    ]
+    path.write_text("\n".join(json.dumps(row, ensure_ascii=False) for row in rows) + "\n\n", encoding="utf-8")
+
+
+def test_iter_queries_streams_valid_rows(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    _write_queries(path)
+    rows = iter_queries(path)
+    first = next(rows)
+    assert first["expected_tools"] == frozenset({"hwp_ping"})
+    remaining = list(rows)
+    assert len(remaining) == 2
+    assert "expected_group" not in remaining[-1]
+    assert remaining[-1]["expected_tools"] == frozenset({"hwp_export_pdf"})
+
+
+@pytest.mark.asyncio
+async def test_evaluate_metrics_do_not_depend_on_concurrency(tmp_path):
+    path = tmp_path / "queries.jsonl"
+    _write_queries(path)
+    sequential = await evaluate(path, top_k=5, concurrency=1)
+    concurrent = await evaluate(path, top_k=5, concurrency=8)
+    assert sequential == concurrent
+    assert sequential["queries"] == 3
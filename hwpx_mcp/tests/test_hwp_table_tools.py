@@ -0,0 +1,38 @@
+from hwpx_mcp.tools.hwp_table_tools import HwpTableTools
+
+
+class _FakeController:
+    def __init__(self, insert_ok=True, fill_ok=True):
+        self.insert_ok = insert_ok
+        self.fill_ok = fill_ok
+
+    def insert_table(self, rows, cols):
+        return self.insert_ok
+
+    def fill_table_with_data(self, data, start_row, start_col, has_header):
+        return self.fill_ok
+
+
+def test_insert_table_returns_success_flag():
+    assert HwpTableTools(_FakeController()).insert_table(2, 3) == (
+        True,
+        "Table created with 2 rows and 3 columns",
+    )
+    ok, message = HwpTableTools(_FakeController(insert_ok=False)).insert_table(2, 3)
+    assert ok is False
+    assert message.startswith("Error")
+
+
+def test_create_table_with_data_keeps_partial_results_successful():
+    tools = HwpTableTools(_FakeController(fill_ok=False))
+    ok, message = tools.create_table_with_data(2, 2, "not json")
+    assert ok is True
+    assert message.startswith("Table created but JSON parsing failed")
+
+    ok, message = tools.create_table_with_data(2, 2, '[["a", "b"]]')
+    assert (ok, message) == (True, "Table created but failed to fill data")
+
+
+def test_fill_table_with_data_rejects_empty_data():
+    ok, message = HwpTableTools(_FakeController()).fill_table_with_data([])
+    assert (ok, message) == (False, "Error: Data is required")
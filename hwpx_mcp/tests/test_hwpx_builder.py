@@ -0,0 +1,123 @@
+import zipfile
+
+import pytest
+from hwpx.document import HwpxDocument
+
+from hwpx_mcp.tools.hwpx_builder import HwpxBuilder
+from hwpx_mcp.tools.hwpx_builder import write_hwpx_from_text
+
+
+def test_build_saves_real_document_and_records_bytes_written(tmp_path):
+    builder = HwpxBuilder()
+    builder.add_text("hello")
+    output = tmp_path / "out.hwpx"
+    assert builder.build(str(output)) is True
+    assert builder.bytes_written == output.stat().st_size > 0
+    assert zipfile.is_zipfile(output)
+    assert "hello" in HwpxDocument.open(str(output)).text.plain()
+
+
+def test_write_hwpx_from_text_returns_size_of_real_document(tmp_path):
+    output = tmp_path / "text.hwpx"
+    assert write_hwpx_from_text("hi", str(output)) == output.stat().st_size > 0
+    assert "hi" in HwpxDocument.open(str(output)).text.plain()
+
+
+def test_build_leaves_no_file_when_saving_fails(tmp_path, monkeypatch):
+    builder = HwpxBuilder()
+
+    def fail(stream):
+        stream.write(b"PK")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(builder.document, "save_to_stream", fail)
+    output = tmp_path / "broken.hwpx"
+    with pytest.raises(RuntimeError, match="boom"):
+        builder.build(str(output))
+    assert not output.exists()
+
+
+def test_add_batch_dispatches_items_in_order(monkeypatch):
+    builder = HwpxBuilder()
+    calls = []
+
+    def recorder(name):
+        return lambda *args, **kwargs: calls.append((name, args, kwargs))
+
+    for name in ("add_text", "add_heading", "add_equation", "add_table"):
+        monkeypatch.setattr(builder, name, recorder(name))
+
+    builder.add_batch(
+        [
+            {"type": "heading", "content": "Title", "level": 2},
+            {"content": "body", "style": "bold"},
+            {"type": "equation", "content": "E = mc^2"},
+            {"type": "table", "data": [["a", "b"], ["c"]]},
+            {"type": "table", "data": []},
+            {"type": "unknown", "content": "x"},
+        ]
+    )
+    assert calls == [
+        ("add_heading", ("Title", 2), {}),
+        ("add_text", ("body",), {"style": "bold"}),
+        ("add_equation", ("E = mc^2",), {}),
+        ("add_table", (2, 2, [["a", "b"], ["c"]]), {}),
+        ("add_text", ("[unknown: x]",), {}),
+    ]
+
+
+def test_add_batch_decodes_base64_images_and_passes_bytes_through(monkeypatch):
+    builder = HwpxBuilder()
+    images = []
+    monkeypatch.setattr(
+        builder,
+        "insert_image",
+        lambda data, filename, width, height: images.append((data, width, height)),
+    )
+
+    builder.add_batch(
+        [
+            {"type": "image", "content": "iVBORw0K", "width_mm": 50},
+            {"type": "image", "content": memoryview(b"\x89PNG"), "height_mm": 30},
+        ]
+    )
+    assert images == [(b"\x89PNG\r\n", 50, 60), (b"\x89PNG", 100, 30)]
+
+
+def _section_xml_without_ids(builder):
+    import re
+
+    from lxml import etree
+
+    xml = etree.tostring(builder._section.element, encoding="unicode")
+    return re.sub(r'\b(id|instid|zOrder)="[^"]*"', r'\1="X"', xml)
+
+
+def test_appended_paragraphs_match_library_style_inheritance(monkeypatch):
+    from hwpx_mcp.tools import hwpx_builder
+
+    items = [
+        {"type": "heading", "content": "Title"},
+        {"content": "first\nsecond", "style": "bold"},
+        {"type": "table", "data": [["a", "=SUM(A1)"], ["c", "d"]]},
+        {"type": "equation", "content": "x^2"},
+        {"content": "after table"},
+    ]
+
+    def build():
+        builder = HwpxBuilder()
+        # Non-default refs on the template paragraph make inheritance observable
+        first = builder._section.element[0]
+        first.set("paraPrIDRef", "3")
+        first.set("styleIDRef", "2")
+        for run in first:
+            if "charPrIDRef" in run.attrib:
+                run.set("charPrIDRef", "5")
+        builder.add_batch(items)
+        return builder
+
+    fast = build()
+    monkeypatch.setattr(hwpx_builder, "_HAS_INHERIT_STYLE", False)
+    library = build()
+
+    assert _section_xml_without_ids(fast) == _section_xml_without_ids(library)
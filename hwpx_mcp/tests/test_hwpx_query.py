@@ -0,0 +1,129 @@
+import pytest
+from defusedxml import EntitiesForbidden
+
+from hwpx_mcp.core.xml_parser import SecureXmlParser
+from hwpx_mcp.features.query import HwpxQueryEngine
+from hwpx_mcp.features.query import _compile
+from hwpx_mcp.models.owpml import TAG_HP_P
+from hwpx_mcp.models.owpml import TAG_HP_RUN
+from hwpx_mcp.models.owpml import TAG_HP_T
+from hwpx_mcp.models.owpml import TAG_HS_SEC
+from hwpx_mcp.models.owpml import HwpxSection
+
+SECTION_XML = """
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"
+        xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"
+        xmlns:hc="http://www.hancom.co.kr/hwpml/2011/core">
+  <hp:p>
+    <hp:run><hp:t>It's a test</hp:t></hp:run>
+    <hp:run><hp:t>plain text</hp:t></hp:run>
+    <hp:run><hp:table rowCnt="3"/><hp:table rowCnt="12"/></hp:run>
+    <hp:run><hp:pic id="small"><hc:sz width="1000" height="1000"/></hp:pic></hp:run>
+    <hp:run><hp:pic id="large"><hc:sz width="9000" height="6000"/></hp:pic></hp:run>
+  </hp:p>
+</hs:sec>
+"""
+
+
+def _root():
+    return SecureXmlParser.parse_string(SECTION_XML)
+
+
+def test_finders_bind_thresholds_as_variables():
+    root = _root()
+    tables = HwpxQueryEngine.find_large_tables(root, min_rows=5)
+    assert [table.get("rowCnt") for table in tables] == ["12"]
+    assert len(HwpxQueryEngine.find_large_tables(root, min_rows=1)) == 2
+
+    images = HwpxQueryEngine.find_images_by_size(root, min_width_mm=10, min_height_mm=10)
+    assert [image.get("id") for image in images] == ["large"]
+
+
+def test_find_text_containing_matches_keywords_with_quotes():
+    root = _root()
+    assert [node.text for node in HwpxQueryEngine.find_text_containing(root, "It's")] == [
+        "It's a test"
+    ]
+    assert [node.text for node in HwpxQueryEngine.find_text_containing(root, "text")] == [
+        "plain text"
+    ]
+
+
+
+def test_text_search_matches_text_after_inline_children():
+    xml = SECTION_XML.replace(
+        "<hp:t>plain text</hp:t>", "<hp:t>before<hp:tab/>after tab</hp:t>"
+    )
+    root = SecureXmlParser.parse_string(xml)
+    assert [node.text for node in HwpxQueryEngine.find_text_containing(root, "after tab")] == [
+        "before"
+    ]
+    assert [node.text for node in HwpxQueryEngine.iter_text_matches(xml, "after tab")] == [
+        "before"
+    ]
+
+
+def test_execute_xpath_reuses_compiled_expressions():
+    root = _root()
+    query = "count(.//hp:t)"
+    assert HwpxQueryEngine.execute_xpath(root, query) == 2.0
+    hits = _compile.cache_info().hits
+    assert HwpxQueryEngine.execute_xpath(root, query) == 2.0
+    assert _compile.cache_info().hits == hits + 1
+
+
+def test_extract_section_text_matches_model_text():
+    xml = (
+        '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+        ' xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+        '<hp:p id="1"><hp:run><hp:t>첫 줄</hp:t></hp:run><hp:run><hp:t> 계속</hp:t></hp:run></hp:p>'
+        '<hp:p id="2"/>'
+        '<hp:p id="3"><hp:run/><hp:run><hp:t>마지막</hp:t></hp:run></hp:p>'
+        "</hs:sec>"
+    )
+    expected = HwpxSection.from_xml(xml).get_text()
+    assert expected == "첫 줄 계속\n\n마지막"
+    assert HwpxQueryEngine.extract_section_text(SecureXmlParser.parse_string(xml)) == expected
+
+
+def test_iter_text_matches_streams_same_hits_as_dom_search(tmp_path):
+    expected = [node.text for node in HwpxQueryEngine.find_text_containing(_root(), "t")]
+    assert [node.text for node in HwpxQueryEngine.iter_text_matches(SECTION_XML, "t")] == expected
+
+    path = tmp_path / "section0.xml"
+    path.write_text(SECTION_XML, encoding="utf-8")
+    assert [node.text for node in HwpxQueryEngine.iter_text_matches(str(path), "t")] == expected
+    limited = list(HwpxQueryEngine.iter_text_matches(SECTION_XML.encode("utf-8"), "t", limit=1))
+    assert [node.text for node in limited] == expected[:1]
+    assert limited[0].getparent() is None
+
+
+def test_iter_text_matches_rejects_entity_declarations():
+    xml = (
+        '<!DOCTYPE sec [<!ENTITY secret "expanded">]>'
+        '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+        ' xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+        "<hp:p><hp:run><hp:t>&secret;</hp:t></hp:run></hp:p></hs:sec>"
+    )
+    with pytest.raises(EntitiesForbidden):
+        list(HwpxQueryEngine.iter_text_matches(xml, "expanded"))
+
+
+def test_clark_tags_match_parser_namespaces():
+    root = _root()
+    assert root.tag == TAG_HS_SEC
+    paragraph = root.find(TAG_HP_P)
+    assert paragraph is not None
+    assert paragraph.find(TAG_HP_RUN).find(TAG_HP_T).text == "It's a test"
+    assert TAG_HP_T == "{%s}t" % SecureXmlParser.NS_MAP["hp"]
+
+
+def test_analyze_collects_text_and_counts_in_one_pass():
+    root = _root()
+    assert HwpxQueryEngine.analyze(root) == {
+        "text": "It's a testplain text",
+        "paragraphs": 1,
+        "tables": 2,
+    }
+    paragraphs = HwpxQueryEngine.execute_xpath(root, ".//hp:p")
+    assert HwpxQueryEngine.analyze(root)["paragraphs"] == len(paragraphs)
@@ -1,4 +1,7 @@
+from hwpx_mcp.agentic.message_features import extract_quoted_text
+from hwpx_mcp.agentic.message_features import tool_name_traits
 from hwpx_mcp.agentic.openrouter_agent import _detect_case
+from hwpx_mcp.agentic.openrouter_agent import _message_features
 from hwpx_mcp.agentic.openrouter_agent import _parse_intent
 from hwpx_mcp.agentic.openrouter_agent import _route_subagent
 from hwpx_mcp.agentic.openrouter_agent import _subagent_tool_allowlist
@@ -34,7 +37,8 @@ def test_detect_case_does_not_force_form_table_request_into_template_workflow()
     tool_names = {"hwp_list_templates", "hwp_create_table", "hwp_insert_text"}
 
     assert (
-        _detect_case("공식문서 양식 표를 수정해줘", tool_names) != "template_workflow"
+        _detect_case("공식문서 양식 표를 수정해줘", tool_name_traits(tool_names))
+        != "template_workflow"
     )
 
 
@@ -70,3 +74,24 @@ def test_template_agent_allowlist_can_create_from_template() -> None:
         "hwp_search_template",
         "hwp_create_from_template",
     ]
+
+
+def test_message_features_collects_every_matching_feature() -> None:
+    features = _message_features("search the 템플릿 list and export pdf")
+    assert {"search", "template_hint", "template", "export_pdf"} <= features
+    assert "status" not in features
+
+
+def test_extract_quoted_text_prefers_double_quotes_anywhere_in_message() -> None:
+    assert extract_quoted_text("'memo' 대신 \"official.hwpx\" 열어줘") == "official.hwpx"
+    assert extract_quoted_text("표에 ' memo ' 입력") == "memo"
+    assert extract_quoted_text('빈 "" 따옴표') is None
+
+
+def test_tool_name_traits_summarize_registry_names() -> None:
+    traits = tool_name_traits({"hwp_windows_open", "hwp_list_templates", "hwp_save"})
+    assert traits.has_windows and traits.has_templates and traits.has_doc_ops
+    assert not traits.has_hwpx and not traits.xml_only
+
+    assert tool_name_traits({"hwp_xml_read", "hwp_xpath_query"}).xml_only
+    assert not tool_name_traits(set()).xml_only
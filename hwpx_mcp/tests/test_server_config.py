@@ -0,0 +1,52 @@
+import pytest
+
+from hwpx_mcp.config import get_config
+from hwpx_mcp.config import get_transport
+from hwpx_mcp.config import reset_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config():
+    reset_config()
+    yield
+    reset_config()
+
+
+def test_get_config_reuses_loaded_configuration(monkeypatch):
+    monkeypatch.setenv("MCP_TRANSPORT", "http")
+    monkeypatch.setenv("MCP_PORT", "9001")
+    config = get_config()
+    assert (config.transport, config.port) == ("http", 9001)
+
+    monkeypatch.setenv("MCP_PORT", "9002")
+    assert get_config() is config
+
+    reset_config()
+    assert get_config().port == 9002
+
+
+def test_get_config_does_not_cache_invalid_configuration(monkeypatch):
+    monkeypatch.setenv("MCP_TRANSPORT", "carrier-pigeon")
+    with pytest.raises(ValueError):
+        get_config()
+
+    monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+    assert get_config().transport == "stdio"
+
+
+def test_invalid_transport_message_lists_transports_in_order(monkeypatch):
+    monkeypatch.setenv("MCP_TRANSPORT", "carrier-pigeon")
+    with pytest.raises(ValueError, match="Must be one of: stdio, http, sse, streamable-http$"):
+        get_config()
+
+
+def test_get_transport_ignores_http_only_settings(monkeypatch):
+    monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+    monkeypatch.setenv("MCP_PORT", "abc")
+    assert get_transport() == "stdio"
+    with pytest.raises(ValueError):
+        get_config()
+
+    monkeypatch.setenv("MCP_TRANSPORT", "carrier-pigeon")
+    with pytest.raises(ValueError, match="Invalid MCP_TRANSPORT"):
+        get_transport()
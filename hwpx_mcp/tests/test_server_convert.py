@@ -0,0 +1,34 @@
+from hwpx_mcp import server
+
+
+def test_convert_to_same_format_copies_without_controller(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "get_windows_controller", lambda: None)
+    source = tmp_path / "report.PDF"
+    source.write_bytes(b"%PDF-1.7")
+
+    assert server.hwp_export_pdf(str(source)) == {
+        "success": True,
+        "output_path": str(source),
+    }
+
+    target = tmp_path / "copy.pdf"
+    result = server.hwp_convert_format(str(source), "pdf", str(target))
+    assert result == {"success": True, "output_path": str(target)}
+    assert target.read_bytes() == b"%PDF-1.7"
+
+    missing = server.hwp_convert_format(str(tmp_path / "gone.pdf"), "PDF", str(target))
+    assert missing["success"] is False
+
+
+def test_convert_to_same_format_reports_missing_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "get_windows_controller", lambda: None)
+    missing = tmp_path / "missing.pdf"
+
+    result = server.hwp_export_pdf(str(missing))
+    assert result == {"success": False, "error": f"Source file not found: {missing}"}
+
+
+def test_convert_to_other_format_still_needs_controller(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "get_windows_controller", lambda: None)
+    result = server.hwp_convert_format(str(tmp_path / "doc.hwp"), "PDF")
+    assert result == {"success": False, "error": "Conversion requires Windows Controller"}
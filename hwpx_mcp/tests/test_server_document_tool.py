@@ -0,0 +1,33 @@
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from hwpx_mcp.server import _document_tool
+
+
+class _Controller:
+    def __init__(self, is_document_open):
+        self.is_document_open = is_document_open
+
+
+@pytest.mark.asyncio
+async def test_document_tool_hides_controller_and_guards_open_document():
+    state = {"controller": _Controller(True)}
+    mcp = FastMCP(name="test")
+
+    @mcp.tool()
+    @_document_tool(lambda: state["controller"])
+    def hwp_insert_thing(controller, name: str, count: int = 1):
+        """Insert a thing."""
+        return True, f"{name} x{count}"
+
+    tool = (await mcp.list_tools())[0]
+    assert tool.description == "Insert a thing."
+    assert set(tool.inputSchema["properties"]) == {"name", "count"}
+
+    fn = mcp._tool_manager.get_tool("hwp_insert_thing").fn
+    assert fn("a", count=2) == {"success": True, "message": "a x2"}
+
+    state["controller"] = _Controller(False)
+    assert fn("a") == {"success": False, "message": "No document open"}
+    state["controller"] = None
+    assert fn("a") == {"success": False, "message": "No document open"}
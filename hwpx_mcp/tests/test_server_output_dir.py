@@ -0,0 +1,54 @@
+import shutil
+from pathlib import Path
+
+from hwpx_mcp import server
+
+
+def test_default_output_dir_is_resolved_once():
+    assert server.get_default_output_dir() is server.get_default_output_dir()
+
+
+def test_output_dir_is_created_once_per_session(tmp_path, monkeypatch):
+    target = tmp_path / "out" / "nested"
+    monkeypatch.setattr(server, "get_default_output_dir", lambda: target)
+    monkeypatch.setattr(server, "_created_output_dirs", set())
+
+    assert server.ensure_default_output_dir() == target
+    assert target.is_dir()
+    assert server._created_output_dirs == {target}
+    assert server.ensure_default_output_dir() == target
+
+
+def test_text_document_reports_written_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "ensure_default_output_dir", lambda: tmp_path)
+    result = server.hwp_create_text_document(
+        [{"type": "heading", "content": "제목"}, {"type": "text", "content": "본문"}],
+        filename="doc.txt",
+    )
+    assert result["status"] == "success"
+    assert result["size"] == (tmp_path / "doc.txt").stat().st_size
+
+
+def test_hwpx_output_path_keeps_existing_extension_in_any_case(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "ensure_default_output_dir", lambda: tmp_path)
+    assert server._resolve_hwpx_output_path("report") == str(tmp_path / "report.hwpx")
+    assert server._resolve_hwpx_output_path("Report.HwPx") == str(tmp_path / "Report.HwPx")
+    assert server._resolve_hwpx_output_path("x") == str(tmp_path / "x.hwpx")
+
+
+def test_writers_recreate_output_dir_removed_during_session(tmp_path, monkeypatch):
+    target = tmp_path / "out"
+    monkeypatch.setattr(server, "get_default_output_dir", lambda: target)
+    monkeypatch.setattr(server, "_created_output_dirs", set())
+
+    for create in (
+        lambda: server.hwp_create_hwpx("hi", filename="a.hwpx"),
+        lambda: server.hwp_create_hwpx_document([{"type": "text", "content": "hi"}], filename="b"),
+        lambda: server.hwp_create_text_document([{"type": "text", "content": "hi"}], filename="c.txt"),
+    ):
+        assert create()["status"] == "success"
+        shutil.rmtree(target)
+        result = create()
+        assert result["status"] == "success", result
+        assert Path(result["file_path"]).parent == target
+        assert Path(result["file_path"]).is_file()
@@ -0,0 +1,41 @@
+import threading
+import time
+
+from hwpx_mcp import server
+
+
+class _SlowAdapter:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        time.sleep(0.01)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def cleanup(self):
+        pass
+
+
+def test_concurrent_first_calls_share_one_adapter(monkeypatch):
+    monkeypatch.setattr(server, "PyhwpAdapter", _SlowAdapter)
+    monkeypatch.setattr(server, "_pyhwp_adapter", None)
+
+    adapters = []
+    threads = [
+        threading.Thread(target=lambda: adapters.append(server.get_pyhwp_adapter()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _SlowAdapter.created == 1
+    assert all(adapter is adapters[0] for adapter in adapters)
+
+    server.reset_pyhwp_adapter()
+    assert adapters[0].closed
+    assert server._pyhwp_adapter is None
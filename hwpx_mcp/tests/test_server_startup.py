@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("matplotlib", "pandas", "langgraph", "xmlschema")
+
+
+def test_server_import_defers_heavy_dependencies():
+    code = (
+        "import sys, hwpx_mcp.server\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
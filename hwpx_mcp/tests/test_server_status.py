@@ -0,0 +1,31 @@
+from hwpx_mcp import server
+
+
+def test_ping_payload_is_built_once_and_copied_per_call():
+    first = server.hwp_ping()
+    first["status"] = "mutated"
+    first["features"].append("mutated")
+    second = server.hwp_ping()
+
+    assert second["status"] == "connected"
+    assert "mutated" not in second["features"]
+    assert second["platform"] == server.PLATFORM
+    assert server._ping_payload.cache_info().currsize == 1
+
+
+def test_capabilities_report_platform_flags():
+    capabilities = server.hwp_get_capabilities()
+
+    assert capabilities["is_windows"] is server.IS_WINDOWS
+    assert capabilities["capabilities"]["tables"]["supported"] is server.IS_WINDOWS
+    assert capabilities is not server.hwp_get_capabilities()
+
+
+def test_capabilities_nested_values_are_not_shared_between_calls():
+    first = server.hwp_get_capabilities()
+    first["capabilities"]["charts"]["types"].append("mutated")
+    first["capabilities"]["tables"]["supported"] = "mutated"
+
+    second = server.hwp_get_capabilities()
+    assert "mutated" not in second["capabilities"]["charts"]["types"]
+    assert second["capabilities"]["tables"]["supported"] is server.IS_WINDOWS
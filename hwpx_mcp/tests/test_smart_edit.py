@@ -0,0 +1,116 @@
+from collections import OrderedDict
+
+import pytest
+
+from hwpx_mcp.features import smart_edit
+from hwpx_mcp.features.smart_edit import HwpxSmartEditor
+
+HS = "http://www.hancom.co.kr/hwpml/2011/section"
+HP = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+NS = f'xmlns:hs="{HS}" xmlns:hp="{HP}"'
+ORIGINAL = (
+    f"<hs:sec {NS}>"
+    '<hp:p id="1"><hp:run><hp:t>first</hp:t></hp:run></hp:p>'
+    '<hp:p id="2"><hp:run><hp:t>second</hp:t></hp:run></hp:p>'
+    "</hs:sec>"
+)
+
+
+def test_text_edits_and_inserted_paragraphs_are_safe():
+    edited = ORIGINAL.replace(">second<", ">changed<")
+    inserted = ORIGINAL.replace(f"<hs:sec {NS}>", f'<hs:sec {NS}><hp:p id="0"/>')
+    for modified in (edited, inserted):
+        result = HwpxSmartEditor.validate_edits(ORIGINAL, modified)
+        assert result == {"safe": True, "message": "Edits are structure-safe.", "diffs": []}
+
+
+def test_deleted_or_renamed_critical_elements_are_rejected():
+    deleted = ORIGINAL.replace('<hp:p id="2"><hp:run><hp:t>second</hp:t></hp:run></hp:p>', "")
+    renamed = ORIGINAL.replace(
+        "<hp:run><hp:t>second</hp:t></hp:run>", "<hp:span><hp:t>second</hp:t></hp:span>"
+    )
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, deleted)
+    assert result["safe"] is False
+    assert "DeleteNode /hs:sec/hp:p (2 -> 1)" in result["unsafe_actions"]
+
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, renamed)
+    assert result["safe"] is False
+    assert result["unsafe_actions"] == ["DeleteNode /hs:sec/hp:p/hp:run (2 -> 1)"]
+
+
+def test_changing_only_a_namespace_prefix_is_safe():
+    reprefixed = (
+        ORIGINAL.replace("hp:", "p:").replace("xmlns:hp=", "xmlns:p=").replace("hs:", "s:")
+        .replace("xmlns:hs=", "xmlns:s=")
+    )
+    assert "<s:sec" in reprefixed and "<p:p " in reprefixed
+    for full_diff in (False, True):
+        result = HwpxSmartEditor.validate_edits(ORIGINAL, reprefixed, full_diff=full_diff)
+        assert result["safe"] is True
+
+    deleted = reprefixed.replace('<p:p id="2"><p:run><p:t>second</p:t></p:run></p:p>', "")
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, deleted)
+    assert sorted(result["unsafe_actions"]) == [
+        "DeleteNode /hs:sec/hp:p (2 -> 1)",
+        "DeleteNode /hs:sec/hp:p/hp:run (2 -> 1)",
+    ]
+
+
+def test_full_diff_keeps_xmldiff_edit_script():
+    edited = ORIGINAL.replace(">second<", ">changed<")
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, edited, full_diff=True)
+    assert result["safe"] is True
+    assert len(result["diffs"]) == 1
+    assert "UpdateTextIn" in result["diffs"][0]
+
+
+def test_full_diff_skips_xmldiff_for_canonically_equal_documents(monkeypatch):
+    reformatted = ORIGINAL.replace('id="1"', "id='1'").replace("<hp:run>", "<hp:run >")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("xmldiff should not run")
+
+    monkeypatch.setattr(smart_edit.xml_diff, "diff_texts", fail)
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, reformatted, full_diff=True)
+    assert result == {"safe": True, "message": "No structural change.", "diffs": []}
+
+
+def test_malformed_xml_is_rejected():
+    result = HwpxSmartEditor.validate_edits(ORIGINAL, "<hs:sec")
+    assert result["safe"] is False
+    assert result["message"].startswith("Error during smart edit validation")
+
+
+def test_repeated_validation_is_served_from_cache(monkeypatch):
+    edited = ORIGINAL.replace(">first<", ">cached<")
+    first = HwpxSmartEditor.validate_edits(ORIGINAL, edited)
+    first["diffs"].append("mutated by caller")
+
+    def fail(*args):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(HwpxSmartEditor, "_validate_uncached", classmethod(fail))
+    second = HwpxSmartEditor.validate_edits(ORIGINAL, edited)
+    assert second == {"safe": True, "message": "Edits are structure-safe.", "diffs": []}
+    assert HwpxSmartEditor.validate_edits(ORIGINAL.encode("utf-8"), edited) == second
+
+
+def test_validation_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(smart_edit, "VALIDATION_CACHE_SIZE", 2)
+    for index in range(4):
+        HwpxSmartEditor.validate_edits(ORIGINAL, ORIGINAL.replace("first", f"v{index}"))
+    assert len(smart_edit._VALIDATION_CACHE) <= 2
+
+
+def test_critical_tag_counts_are_cached_by_digest_and_read_only(monkeypatch):
+    monkeypatch.setattr(smart_edit, "CRITICAL_COUNTS_CACHE_SIZE", 2)
+    monkeypatch.setattr(smart_edit, "_CRITICAL_COUNTS_CACHE", OrderedDict())
+    counts = smart_edit._critical_tag_counts(ORIGINAL)
+    assert smart_edit._critical_tag_counts(ORIGINAL) is counts
+    with pytest.raises(TypeError):
+        counts[(f"{{{HP}}}p", (f"{{{HS}}}sec",))] = 0
+
+    for index in range(3):
+        smart_edit._critical_tag_counts(ORIGINAL.replace("first", f"v{index}"))
+    assert len(smart_edit._CRITICAL_COUNTS_CACHE) == 2
+    assert all(isinstance(key, bytes) for key in smart_edit._CRITICAL_COUNTS_CACHE)
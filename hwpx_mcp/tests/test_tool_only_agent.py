@@ -1,8 +1,11 @@
 import pytest
 from collections.abc import Callable
 
+from hwpx_mcp.agentic import openrouter_agent
 from hwpx_mcp.agentic.models import JsonValue
 from hwpx_mcp.agentic.tool_only_agent import ToolOnlyAgent
+from hwpx_mcp.agentic.tool_only_agent import _message_features
+from hwpx_mcp.agentic.tool_only_agent import _parse_intent
 
 
 class DummyTool:
@@ -465,3 +468,69 @@ async def test_tool_only_agent_refuses_existing_document_edit_without_path_or_op
     assert result["intent"] == "open_document"
     assert result["error"] == "document_path_required"
     assert calls == [("hwp_platform_info", {})]
+
+
+
+@pytest.mark.asyncio
+async def test_tool_only_agent_reuses_tool_callables_until_backend_map_changes():
+    calls: list[tuple[str, dict[str, JsonValue]]] = []
+    ping = DummyTool(
+        "hwp_ping",
+        "Check server status",
+        fn=_recording_tool("hwp_ping", calls, {"success": True, "message": "pong"}),
+    )
+    backend = DummyBackend([ping])
+    agent = ToolOnlyAgent(backend)
+
+    _ = await agent.run("상태 확인해줘")
+    first = agent._tool_callables
+    _ = await agent.run("ping")
+    assert agent._tool_callables is first
+
+    backend._tool_manager._tools["hwp_save"] = DummyTool(
+        "hwp_save",
+        "Save document",
+        fn=_recording_tool("hwp_save", calls, {"success": True}),
+    )
+    _ = await agent.run("ping")
+    assert agent._tool_callables is not first
+    assert set(agent._tool_callables) == {"hwp_ping", "hwp_save"}
+    assert calls == [("hwp_ping", {})] * 3
+
+
+@pytest.mark.asyncio
+async def test_tool_only_agent_refreshes_tool_callables_when_a_tool_is_replaced():
+    calls: list[tuple[str, dict[str, JsonValue]]] = []
+    backend = DummyBackend(
+        [
+            DummyTool(
+                "hwp_ping",
+                "Check server status",
+                fn=_recording_tool("old_ping", calls, {"success": True, "message": "pong"}),
+            )
+        ]
+    )
+    agent = ToolOnlyAgent(backend)
+
+    _ = await agent.run("ping")
+    tools = backend._tool_manager._tools
+    del tools["hwp_ping"]
+    tools["hwp_ping"] = DummyTool(
+        "hwp_ping",
+        "Check server status",
+        fn=_recording_tool("new_ping", calls, {"success": True, "message": "pong"}),
+    )
+    _ = await agent.run("ping")
+
+    assert calls == [("old_ping", {}), ("new_ping", {})]
+
+
+def test_message_features_match_overlapping_and_prefix_tokens():
+    features = _message_features("공식문서 양식 목록에서 capabilities 확인")
+    assert {"document_target", "form", "template_hint", "capabilities"} <= features
+    assert _parse_intent("공식문서 'memo' 수정") == "open_document"
+
+
+def test_only_the_tool_only_agent_treats_official_document_as_target():
+    assert "document_target" in _message_features("공식문서")
+    assert "document_target" not in openrouter_agent._message_features("공식문서")
@@ -0,0 +1,60 @@
+from hwpx_mcp.tools.windows_hwp_controller import WindowsHwpController
+
+
+class _RecordingController(WindowsHwpController):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self._is_document_open = True
+        self._is_hwp_running = True
+        self.hwp = object()
+
+    def insert_text(self, text, preserve_linebreaks=True):
+        self.calls.append(("insert_text", text))
+        return True
+
+    def set_font_style(self, **kwargs):
+        self.calls.append(("set_font_style", kwargs))
+        return True
+
+    def insert_paragraph(self):
+        self.calls.append(("insert_paragraph",))
+        return True
+
+
+def test_batch_operations_coalesce_runs_but_report_every_operation():
+    controller = _RecordingController()
+    operations = [
+        {"type": "set_font_style", "data": {"bold": True}},
+        {"type": "set_font_style", "data": {"bold": True}},
+        {"type": "insert_text", "data": {"text": "line 1\n"}},
+        {"type": "insert_text", "data": {"text": "line 2\\n"}},
+        {"type": "insert_text", "data": {"text": "line 3\n"}},
+        {"type": "insert_text", "data": {"text": "plain"}},
+        {"type": "insert_text", "data": {"text": "plain"}},
+        {"type": "insert_paragraph"},
+    ]
+    result = controller.batch_operations(operations)
+
+    assert controller.calls == [
+        ("set_font_style", {"bold": True}),
+        ("insert_text", "line 1\nline 2\\nline 3\n"),
+        ("insert_text", "plain"),
+        ("insert_text", "plain"),
+        ("insert_paragraph",),
+    ]
+    assert result["total_operations"] == len(operations)
+    assert [(item["type"], item["data"]) for item in result["results"]] == [
+        (operation["type"], operation.get("data", {})) for operation in operations
+    ]
+    assert all(item["success"] for item in result["results"])
+
+
+def test_batch_operations_do_not_join_across_escaped_backslash():
+    groups = WindowsHwpController._coalesce_operations(
+        [
+            {"type": "insert_text", "data": {"text": "a\n\\"}},
+            {"type": "insert_text", "data": {"text": "nb\n"}},
+        ]
+    )
+    assert [group[1]["text"] for group in groups] == ["a\n\\", "nb\n"]
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+from defusedxml import EntitiesForbidden
+from lxml import etree
+
+from hwpx_mcp.core.xml_parser import SecureXmlParser
+from hwpx_mcp.core.xml_parser import _get_parser
+
+
+def test_parse_string_rejects_entity_declarations():
+    billion_laughs = (
+        '<!DOCTYPE lolz [<!ENTITY lol "lol"><!ENTITY lol2 "&lol;&lol;&lol;">]>'
+        "<lolz>&lol2;</lolz>"
+    )
+    with pytest.raises(EntitiesForbidden):
+        SecureXmlParser.parse_string(billion_laughs)
+
+
+def test_parse_file_does_not_read_external_entities(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret", encoding="utf-8")
+    document = tmp_path / "doc.xml"
+    document.write_text(
+        f'<!DOCTYPE doc [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]><doc>&xxe;</doc>',
+        encoding="utf-8",
+    )
+    with pytest.raises(EntitiesForbidden):
+        SecureXmlParser.parse_file(str(document))
+
+
+def test_parser_is_reused_per_thread_and_returns_plain_elements():
+    root = SecureXmlParser.parse_string(b"<a><b/><c/></a>")
+    assert type(root) is etree._Element
+    assert [child.tag for child in root.iter("b", "c")] == ["b", "c"]
+    assert _get_parser() is _get_parser()
+
+    other: list[etree.XMLParser] = []
+    thread = threading.Thread(target=lambda: other.append(_get_parser()))
+    thread.start()
+    thread.join()
+    assert other[0] is not _get_parser()
+
+
+def test_to_bytes_and_to_string_serialize_utf8():
+    root = SecureXmlParser.parse_string("<a>한글</a>")
+    assert SecureXmlParser.to_bytes(root) == "<a>한글</a>".encode("utf-8")
+    assert SecureXmlParser.to_bytes(root, xml_declaration=True).startswith(b"<?xml")
+    assert SecureXmlParser.to_string(root) == "<a>한글</a>"
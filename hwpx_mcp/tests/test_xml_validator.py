@@ -0,0 +1,77 @@
+from hwpx_mcp.core.validator import XmlValidator
+from hwpx_mcp.core.xml_parser import SecureXmlParser
+from hwpx_mcp.models.owpml import HwpxParagraph
+
+PARAGRAPH_XML = (
+    '<hp:p xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph" id="1">'
+    "<hp:run><hp:t>hello</hp:t></hp:run>"
+    "</hp:p>"
+)
+
+NOTE_XSD = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="note">
+    <xs:complexType>
+      <xs:sequence><xs:element name="body" type="xs:string"/></xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+
+def test_validate_without_schema_checks_syntax_and_model():
+    validator = XmlValidator()
+    assert validator.validate_schema(b"<not-even-parsed") is True
+    assert validator.validate(PARAGRAPH_XML) is True
+    assert validator.validate(PARAGRAPH_XML, HwpxParagraph) is True
+    assert validator.validate("<note><body>x</body></note>", HwpxParagraph) is False
+    assert validator.validate("<broken>") is False
+
+
+def test_validate_schema_accepts_parsed_elements(tmp_path):
+    xsd_path = tmp_path / "note.xsd"
+    xsd_path.write_text(NOTE_XSD, encoding="utf-8")
+    validator = XmlValidator(str(xsd_path))
+
+    valid = "<note><body>x</body></note>"
+    invalid = "<note><title>x</title></note>"
+    assert validator.validate_schema(SecureXmlParser.parse_string(valid)) is True
+    assert validator.validate_schema(SecureXmlParser.parse_string(invalid)) is False
+    assert validator.validate_schema(invalid.encode("utf-8")) is False
+    assert validator.validate(valid) is True
+    assert validator.validate(invalid) is False
+
+
+def test_validators_share_compiled_schema_per_path(tmp_path):
+    xsd_path = tmp_path / "note.xsd"
+    xsd_path.write_text(NOTE_XSD, encoding="utf-8")
+    first = XmlValidator(str(xsd_path))
+    second = XmlValidator(str(xsd_path))
+    assert first.schema is not None
+    assert first.schema is second.schema
+
+
+def test_missing_schema_file_leaves_validator_in_pass_through_mode(tmp_path):
+    validator = XmlValidator(str(tmp_path / "missing.xsd"))
+    assert validator.schema is None
+    assert validator.validate("<anything/>") is True
+
+
+def test_validate_all_reports_syntax_and_schema_separately(tmp_path):
+    xsd_path = tmp_path / "note.xsd"
+    xsd_path.write_text(NOTE_XSD, encoding="utf-8")
+    validator = XmlValidator(str(xsd_path))
+
+    assert validator.validate_all(b"<note><body>x</body></note>") == (True, True)
+    assert validator.validate_all("<note><title>x</title></note>") == (True, False)
+    assert validator.validate_all("<note>") == (False, False)
+    assert validator.validate_schema("<note><body>x</body></note>".encode("utf-8")) is True
+
+
+def test_validate_model_uses_the_hardened_parser():
+    assert XmlValidator.validate_model(HwpxParagraph, PARAGRAPH_XML) is True
+    with_entity = (
+        '<!DOCTYPE hp:p [<!ENTITY x "hello">]>'
+        + PARAGRAPH_XML.replace("hello", "&x;")
+    )
+    assert XmlValidator.validate_model(HwpxParagraph, with_entity) is False
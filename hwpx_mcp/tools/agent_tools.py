@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import TYPE_CHECKING
 
-from hwpx_mcp.agentic.tool_only_agent import ToolOnlyAgent
+if TYPE_CHECKING:
+    from hwpx_mcp.agentic.tool_only_agent import ToolOnlyAgent
 
 
 def register_agent_tools(mcp) -> None:
-    agent = ToolOnlyAgent(mcp)
+    agent: ToolOnlyAgent | None = None
 
     @mcp.tool()
     async def hwp_agent_chat(message: str, session_id: str = "") -> dict[str, Any]:
+        nonlocal agent
+        if agent is None:
+            # langgraph is slow to import; build the agent on the first chat
+            from hwpx_mcp.agentic.tool_only_agent import ToolOnlyAgent
+
+            agent = ToolOnlyAgent(mcp)
         return await agent.run(message=message, session_id=session_id)
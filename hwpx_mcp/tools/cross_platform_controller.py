@@ -6,7 +6,6 @@ Works on macOS, Linux, and Windows. Limited to HWPX format creation and editing.
 import os
 import logging
 from typing import Optional, List, Dict, Any, Set
-import tempfile
 
 from .hwp_controller_base import (
     HwpControllerBase,
@@ -7,7 +7,7 @@ using the enhanced WindowsHwpController.
 
 import json
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .windows_hwp_controller import WindowsHwpController, get_hwp_controller
 
@@ -25,7 +25,7 @@ class HwpTableTools:
         """Set the HWP controller instance."""
         self.controller = controller
 
-    def insert_table(self, rows: int, cols: int) -> str:
+    def insert_table(self, rows: int, cols: int) -> Tuple[bool, str]:
         """Insert table at cursor position.
 
         Args:
@@ -33,23 +33,23 @@ class HwpTableTools:
             cols: Number of columns
 
         Returns:
-            str: Result message
+            Tuple[bool, str]: Success flag and result message
         """
         try:
             if not self.controller:
-                return "Error: HWP Controller not available"
+                return False, "Error: HWP Controller not available"
 
             if self.controller.insert_table(rows, cols):
-                return f"Table created with {rows} rows and {cols} columns"
+                return True, f"Table created with {rows} rows and {cols} columns"
             else:
-                return "Error: Failed to create table"
+                return False, "Error: Failed to create table"
         except Exception as e:
             logger.error(f"Error inserting table: {str(e)}")
-            return f"Error: {str(e)}"
+            return False, f"Error: {str(e)}"
 
     def create_table_with_data(
         self, rows: int, cols: int, data: str = None, has_header: bool = False
-    ) -> str:
+    ) -> Tuple[bool, str]:
         """Create table and fill with data.
 
         Args:
@@ -59,15 +59,15 @@ class HwpTableTools:
             has_header: First row is header
 
         Returns:
-            str: Result message
+            Tuple[bool, str]: Success flag and result message
         """
         try:
             if not self.controller:
-                return "Error: HWP Controller not available"
+                return False, "Error: HWP Controller not available"
 
             # Create table
             if not self.controller.insert_table(rows, cols):
-                return "Error: Failed to create table"
+                return False, "Error: Failed to create table"
 
             # Parse and fill data if provided
             if data:
@@ -75,32 +75,35 @@ class HwpTableTools:
                     data_array = json.loads(data)
 
                     if not isinstance(data_array, list):
-                        return f"Table created but data is not a list. Got: {type(data_array)}"
+                        return (
+                            True,
+                            f"Table created but data is not a list. Got: {type(data_array)}",
+                        )
 
                     if len(data_array) == 0:
-                        return "Table created but data array is empty"
+                        return True, "Table created but data array is empty"
 
                     if not all(isinstance(row, list) for row in data_array):
-                        return "Table created but data is not a 2D array"
+                        return True, "Table created but data is not a 2D array"
 
                     # Convert all values to strings
                     str_data = [[str(cell) for cell in row] for row in data_array]
 
                     if self.controller.fill_table_with_data(str_data, 1, 1, has_header):
-                        return f"Table created and filled with data ({rows}x{cols})"
+                        return True, f"Table created and filled with data ({rows}x{cols})"
                     else:
-                        return "Table created but failed to fill data"
+                        return True, "Table created but failed to fill data"
 
                 except json.JSONDecodeError as e:
-                    return f"Table created but JSON parsing failed: {str(e)}"
+                    return True, f"Table created but JSON parsing failed: {str(e)}"
                 except Exception as e:
-                    return f"Table created but data filling failed: {str(e)}"
+                    return True, f"Table created but data filling failed: {str(e)}"
 
-            return f"Table created ({rows}x{cols})"
+            return True, f"Table created ({rows}x{cols})"
 
         except Exception as e:
             logger.error(f"Error creating table with data: {str(e)}")
-            return f"Error: {str(e)}"
+            return False, f"Error: {str(e)}"
 
     def fill_table_with_data(
         self,
@@ -108,7 +111,7 @@ class HwpTableTools:
         start_row: int = 1,
         start_col: int = 1,
         has_header: bool = False,
-    ) -> str:
+    ) -> Tuple[bool, str]:
         """Fill existing table with data.
 
         Args:
@@ -118,14 +121,14 @@ class HwpTableTools:
             has_header: First row is header
 
         Returns:
-            str: Result message
+            Tuple[bool, str]: Success flag and result message
         """
         try:
             if not self.controller:
-                return "Error: HWP Controller not available"
+                return False, "Error: HWP Controller not available"
 
             if not data_list:
-                return "Error: Data is required"
+                return False, "Error: Data is required"
 
             logger.info(
                 f"Filling table: {len(data_list)} rows from ({start_row}, {start_col})"
@@ -144,13 +147,13 @@ class HwpTableTools:
             )
 
             if success:
-                return "Table data filled successfully"
+                return True, "Table data filled successfully"
             else:
-                return "Error: Failed to fill table data"
+                return False, "Error: Failed to fill table data"
 
         except Exception as e:
             logger.error(f"Error filling table data: {str(e)}")
-            return f"Error: {str(e)}"
+            return False, f"Error: {str(e)}"
 
     def set_cell_text(self, row: int, col: int, text: str) -> str:
         """Set text in specific cell.
@@ -233,7 +236,7 @@ class HwpTableTools:
         end: int = 10,
         column: int = 1,
         from_first_cell: bool = True,
-    ) -> str:
+    ) -> Tuple[bool, str]:
         """Fill a column with sequential numbers.
 
         Args:
@@ -243,14 +246,14 @@ class HwpTableTools:
             from_first_cell: Start from first cell of table (default: True)
 
         Returns:
-            str: Result message
+            Tuple[bool, str]: Success flag and result message
         """
         try:
             if not self.controller:
-                return "Error: HWP Controller not available"
+                return False, "Error: HWP Controller not available"
 
             if not self.controller.is_document_open:
-                return "Error: No document open"
+                return False, "Error: No document open"
 
             hwp = self.controller.hwp
 
@@ -272,11 +275,11 @@ class HwpTableTools:
                     hwp.Run("TableLowerCell")
 
             logger.info(f"Filled column {column} with numbers {start}-{end}")
-            return f"Column {column} filled with numbers {start}-{end}"
+            return True, f"Column {column} filled with numbers {start}-{end}"
 
         except Exception as e:
             logger.error(f"Error filling column numbers: {str(e)}")
-            return f"Error: {str(e)}"
+            return False, f"Error: {str(e)}"
 
 
 # Global table tools instance
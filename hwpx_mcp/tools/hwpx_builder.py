@@ -4,14 +4,15 @@ Uses the official HwpxDocument API with post-processing for proper text visibili
 Supports Table Formulas, Charts (as images), Custom Table Borders, and Text Styles.
 """
 
+import inspect
 import logging
 import zipfile
 import tempfile
 import shutil
 import os
 import re
-import base64
 import uuid
+from functools import lru_cache
 from io import BytesIO
 from typing import List, Optional, Dict, Tuple
 from lxml import etree as lxml_etree
@@ -22,16 +23,25 @@ logger = logging.getLogger("hwp-mcp-extended.hwpx_builder")
 # Mandatory import
 from hwpx.document import HwpxDocument
 
-HAS_MATPLOTLIB = False
+# Optional SIMD base64 codec; stdlib decodes the same input, only slower
 try:
-    import matplotlib
+    from pybase64 import b64decode as _B64_DECODE
+except ImportError:
+    from base64 import b64decode as _B64_DECODE
 
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
 
-    HAS_MATPLOTLIB = True
-except ImportError:
-    logger.warning("matplotlib not installed. Charts will not be generated.")
+@lru_cache(maxsize=1)
+def _get_pyplot():
+    """Import matplotlib on the first chart instead of at module import."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        logger.warning("matplotlib not installed. Charts will not be generated.")
+        return None
+    return plt
 
 HP_NS = "http://www.hancom.co.kr/hwpml/2011/paragraph"
 HS_NS = "http://www.hancom.co.kr/hwpml/2011/section"
@@ -325,7 +335,10 @@ def _fix_section_xml(
                     text = t_node.text
                     if text.startswith("[계산식:") and text.endswith("]"):
                         command = text[5:-1]
-                        run1 = lxml_etree.Element(f"{{{HP_NS}}}run")
+                        # Create the runs in p's document so insert() needs no
+                        # cross-document move
+                        make_run = p.makeelement
+                        run1 = make_run(f"{{{HP_NS}}}run")
                         if "charPrIDRef" in child.attrib:
                             run1.set("charPrIDRef", child.attrib["charPrIDRef"])
                         fb = lxml_etree.SubElement(run1, f"{{{HP_NS}}}fieldBegin")
@@ -334,13 +347,13 @@ def _fix_section_xml(
                         fb.set("Editable", "0")
                         fb.set("Command", command)
 
-                        run2 = lxml_etree.Element(f"{{{HP_NS}}}run")
+                        run2 = make_run(f"{{{HP_NS}}}run")
                         if "charPrIDRef" in child.attrib:
                             run2.set("charPrIDRef", child.attrib["charPrIDRef"])
                         t2 = lxml_etree.SubElement(run2, f"{{{HP_NS}}}t")
                         t2.text = "0.00"
 
-                        run3 = lxml_etree.Element(f"{{{HP_NS}}}run")
+                        run3 = make_run(f"{{{HP_NS}}}run")
                         if "charPrIDRef" in child.attrib:
                             run3.set("charPrIDRef", child.attrib["charPrIDRef"])
                         fe = lxml_etree.SubElement(run3, f"{{{HP_NS}}}fieldEnd")
@@ -410,6 +423,46 @@ def _latex_to_hwp_script(latex: str) -> str:
     return script.strip()
 
 
+# python-hwpx >= 6 looks up the style refs a new paragraph inherits by listing
+# every paragraph of the section, which makes long documents quadratic.
+_HAS_INHERIT_STYLE = (
+    "inherit_style" in inspect.signature(HwpxDocument.add_paragraph).parameters
+)
+_HP_P = f"{{{HP_NS}}}p"
+_HP_RUN = f"{{{HP_NS}}}run"
+
+
+def _inherited_style_refs(section) -> Dict[str, str]:
+    """Style refs the next paragraph inherits, read from the section's tail."""
+    last = None
+    for child in reversed(section.element):
+        if child.tag == _HP_P:
+            last = child
+            break
+    if last is None:
+        return {}
+
+    refs = {}
+    para_ref = last.get("paraPrIDRef")
+    style_ref = last.get("styleIDRef")
+    # List paragraph shapes do not carry over to ordinary paragraphs
+    is_list = getattr(section, "_para_pr_is_list", None)
+    if para_ref is not None and is_list is not None and is_list(para_ref):
+        para_ref = style_ref = None
+    if para_ref is not None:
+        refs["para_pr_id_ref"] = para_ref
+    if style_ref is not None:
+        refs["style_id_ref"] = style_ref
+    char_refs = {
+        run.get("charPrIDRef")
+        for run in last
+        if run.tag == _HP_RUN and run.get("charPrIDRef") is not None
+    }
+    if len(char_refs) == 1:
+        refs["char_pr_id_ref"] = char_refs.pop()
+    return refs
+
+
 class HwpxBuilder:
     def __init__(self):
         self._document = HwpxDocument.new()
@@ -417,35 +470,47 @@ class HwpxBuilder:
         self._text_content: List[str] = []
         self._table_styles: List[str] = []
         self._text_styles_map: List[str] = ["default"]
+        # Size of the archive written by the last build(), in bytes
+        self.bytes_written = 0
+
+    def _append_paragraph(self, text: str):
+        if not _HAS_INHERIT_STYLE:
+            return self._document.add_paragraph(text, section=self._section)
+        return self._document.add_paragraph(
+            text,
+            section=self._section,
+            inherit_style=False,
+            **_inherited_style_refs(self._section),
+        )
 
     def add_text(self, text: str, style: str = "default"):
         for line in text.split("\n"):
             if line.strip():
-                self._document.add_paragraph(line, section=self._section)
+                self._append_paragraph(line)
                 self._text_content.append(line)
                 self._text_styles_map.append(style)
 
     def add_heading(self, text: str, level: int = 1):
         style = "title" if level == 1 else "subtitle"
-        self._document.add_paragraph(text, section=self._section)
+        self._append_paragraph(text)
         self._text_content.append(text)
         self._text_styles_map.append(style)
 
     def add_paragraph(self, text: str, style: str = "default"):
-        self._document.add_paragraph(text, section=self._section)
+        self._append_paragraph(text)
         self._text_content.append(text)
         self._text_styles_map.append(style)
 
     def add_equation(self, latex: str):
         hwp_script = _latex_to_hwp_script(latex)
         eq_text = f"[수식] {hwp_script}"
-        self._document.add_paragraph(eq_text, section=self._section)
+        self._append_paragraph(eq_text)
         self._text_content.append(eq_text)
         self._text_styles_map.append("default")
 
     def add_formula(self, command: str):
         text = f"[계산식:{command}]"
-        self._document.add_paragraph(text, section=self._section)
+        self._append_paragraph(text)
         self._text_content.append(text)
         self._text_styles_map.append("default")
 
@@ -516,7 +581,7 @@ class HwpxBuilder:
             width_hwp = int(width_mm * 283.465)
             height_hwp = int(height_mm * 283.465)
 
-            p = self._document.add_paragraph("", section=self._section)
+            p = self._append_paragraph("")
             run = p.runs[0]
 
             if run.text == "":
@@ -582,7 +647,8 @@ class HwpxBuilder:
             return False
 
     def add_chart(self, chart_type: str, data: dict, title: str = ""):
-        if not HAS_MATPLOTLIB:
+        plt = _get_pyplot()
+        if plt is None:
             self.add_text("[Error: matplotlib not installed]")
             return
 
@@ -626,9 +692,82 @@ class HwpxBuilder:
             logger.error(f"Error generating chart: {e}")
             self.add_text(f"[Error generating chart: {e}]")
 
+    def add_batch(self, items: List[Dict]) -> None:
+        """Add content items ({"type": ..., "content": ..., ...}) in order.
+
+        Types: text, heading, equation, chart, table, image; any other type
+        is added as a "[type: content]" text placeholder.
+        """
+        add_text = self.add_text
+        add_heading = self.add_heading
+        add_equation = self.add_equation
+        add_chart = self.add_chart
+        add_table = self.add_table
+        insert_image = self.insert_image
+
+        def _text(item: Dict, content: str) -> None:
+            add_text(content, style=item.get("style", "default"))
+
+        def _heading(item: Dict, content: str) -> None:
+            add_heading(content, item.get("level", 1))
+
+        def _equation(item: Dict, content: str) -> None:
+            add_equation(content)
+
+        def _chart(item: Dict, content: str) -> None:
+            add_chart(
+                item.get("chart_type", "bar"), item.get("data", {}), content or "Chart"
+            )
+
+        def _table(item: Dict, content: str) -> None:
+            data = item.get("data", [])
+            if data:
+                add_table(len(data), max(map(len, data)), data)
+
+        def _image(item: Dict, content: str) -> None:
+            try:
+                if isinstance(content, (bytes, bytearray, memoryview)):
+                    image_data = bytes(content)
+                else:
+                    image_data = _B64_DECODE(content)
+                width = item.get("width_mm", 100)
+                height = item.get("height_mm", 60)
+                insert_image(image_data, "image.png", width, height)
+            except Exception as e:
+                add_text(f"[Image insertion failed: {str(e)}]")
+
+        handlers = {
+            "text": _text,
+            "heading": _heading,
+            "equation": _equation,
+            "chart": _chart,
+            "table": _table,
+            "image": _image,
+        }
+        for item in items:
+            ctype = item.get("type", "text")
+            content = item.get("content", "")
+            handler = handlers.get(ctype)
+            if handler is None:
+                add_text(f"[{ctype}: {content}]")
+            else:
+                handler(item, content)
+
     def build(self, output_path: str) -> bool:
         try:
-            self._document.save(output_path)
+            # Serialize in memory first so a failed save never touches output_path
+            buffer = BytesIO()
+            save = getattr(self._document, "save_to_stream", None) or self._document.save
+            save(buffer)
+            stream = open(output_path, "wb")
+            try:
+                with stream:
+                    stream.write(buffer.getbuffer())
+            except BaseException:
+                os.remove(output_path)
+                raise
+            # The archive ends at the current offset; callers need no stat()
+            self.bytes_written = buffer.tell()
             logger.info(f"HWPX document created: {output_path}")
             return True
         except Exception as e:
@@ -654,6 +793,14 @@ def create_hwpx_from_text(text: str, output_path: str) -> bool:
     return builder.build(output_path)
 
 
+def write_hwpx_from_text(text: str, output_path: str) -> int:
+    """Like create_hwpx_from_text, but return the number of bytes written."""
+    builder = HwpxBuilder()
+    builder.add_text(text)
+    builder.build(output_path)
+    return builder.bytes_written
+
+
 def create_hwpx_document(
     paragraphs: List[str], output_path: str, title: Optional[str] = None
 ) -> str:
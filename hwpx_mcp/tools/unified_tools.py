@@ -165,13 +165,10 @@ def register_unified_tools(mcp) -> None:
         try:
             controller = _ensure_document()
             success = controller.insert_text(text)
-            preview = text[:50] + "..." if len(text) > 50 else text
-            return {
-                "success": success,
-                "message": f"Inserted: {preview}"
-                if success
-                else "Failed to insert text",
-            }
+            if not success:
+                return {"success": success, "message": "Failed to insert text"}
+            preview = text if len(text) <= 50 else f"{text[:50]}..."
+            return {"success": success, "message": f"Inserted: {preview}"}
         except Exception as e:
             return {"success": False, "message": str(e)}
 
@@ -8,7 +8,7 @@ Only available on Windows platform with HWP installed.
 import sys
 import os
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 from hwpx_mcp.runtime_paths import get_security_module_path
@@ -36,6 +36,23 @@ class HwpDocumentInfo:
     title: Optional[str] = None
 
 
+def _is_multiline_text(op_data: Any) -> bool:
+    if not isinstance(op_data, dict) or set(op_data) != {"text"}:
+        return False
+    text = op_data["text"]
+    return isinstance(text, str) and ("\n" in text or "\\n" in text)
+
+
+def _joins_text(left: Any, right: Any) -> bool:
+    """Whether two insert_text payloads can be inserted as one string."""
+    return (
+        _is_multiline_text(left)
+        and _is_multiline_text(right)
+        # A trailing backslash would turn into an escaped newline once joined
+        and not left["text"].endswith("\\")
+    )
+
+
 class WindowsHwpController:
     """HWP Controller using pywin32 COM automation (Windows only)"""
 
@@ -615,10 +632,8 @@ class WindowsHwpController:
             return {"success": False, "results": [], "error": "No document open"}
 
         try:
-            for operation in operations:
-                op_type = operation.get("type")
-                op_data = operation.get("data", {})
-
+            # Each group runs as one call; results are still reported per operation
+            for op_type, op_data, members in self._coalesce_operations(operations):
                 try:
                     if op_type == "insert_text":
                         result = self.insert_text(op_data.get("text", ""))
@@ -636,24 +651,25 @@ class WindowsHwpController:
                             "error": f"Unknown operation: {op_type}",
                         }
 
-                    results.append(
-                        {
-                            "type": op_type,
-                            "success": result
-                            if isinstance(result, bool)
-                            else result.get("success", False),
-                            "data": op_data,
-                        }
+                    success = (
+                        result
+                        if isinstance(result, bool)
+                        else result.get("success", False)
+                    )
+                    results.extend(
+                        {"type": op_type, "success": success, "data": member}
+                        for member in members
                     )
 
                 except Exception as op_error:
-                    results.append(
+                    results.extend(
                         {
                             "type": op_type,
                             "success": False,
                             "error": str(op_error),
-                            "data": op_data,
+                            "data": member,
                         }
+                        for member in members
                     )
 
             return {
@@ -671,6 +687,40 @@ class WindowsHwpController:
                 "total_operations": len(operations),
             }
 
+    @staticmethod
+    def _coalesce_operations(
+        operations: List[Dict[str, Any]],
+    ) -> List[Tuple[Any, Dict[str, Any], List[Any]]]:
+        """Group batch operations that can run as a single COM call.
+
+        Adjacent multi-line insert_text operations are concatenated: they take
+        the paragraph-splitting path of insert_text, which never moves the
+        cursor afterwards, so one call inserts exactly what the sequence would.
+        Repeats of an identical set_font_style are dropped.
+
+        Returns:
+            List of (type, data, member data) groups in execution order
+        """
+        groups: List[Tuple[Any, Dict[str, Any], List[Any]]] = []
+        for operation in operations:
+            op_type = operation.get("type")
+            op_data = operation.get("data", {})
+            if groups and groups[-1][0] == op_type:
+                last_type, last_data, members = groups[-1]
+                if op_type == "insert_text" and _joins_text(last_data, op_data):
+                    merged = {"text": last_data["text"] + op_data["text"]}
+                    groups[-1] = (last_type, merged, members + [op_data])
+                    continue
+                if (
+                    op_type == "set_font_style"
+                    and op_data == last_data
+                    and not op_data.get("select_previous_text")
+                ):
+                    members.append(op_data)
+                    continue
+            groups.append((op_type, op_data, [op_data]))
+        return groups
+
     def insert_image(
         self, image_path: str, width: int = 0, height: int = 0, embedded: bool = True
     ) -> bool: